@@ -14,6 +14,7 @@ if str(PROJECT_ROOT) not in sys.path:
 import streamlit as st
 from app.ui.theme.styles import get_glassmorphism_css
 from app.ui.components.emoji_helper import get_emoji
+from app.services.storage_util import unit_of_work  # noqa: E402
 import app.pages as pages
 
 # 페이지 설정 (중앙 정렬 레이아웃 적용)
@@ -100,15 +101,17 @@ with nav_cols[2]:
 st.markdown("<br>", unsafe_allow_html=True)
 
 # 현재 선택된 페이지만 렌더링
-if st.session_state["active_tab"] == "뉴스 수집":
-    pages.render_home_page()
-elif st.session_state["active_tab"] == "캘린더":
-    pages.render_calendar_page()
-elif st.session_state["active_tab"] == "저장된 뉴스기사":
-    pages.render_favorites_page()
-elif st.session_state["active_tab"] == "로그인":
-    from app.pages.login_page import render_login_page
-    render_login_page()
-    # 로그인 성공 시 active_tab을 뉴스 수집으로 돌리도록 로그인 페이지 내부 로직 확인 필요
-else:
-    st.info("페이지를 선택해주세요.")
+# (한 번의 rerun에서 일어난 저장은 모아 두었다가 끝날 때 문서마다 한 번씩 반영)
+with unit_of_work():
+    if st.session_state["active_tab"] == "뉴스 수집":
+        pages.render_home_page()
+    elif st.session_state["active_tab"] == "캘린더":
+        pages.render_calendar_page()
+    elif st.session_state["active_tab"] == "저장된 뉴스기사":
+        pages.render_favorites_page()
+    elif st.session_state["active_tab"] == "로그인":
+        from app.pages.login_page import render_login_page
+        render_login_page()
+        # 로그인 성공 시 active_tab을 뉴스 수집으로 돌리도록 로그인 페이지 내부 로직 확인 필요
+    else:
+        st.info("페이지를 선택해주세요.")
@@ -62,7 +62,9 @@ def render():
     news_service = NewsService()
 
     # 뉴스와 이슈가 있는 날짜 조회
-    news_dates = news_service.get_dates_with_news()
+    news_dates = news_service.get_dates_with_news(
+        f"{st.session_state['calendar_year']}-{st.session_state['calendar_month']:02d}"
+    )
     issue_dates = calendar_service.get_dates_with_issues()
 
     # 캘린더 렌더링
@@ -11,7 +11,7 @@ from app.services.news_service import get_favorites, toggle_favorite
 from app.services.diary_service import DiaryService
 from app.services.storage_util import (
     load_diary_entries_dict,
-    save_diary_entries_dict,
+    save_diary_entry,
     get_current_datetime,
 )
 
@@ -148,12 +148,11 @@ def _render_diary_modal():
         if st.button(f"{get_emoji('save')} 저장", use_container_width=True):
             if diary_content.strip():
                 # 저장
-                diary_entries[article_id] = {
+                save_diary_entry(article_id, {
                     "content": diary_content,
                     "created_at": existing_entry.get("created_at", get_current_datetime()),
                     "updated_at": get_current_datetime(),
-                }
-                save_diary_entries_dict(diary_entries)
+                })
                 st.toast("다이어리가 저장되었습니다!")
                 st.session_state["modal_article_id"] = None
                 st.rerun()
@@ -11,7 +11,11 @@ import streamlit as st
 
 from app.ui.components.emoji_helper import get_emoji
 from app.ui.theme.styles import get_glassmorphism_css
-from app.services.news_service import NewsService, delete_selected_articles, toggle_favorite
+from app.services.news_service import (
+    NewsService,
+    delete_selected_articles,
+    toggle_favorite,
+)
 
 
 # 카테고리 상수
@@ -24,6 +28,12 @@ CATEGORIES: List[str] = [
     "세계",
 ]
 
+# 한 페이지에 표시할 기사 수
+ITEMS_PER_PAGE = 10
+
+# 현재 페이지 양옆으로 표시할 페이지 번호 수
+PAGE_WINDOW_RADIUS = 2
+
 
 def get_category_options() -> List[str]:
     """카테고리 선택 옵션을 반환한다."""
@@ -73,6 +83,38 @@ def group_by_category(articles: List[Dict[str, Any]]) -> Dict[str, List[Dict[str
     return grouped
 
 
+def get_page_window(
+    current: int, total_pages: int, radius: int = PAGE_WINDOW_RADIUS
+) -> list[int | None]:
+    """페이지 이동 버튼에 표시할 페이지 번호를 반환한다.
+
+    첫/마지막 페이지와 현재 페이지 양옆 radius개만 표시하고,
+    건너뛴 구간은 None으로 표시한다 (예: [1, None, 4, 5, 6, 7, 8, None, 20]).
+    """
+
+    pages = sorted(
+        {1, total_pages}
+        | set(range(max(current - radius, 1), min(current + radius, total_pages) + 1))
+    )
+    window: list[int | None] = []
+    for page in pages:
+        if window and page - window[-1] > 1:
+            window.append(None)
+        window.append(page)
+    return window
+
+
+def get_checked_article_ids() -> list[str]:
+    """체크박스로 선택된 기사 ID를 반환한다 (전체 기사를 읽지 않고 세션 상태에서 찾는다)."""
+
+    prefix = "select_"
+    return [
+        str(key)[len(prefix):]
+        for key in list(st.session_state.keys())
+        if str(key).startswith(prefix) and st.session_state[key]
+    ]
+
+
 def get_empty_state_message() -> str:
     """뉴스가 없을 때 표시할 메시지를 반환한다."""
 
@@ -132,6 +174,12 @@ def render_home() -> None:
                 key="home_category_selector",
             )
 
+            deep_collect = st.checkbox(
+                "이전 기사까지 깊게 수집",
+                key="home_deep_collect",
+                help="'더보기'를 따라가며 이미 수집한 기사에 닿을 때까지 수집합니다.",
+            )
+
             # 카테고리 변경 시 페이지 초기화
             if (
                 "prev_category" not in st.session_state
@@ -161,23 +209,64 @@ def render_home() -> None:
             CATEGORIES if selected_category == "전체" else [selected_category]
         )
         with st.spinner(get_loading_message()):
+            progress = st.empty()
+            received = {"articles": 0}
+
+            def on_collect_event(event: dict[str, Any]) -> None:
+                if event["type"] == "article":
+                    received["articles"] += 1
+                    progress.caption(
+                        f"{event['category']} · {received['articles']}개 기사 수신"
+                    )
+
             try:
-                collected = service.collect_news(categories_to_collect)
+                collected = service.collect_news(
+                    categories_to_collect,
+                    on_event=on_collect_event,
+                    deep=deep_collect,
+                )
                 total = sum(len(v) for v in collected.values())
                 st.toast(get_success_message(total))
                 st.rerun()
             except Exception as e:  # pragma: no cover
                 st.error(get_error_message(str(e)))
 
-    # 기사 로드 및 필터링
-    all_articles = service.load_articles()
-    if selected_category != "전체":
-        articles = [a for a in all_articles if a.get("category") == selected_category]
-    else:
-        articles = all_articles
+    # 제목/요약 검색
+    search_query = st.text_input(
+        "기사 검색",
+        key="home_search_query",
+        placeholder="제목이나 요약의 검색어 (예: 반도체 수출)",
+    ).strip()
+    if st.session_state.get("prev_search_query") != search_query:
+        st.session_state["pagination_page"] = 1
+        st.session_state["prev_search_query"] = search_query
+
+    # 현재 페이지의 기사만 조회 (검색어가 있으면 관련도 순 검색 결과)
+    category_filter = None if selected_category == "전체" else selected_category
+    search_results = (
+        service.search(search_query, category_filter) if search_query else None
+    )
+
+    def fetch_page(offset: int, limit: int) -> dict[str, Any]:
+        """현재 조건(카테고리, 검색어)의 기사 한 페이지를 조회한다."""
+        if search_results is not None:
+            return {
+                "articles": search_results[offset:offset + limit],
+                "total": len(search_results),
+            }
+        return service.query(category_filter, offset=offset, limit=limit)
+
+    if "pagination_page" not in st.session_state or not isinstance(
+        st.session_state["pagination_page"], int
+    ):
+        st.session_state["pagination_page"] = 1
+    page = fetch_page(
+        (max(st.session_state["pagination_page"], 1) - 1) * ITEMS_PER_PAGE, ITEMS_PER_PAGE
+    )
+    total = page["total"]
 
-    if not articles:
-        st.info(get_empty_state_message())
+    if not total:
+        st.info("검색 결과가 없습니다." if search_query else get_empty_state_message())
         return
 
     # 대량 삭제 컨트롤
@@ -186,8 +275,13 @@ def render_home() -> None:
 
     with col_sel1:
         if st.button("전체선택", use_container_width=True, type="secondary"):
-            for a in articles:
-                st.session_state[f"select_{a['id']}"] = True
+            # 기사를 만들지 않고 ID만 읽는다
+            if search_results is not None:
+                all_ids = [a["id"] for a in search_results]
+            else:
+                all_ids = service.list_ids(category_filter)
+            for article_id in all_ids:
+                st.session_state[f"select_{article_id}"] = True
             st.rerun()
 
     with col_sel2:
@@ -202,8 +296,11 @@ def render_home() -> None:
                 st.session_state["active_tab"] = "로그인"
                 st.rerun()
                 
+            # 체크된 기사 중 현재 카테고리 목록에 있는 기사만
             selected_ids = [
-                a["id"] for a in articles if st.session_state.get(f"select_{a['id']}")
+                article_id
+                for article_id in get_checked_article_ids()
+                if service.is_listed(article_id, category_filter)
             ]
             if selected_ids:
                 st.session_state["confirm_delete_selected"] = selected_ids
@@ -216,7 +313,7 @@ def render_home() -> None:
         col_c1, col_c2 = st.columns(2)
         with col_c1:
             if st.button("✅ 확인", key="confirm_bulk_yes"):
-                result = delete_selected_articles(ids_to_del)
+                result = delete_selected_articles(ids_to_del, service)
                 st.toast(f"✅ {result['deleted_count']}개의 기사가 삭제되었습니다.")
                 for aid in ids_to_del:
                     st.session_state.pop(f"select_{aid}", None)
@@ -228,27 +325,22 @@ def render_home() -> None:
                 st.rerun()
 
     # 페이지네이션 설정
-    items_per_page = 10
-    total_pages = (len(articles) - 1) // items_per_page + 1
-
-    if "pagination_page" not in st.session_state or not isinstance(
-        st.session_state["pagination_page"], int
-    ):
-        st.session_state["pagination_page"] = 1
+    total_pages = (total - 1) // ITEMS_PER_PAGE + 1
 
-    # 범위 보정
+    # 범위 보정 (삭제 등으로 페이지가 줄었으면 마지막 페이지를 다시 조회)
     if st.session_state["pagination_page"] < 1:
         st.session_state["pagination_page"] = 1
     if st.session_state["pagination_page"] > total_pages:
         st.session_state["pagination_page"] = total_pages
+        page = fetch_page((total_pages - 1) * ITEMS_PER_PAGE, ITEMS_PER_PAGE)
 
-    start_idx = (st.session_state["pagination_page"] - 1) * items_per_page
-    end_idx = start_idx + items_per_page
-    current_articles = articles[start_idx:end_idx]
+    start_idx = (st.session_state["pagination_page"] - 1) * ITEMS_PER_PAGE
+    current_articles = page["articles"]
+    end_idx = start_idx + len(current_articles)
 
     # 목록 요약
     st.markdown(
-        f"**총 {len(articles)}개 기사 중 {start_idx + 1}-{min(end_idx, len(articles))}개 표시**"
+        f"**총 {total}개 기사 중 {start_idx + 1}-{end_idx}개 표시**"
     )
 
     # 기사 리스트 (체크박스 → 제목 → 즐겨찾기)
@@ -301,7 +393,7 @@ def render_home() -> None:
                     st.session_state["active_tab"] = "로그인"
                     st.rerun()
                 
-                toggle_favorite(article_id)
+                toggle_favorite(article_id, service)
                 st.rerun()
 
         # 기사 간 구분선
@@ -311,13 +403,17 @@ def render_home() -> None:
                 unsafe_allow_html=True,
             )
 
-    # 페이지네이션 버튼 (숫자만 표시, << >> 버튼 제거)
+    # 페이지네이션 버튼 (숫자만 표시, << >> 버튼 제거, 현재 페이지 주변만 표시)
     if total_pages > 1:
         st.write("---")
 
-        page_cols = st.columns(total_pages)
-        for i in range(1, total_pages + 1):
-            with page_cols[i - 1]:
+        window = get_page_window(st.session_state["pagination_page"], total_pages)
+        page_cols = st.columns(len(window))
+        for col, i in zip(page_cols, window, strict=True):
+            with col:
+                if i is None:
+                    st.markdown("…")
+                    continue
                 btn_type = (
                     "primary" if st.session_state["pagination_page"] == i else "secondary"
                 )
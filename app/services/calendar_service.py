@@ -1,15 +1,18 @@
 """캘린더 이슈 서비스 모듈.
 
 날짜별 이슈의 CRUD 기능을 담당한다.
+저장은 이슈 하나에 대한 연산 단위로 하므로, 같은 사용자가 여러 탭에서
+동시에 고쳐도 다른 탭의 변경을 덮어쓰지 않는다.
 """
 
+from collections.abc import Callable
 from typing import Any
 
 from app.services.storage_util import (
-    load_calendar_issues,
-    save_calendar_issues,
     generate_id,
     get_current_datetime,
+    load_calendar_issues,
+    update_calendar_issues,
 )
 
 
@@ -26,11 +29,22 @@ class CalendarService:
             self._issues = load_calendar_issues()
         return self._issues
 
-    def _save_issues(self) -> bool:
-        """이슈 목록을 저장한다."""
-        if self._issues is not None:
-            return save_calendar_issues(self._issues)
-        return False
+    def _commit(self, operation: Callable[[list[dict[str, Any]]], Any]) -> Any:
+        """최신 이슈 목록에 연산을 적용해 저장하고 연산 결과를 반환한다.
+
+        다른 세션이 그 사이 저장했으면 그 목록에 연산을 다시 적용한다.
+        """
+        result = None
+
+        def apply(issues: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            nonlocal result
+            result = operation(issues)
+            return issues
+
+        issues = update_calendar_issues(apply)
+        if issues is not None:
+            self._issues = issues
+        return result
 
     def create_issue(
         self,
@@ -48,8 +62,6 @@ class CalendarService:
         Returns:
             생성된 이슈 데이터
         """
-        issues = self._load_issues()
-        
         new_issue = {
             "id": generate_id("issue"),
             "date": date,
@@ -59,9 +71,7 @@ class CalendarService:
             "updated_at": get_current_datetime(),
         }
         
-        issues.append(new_issue)
-        self._issues = issues
-        self._save_issues()
+        self._commit(lambda issues: issues.append(new_issue))
         
         return new_issue
 
@@ -108,21 +118,21 @@ class CalendarService:
         Returns:
             수정된 이슈 데이터 또는 None
         """
-        issues = self._load_issues()
-        
-        for issue in issues:
-            if issue.get("id") == issue_id:
-                if title is not None:
-                    issue["title"] = title
-                if content is not None:
-                    issue["content"] = content
-                issue["updated_at"] = get_current_datetime()
-                
-                self._issues = issues
-                self._save_issues()
-                return issue
-        
-        return None
+        if self.get_issue_by_id(issue_id) is None:
+            return None
+
+        def update(issues: list[dict[str, Any]]) -> dict[str, Any] | None:
+            for issue in issues:
+                if issue.get("id") == issue_id:
+                    if title is not None:
+                        issue["title"] = title
+                    if content is not None:
+                        issue["content"] = content
+                    issue["updated_at"] = get_current_datetime()
+                    return issue
+            return None
+
+        return self._commit(update)
 
     def delete_issue(self, issue_id: str) -> bool:
         """이슈를 삭제한다.
@@ -133,18 +143,15 @@ class CalendarService:
         Returns:
             삭제 성공 여부
         """
-        issues = self._load_issues()
-        original_len = len(issues)
-        
-        self._issues = [
-            issue for issue in issues if issue.get("id") != issue_id
-        ]
+        if self.get_issue_by_id(issue_id) is None:
+            return False
         
-        if len(self._issues) < original_len:
-            self._save_issues()
-            return True
+        def delete(issues: list[dict[str, Any]]) -> bool:
+            original_len = len(issues)
+            issues[:] = [issue for issue in issues if issue.get("id") != issue_id]
+            return len(issues) < original_len
         
-        return False
+        return bool(self._commit(delete))
 
     def get_dates_with_issues(self) -> list[str]:
         """이슈가 있는 날짜 목록을 반환한다.
@@ -2,15 +2,17 @@
 
 기사별 다이어리 엔트리의 CRUD 기능을 담당한다.
 명세: 기사당 다이어리 엔트리는 1개만 허용.
+저장은 엔트리 하나에 대한 연산 단위로 하므로 여러 탭의 동시 수정이 서로 덮어쓰지 않는다.
 """
 
+from collections.abc import Callable
 from typing import Any
 
 from app.services.storage_util import (
-    load_diary_entries,
-    save_diary_entries,
     generate_id,
     get_current_datetime,
+    load_diary_entries,
+    update_diary_entries,
 )
 
 
@@ -27,11 +29,22 @@ class DiaryService:
             self._entries = load_diary_entries()
         return self._entries
 
-    def _save_entries(self) -> bool:
-        """엔트리 목록을 저장한다."""
-        if self._entries is not None:
-            return save_diary_entries(self._entries)
-        return False
+    def _commit(self, operation: Callable[[list[dict[str, Any]]], Any]) -> Any:
+        """최신 엔트리 목록에 연산을 적용해 저장하고 연산 결과를 반환한다.
+
+        다른 세션이 그 사이 저장했으면 그 목록에 연산을 다시 적용한다.
+        """
+        result = None
+
+        def apply(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            nonlocal result
+            result = operation(entries)
+            return entries
+
+        entries = update_diary_entries(apply)
+        if entries is not None:
+            self._entries = entries
+        return result
 
     def create_entry(
         self,
@@ -51,8 +64,6 @@ class DiaryService:
         Returns:
             생성/업데이트된 엔트리 데이터
         """
-        entries = self._load_entries()
-        
         # 기존 엔트리 확인 (기사당 1개 제약)
         existing = self.get_entry_by_article_id(article_id)
         if existing:
@@ -73,11 +84,18 @@ class DiaryService:
             "updated_at": get_current_datetime(),
         }
         
-        entries.append(new_entry)
-        self._entries = entries
-        self._save_entries()
+        def create(entries: list[dict[str, Any]]) -> dict[str, Any]:
+            # 다른 세션이 먼저 같은 기사의 엔트리를 만들었으면 그 엔트리를 수정한다
+            for entry in entries:
+                if entry.get("article_id") == article_id:
+                    entry["summary"] = summary
+                    entry["opinion"] = opinion
+                    entry["updated_at"] = new_entry["updated_at"]
+                    return entry
+            entries.append(new_entry)
+            return new_entry
         
-        return new_entry
+        return self._commit(create)
 
     def get_entry_by_article_id(self, article_id: str) -> dict[str, Any] | None:
         """기사 ID로 다이어리 엔트리를 조회한다.
@@ -139,21 +157,21 @@ class DiaryService:
         Returns:
             수정된 엔트리 데이터 또는 None
         """
-        entries = self._load_entries()
-        
-        for entry in entries:
-            if entry.get("id") == entry_id:
-                if summary is not None:
-                    entry["summary"] = summary
-                if opinion is not None:
-                    entry["opinion"] = opinion
-                entry["updated_at"] = get_current_datetime()
-                
-                self._entries = entries
-                self._save_entries()
-                return entry
-        
-        return None
+        if self.get_entry_by_id(entry_id) is None:
+            return None
+
+        def update(entries: list[dict[str, Any]]) -> dict[str, Any] | None:
+            for entry in entries:
+                if entry.get("id") == entry_id:
+                    if summary is not None:
+                        entry["summary"] = summary
+                    if opinion is not None:
+                        entry["opinion"] = opinion
+                    entry["updated_at"] = get_current_datetime()
+                    return entry
+            return None
+
+        return self._commit(update)
 
     def delete_entry(self, entry_id: str) -> bool:
         """다이어리 엔트리를 삭제한다.
@@ -164,18 +182,15 @@ class DiaryService:
         Returns:
             삭제 성공 여부
         """
-        entries = self._load_entries()
-        original_len = len(entries)
-        
-        self._entries = [
-            entry for entry in entries if entry.get("id") != entry_id
-        ]
+        if self.get_entry_by_id(entry_id) is None:
+            return False
         
-        if len(self._entries) < original_len:
-            self._save_entries()
-            return True
+        def delete(entries: list[dict[str, Any]]) -> bool:
+            original_len = len(entries)
+            entries[:] = [entry for entry in entries if entry.get("id") != entry_id]
+            return len(entries) < original_len
         
-        return False
+        return bool(self._commit(delete))
 
     def get_all_entries(self) -> list[dict[str, Any]]:
         """모든 엔트리를 조회한다.
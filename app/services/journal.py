@@ -0,0 +1,176 @@
+"""변경 기록(journal) 모듈.
+
+문서를 통째로 다시 쓰는 대신 변경 연산을 JSONL 파일 끝에 한 줄씩 추가한다.
+읽을 때는 마지막 스냅샷에 기록을 순서대로 적용하고, 기록이 커지면
+스냅샷 하나로 접는다(compaction).
+
+연산은 두 종류다.
+
+- 항목 연산 {"op": "add" | "update" | "delete", "key": 키, "value": 값}:
+  딕셔너리 문서(공용 기사, 다이어리)의 항목 하나를 넣거나 바꾸거나 지운다.
+- 기사 연산 {"op": "favorite" | "delete", "id": 기사 ID, "value": bool}:
+  사용자 오버레이의 즐겨찾기를 바꾸거나 기사를 숨긴다.
+
+모든 연산은 값을 덮어쓰는 방식이라 같은 기록을 두 번 적용해도 결과가 같다.
+그래서 스냅샷을 저장한 뒤 기록을 지우기 전에 중단되어도 안전하다.
+"""
+
+import json
+import os
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+# 연산 종류
+ADD = "add"
+UPDATE = "update"
+DELETE = "delete"
+FAVORITE = "favorite"
+
+
+def entry_op(kind: str, key: str, value: Any = None) -> dict[str, Any]:
+    """딕셔너리 문서의 항목 연산을 만든다.
+
+    Args:
+        kind: ADD, UPDATE, DELETE 중 하나
+        key: 항목 키 (기사 ID 등)
+        value: 새 값 (DELETE면 생략)
+    """
+    op = {"op": kind, "key": key}
+    if kind != DELETE:
+        op["value"] = value
+    return op
+
+
+def article_op(kind: str, article_id: str, value: bool = True) -> dict[str, Any]:
+    """사용자 오버레이의 기사 연산을 만든다.
+
+    Args:
+        kind: FAVORITE(즐겨찾기 설정) 또는 DELETE(기사 숨김)
+        article_id: 기사 ID
+        value: 즐겨찾기 여부 (FAVORITE일 때)
+    """
+    return {"op": kind, "id": article_id, "value": value}
+
+
+def apply_op(document: Any, op: dict[str, Any]) -> Any:
+    """연산 하나를 문서에 적용하고 문서를 반환한다 (문서를 직접 수정)."""
+    return apply_ops(document, [op])
+
+
+def _apply_entry_op(document: Any, op: dict[str, Any]) -> Any:
+    """딕셔너리 문서에 항목 연산 하나를 적용한다."""
+    if not isinstance(document, dict):
+        document = {}
+    kind = op.get("op")
+    if kind in (ADD, UPDATE):
+        document[op["key"]] = op.get("value")
+    elif kind == DELETE:
+        document.pop(op["key"], None)
+    return document
+
+
+def apply_ops(
+    document: Any,
+    ops: Iterable[dict[str, Any]],
+    default: Callable[[], Any] = dict,
+) -> Any:
+    """연산들을 순서대로 적용한 문서를 반환한다.
+
+    기사 연산은 즐겨찾기/삭제 기록을 순서 있는 집합(dict)으로 한 번 바꿔 적용하고
+    마지막에 리스트로 되돌리므로, 기록이 길어도 연산마다 리스트를 복사하지 않는다.
+
+    Args:
+        document: 수정 가능한 스냅샷 (없으면 None)
+        ops: 적용할 연산
+        default: 스냅샷이 없을 때 만들 빈 문서
+
+    Returns:
+        연산을 적용한 문서
+    """
+    favorites: dict[str, None] | None = None
+    deleted: dict[str, None] | None = None
+    for op in ops:
+        if document is None:
+            document = default()
+        if "id" not in op:
+            document = _apply_entry_op(document, op)
+            continue
+
+        if favorites is None or deleted is None:
+            favorites = dict.fromkeys(document.get("favorites", ()))
+            deleted = dict.fromkeys(document.get("deleted", ()))
+        article_id = op["id"]
+        # 즐겨찾기를 다시 켜면 목록 끝으로 옮긴다 (리스트 방식과 같은 순서)
+        favorites.pop(article_id, None)
+        if op.get("op") == FAVORITE and op.get("value"):
+            favorites[article_id] = None
+        elif op.get("op") == DELETE:
+            deleted.setdefault(article_id)
+
+    if favorites is not None and deleted is not None:
+        document["favorites"] = list(favorites)
+        document["deleted"] = list(deleted)
+    return document
+
+
+def read_ops(path: Path) -> list[dict[str, Any]]:
+    """기록 파일의 연산을 읽는다.
+
+    쓰는 도중 중단되어 잘린 줄(잘린 UTF-8 문자 포함)은 건너뛴다.
+
+    Returns:
+        연산 리스트 (파일이 없으면 빈 리스트)
+    """
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return parse_ops(f)
+    except FileNotFoundError:
+        return []
+
+
+def parse_ops(lines: Iterable[str] | str) -> list[dict[str, Any]]:
+    """JSONL 줄들(또는 여러 줄 문자열)에서 연산을 읽는다 (깨진 줄은 건너뛴다)."""
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+    ops = []
+    for line in lines:
+        try:
+            op = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(op, dict) and "op" in op:
+            ops.append(op)
+    return ops
+
+
+def append_ops(path: Path, ops: Iterable[dict[str, Any]], default: Callable[[Any], Any]) -> bool:
+    """연산들을 기록 파일 끝에 한 번의 쓰기로 추가하고 디스크에 반영(fsync)한다.
+
+    Args:
+        path: 기록 파일 경로
+        ops: 추가할 연산
+        default: json.dump가 직렬화하지 못하는 값을 바꾸는 함수
+
+    Returns:
+        저장 성공 여부
+    """
+    data = "".join(
+        json.dumps(op, ensure_ascii=False, default=default) + "\n" for op in ops
+    ).encode("utf-8")
+    if not data:
+        return True
+    try:
+        with open(path, "a+b") as f:
+            # 이전 추가가 중단되어 줄이 잘렸으면 새 연산을 그 줄에 붙이지 않는다
+            # (잘린 줄은 읽을 때 건너뛴다)
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        return True
+    except OSError:
+        return False
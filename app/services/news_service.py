@@ -3,18 +3,221 @@
 뉴스 데이터의 수집, 저장, 조회, 중복 제거를 담당한다.
 """
 
+import json
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable, Hashable, Iterable
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
+from app.services.read_cache import get_read_cache
+from app.services.search_index import SEARCH_LIMIT, search_articles
 from app.services.storage_util import (
-    load_news_articles,
-    save_news_articles,
+    add_seen_urls,
+    add_shared_articles,
+    delete_diary_entries,
     generate_id,
+    get_article_by_id,
     get_current_datetime,
-    load_diary_entries_dict,
+    get_current_user,
+    get_shared_articles_stamp,
+    get_storage_backend,
+    hide_news_articles,
+    load_news_articles,
+    load_news_overlay_sets,
+    load_seen_urls,
+    load_visible_articles,
+    merge_article_record,
+    query_news_articles,
     save_diary_entries_dict,
+    save_news_articles,
+    set_article_favorite,
 )
 
+# 기사 목록 정렬 방식 (stored: 저장 순서, newest: 수집 최신순, oldest: 수집 오래된 순)
+SORT_ORDERS = ("stored", "newest", "oldest")
+
+
+def article_in_category(article: dict[str, Any], category: str) -> bool:
+    """기사가 해당 카테고리에 실렸는지 확인한다 (여러 카테고리 기사 포함)."""
+    return article.get("category") == category or category in article.get("categories", ())
+
+
+def article_day(article: dict[str, Any]) -> str:
+    """기사의 수집 날짜(YYYY-MM-DD)를 반환한다 (수집 시각이 없으면 빈 문자열)."""
+    return article.get("collected_at", "").split("T")[0]
+
+
+def _categories(article: dict[str, Any]) -> set[str]:
+    """기사가 실린 카테고리 집합."""
+    return {c for c in (article.get("category"), *article.get("categories", ())) if c}
+
+
+class ArticleIndex:
+    """로드한 기사의 ID/수집 날짜/카테고리 색인.
+
+    전체 기사와 카테고리마다 (수집 시각, 기사 ID) 정렬 키 리스트를 둔다.
+    키는 기사에서 바로 나오므로 색인을 다시 만들어도 같고, 커서로 돌려준 키는
+    그 사이 기사가 추가/삭제되어도 같은 자리를 가리킨다. 저장 순서(월별 파일에
+    수집한 순서)와 수집 날짜 순서는 모두 이 키 순서로 센다.
+
+    날짜/월/기간 조회와 페이지 조회는 이분 탐색과 결과 수만큼의 슬라이스(O(log n + k))로
+    끝나며, 여러 카테고리에 실린 기사는 각 카테고리에 모두 들어간다.
+    기사 추가/교체/삭제 때 해당 기사의 키만 고친다.
+    """
+
+    def __init__(self, articles: Iterable[dict[str, Any]] = ()) -> None:
+        """기사들로 색인을 만든다."""
+        # 기사 ID → 기사 (로드 순서 유지)
+        self.by_id: dict[str, dict[str, Any]] = {}
+        # 카테고리(None이면 전체) → 정렬된 (수집 시각, 기사 ID) 리스트
+        self._keys: dict[str | None, list[tuple[str, str]]] = {}
+        # 날짜별 기사 수와 기사가 있는 날짜 (정렬)
+        self._day_counts: dict[str, int] = {}
+        self._days: list[str] = []
+        for article in articles:
+            if article.get("id") and article["id"] not in self.by_id:
+                self._insert(article, sort=False)
+        for keys in self._keys.values():
+            keys.sort()
+        self._days = sorted(day for day in self._day_counts if day)
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def copy(self) -> "ArticleIndex":
+        """색인을 복사한다 (기사 자체는 공유)."""
+        other = ArticleIndex()
+        other.by_id = dict(self.by_id)
+        other._keys = {key: list(keys) for key, keys in self._keys.items()}
+        other._day_counts = dict(self._day_counts)
+        other._days = list(self._days)
+        return other
+
+    @staticmethod
+    def _key(article: dict[str, Any]) -> tuple[str, str]:
+        return article.get("collected_at", ""), article["id"]
+
+    def _insert(self, article: dict[str, Any], sort: bool = True) -> None:
+        key = self._key(article)
+        day = article_day(article)
+        self.by_id[article["id"]] = article
+        for category in (None, *_categories(article)):
+            keys = self._keys.setdefault(category, [])
+            if sort:
+                insort(keys, key)
+            else:
+                keys.append(key)
+        count = self._day_counts.get(day, 0)
+        self._day_counts[day] = count + 1
+        if sort and count == 0 and day:
+            insort(self._days, day)
+
+    def _unindex(self, article_id: str) -> None:
+        """기사의 키를 색인에서 뺀다 (by_id는 그대로 둔다)."""
+        article = self.by_id[article_id]
+        key = self._key(article)
+        day = article_day(article)
+        for category in (None, *_categories(article)):
+            keys = self._keys[category]
+            del keys[bisect_left(keys, key)]
+            if not keys:
+                del self._keys[category]
+        self._day_counts[day] -= 1
+        if not self._day_counts[day]:
+            del self._day_counts[day]
+            if day:
+                del self._days[bisect_left(self._days, day)]
+
+    def add(self, article: dict[str, Any]) -> None:
+        """기사를 추가하거나 같은 ID의 기사를 교체한다."""
+        current = self.by_id.get(article["id"])
+        if current is None:
+            self._insert(article)
+        elif self._key(current) == self._key(article) and _categories(current) == _categories(article):
+            # 수집 시각/카테고리가 같으면 (즐겨찾기 토글 등) 기사만 바꾼다
+            self.by_id[article["id"]] = article
+        else:
+            self._unindex(article["id"])
+            self._insert(article)
+
+    def remove(self, article_id: str) -> bool:
+        """기사를 색인에서 뺀다 (없으면 False)."""
+        if article_id not in self.by_id:
+            return False
+        self._unindex(article_id)
+        del self.by_id[article_id]
+        return True
+
+    def articles(self) -> list[dict[str, Any]]:
+        """색인의 기사를 로드 순서로 반환한다."""
+        return list(self.by_id.values())
+
+    def ids(self, category: str | None = None) -> list[str]:
+        """카테고리(None이면 전체)의 기사 ID를 저장 순서로 반환한다."""
+        return [article_id for _, article_id in self._keys.get(category, ())]
+
+    def count(self, category: str | None = None) -> int:
+        """카테고리(None이면 전체)의 기사 수를 반환한다."""
+        return len(self._keys.get(category, ()))
+
+    def by_category(self, category: str) -> list[dict[str, Any]]:
+        """카테고리에 실린 기사를 저장 순서로 반환한다."""
+        return [self.by_id[article_id] for _, article_id in self._keys.get(category, ())]
+
+    def by_date_range(self, start: str, end: str) -> list[dict[str, Any]]:
+        """수집 날짜가 start 이상 end 미만인 기사를 수집 시각 순으로 반환한다."""
+        keys = self._keys.get(None, [])
+        lo = bisect_left(keys, (start,))
+        hi = bisect_left(keys, (end,), lo)
+        return [self.by_id[article_id] for _, article_id in keys[lo:hi]]
+
+    def by_date_prefix(self, prefix: str) -> list[dict[str, Any]]:
+        """수집 날짜가 prefix(YYYY-MM-DD, YYYY-MM, YYYY 등)로 시작하는 기사를 반환한다."""
+        return self.by_date_range(prefix, prefix + "\uffff")
+
+    def days(self, prefix: str = "") -> list[str]:
+        """기사가 있는 수집 날짜 중 prefix로 시작하는 날짜를 오래된 순으로 반환한다."""
+        lo = bisect_left(self._days, prefix)
+        hi = bisect_left(self._days, prefix + "\uffff", lo)
+        return self._days[lo:hi]
+
+    def page(
+        self,
+        category: str | None = None,
+        sort: str = "stored",
+        after: tuple[str, str] | None = None,
+        offset: int = 0,
+        limit: int = 10,
+    ) -> tuple[list[dict[str, Any]], tuple[str, str] | None]:
+        """정렬 키 기준으로 기사 한 페이지를 반환한다.
+
+        Args:
+            category: 카테고리 (None이면 전체)
+            sort: SORT_ORDERS 중 하나
+            after: 이전 페이지 마지막 기사의 (수집 시각, 기사 ID) (주면 offset은 그 다음부터 센다)
+            offset: 건너뛸 기사 수
+            limit: 페이지 크기
+
+        Returns:
+            (기사 리스트, 다음 페이지가 있으면 이 페이지 마지막 기사의 정렬 키)
+        """
+        keys = self._keys.get(category, [])
+        if sort == "newest":
+            # 내림차순: 뒤에서부터 자른다
+            end = len(keys) if after is None else bisect_left(keys, after)
+            end = max(end - offset, 0)
+            start = max(end - limit, 0)
+            selected = keys[start:end][::-1]
+            more = start > 0
+        else:
+            start = 0 if after is None else bisect_right(keys, after)
+            start += offset
+            selected = keys[start:start + limit]
+            more = start + limit < len(keys)
+        articles = [self.by_id[article_id] for _, article_id in selected]
+        return articles, (tuple(selected[-1]) if more and selected else None)
+
 
 class NewsService:
     """뉴스 데이터 관리 서비스."""
@@ -22,6 +225,95 @@ class NewsService:
     def __init__(self) -> None:
         """뉴스 서비스를 초기화한다."""
         self._articles: list[dict[str, Any]] | None = None
+        # 현재 사용자에게 보이는 공용 기사의 색인 (즐겨찾기는 조회할 때 표시한다)
+        self._index: ArticleIndex | None = None
+        # 색인이 읽기 캐시에 있는 것이면 고치기 전에 복사한다
+        self._index_shared = False
+        # 색인을 만든 공용 기사의 스탬프 (색인을 저장소와 다르게 고쳤으면 None)
+        self._index_base: Hashable | None = None
+        # 현재 사용자의 (즐겨찾기, 삭제, 전체 삭제 시각, 보이는 기사) (오버레이를 바꾸면 다시 읽는다)
+        self._overlay_sets: (
+            tuple[frozenset[str], frozenset[str], str | None, frozenset[str]] | None
+        ) = None
+
+    def _set_articles(self, articles: list[dict[str, Any]] | None) -> None:
+        """기사 목록과 색인을 함께 교체한다."""
+        self._articles = articles
+        self._index = None if articles is None else ArticleIndex(
+            {key: value for key, value in article.items() if key != "is_favorite"}
+            for article in articles
+        )
+        self._index_shared = False
+        self._index_base = None
+        self._overlay_sets = None
+
+    def _writable_index(self) -> ArticleIndex:
+        """고쳐도 되는 색인을 반환한다 (읽기 캐시의 색인이면 복사본으로 바꾼다)."""
+        index = self._article_index()
+        if self._index_shared:
+            self._index = index = index.copy()
+            self._index_shared = False
+        return index
+
+    def _overlay(self) -> tuple[frozenset[str], frozenset[str], str | None, frozenset[str]]:
+        """현재 사용자의 (즐겨찾기 ID, 삭제 ID, 전체 삭제 시각, 보이는 기사 ID)를 반환한다."""
+        if self._overlay_sets is None:
+            self._overlay_sets = load_news_overlay_sets()
+        return self._overlay_sets
+
+    def _view(self, article: dict[str, Any]) -> dict[str, Any]:
+        """색인의 공용 기사에 현재 사용자의 즐겨찾기를 표시한다."""
+        if article["id"] in self._overlay()[0]:
+            return MappingProxyType({**article, "is_favorite": True})
+        return article
+
+    def _index_key(self, base: Hashable | None) -> tuple[Hashable, Hashable | None]:
+        """색인의 읽기 캐시 키와 스탬프 (공용 기사 스탬프, 삭제 ID, 전체 삭제 시각, 보이는 기사 ID)."""
+        user = get_current_user()
+        _, deleted, cleared_at, visible = self._overlay()
+        stamp = None if not user or base is None else (base, deleted, cleared_at, visible)
+        return ("news_index", id(get_storage_backend()), user), stamp
+
+    def _store_index(self) -> None:
+        """고친 색인을 바뀐 오버레이의 스탬프로 읽기 캐시에 넣는다.
+
+        삭제처럼 오버레이만 바뀐 경우에 쓰며, 다음 rerun은 색인을 다시 만들지 않는다.
+        """
+        key, stamp = self._index_key(self._index_base)
+        if stamp is not None:
+            get_read_cache().put(key, stamp, self._index)
+            self._index_shared = True
+
+    def _current_articles(self) -> list[dict[str, Any]] | None:
+        """로드한 기사 목록을 반환한다 (색인만 바뀌었으면 색인 순서로 다시 만든다)."""
+        if self._articles is None and self._index is not None:
+            self._articles = [self._view(article) for article in self._index.articles()]
+        return self._articles
+
+    def _article_index(self) -> ArticleIndex:
+        """기사 색인을 반환한다 (로드하지 않았으면 로드한다).
+
+        색인은 공용 기사와 사용자의 삭제 기록만으로 만들어지므로 즐겨찾기를
+        바꿔도 읽기 캐시에서 재사용하고, 삭제는 고친 색인을 캐시에 다시 넣는다.
+        기사 리스트를 만들지 않고 색인만 쓰는 조회는 기사 수와 무관하다.
+        """
+        if self._index is None:
+            base = get_shared_articles_stamp()
+            _, deleted, cleared_at, visible = self._overlay()
+            key, stamp = self._index_key(base)
+            self._index = get_read_cache().get(
+                key,
+                stamp,
+                lambda: ArticleIndex(
+                    load_visible_articles(deleted, cleared_at, visible)
+                    if get_current_user()
+                    else ()
+                ),
+            )
+            self._articles = None
+            self._index_shared = True
+            self._index_base = base
+        return self._index
 
     def load_articles(self) -> list[dict[str, Any]]:
         """저장된 뉴스 기사를 로드한다.
@@ -29,8 +321,72 @@ class NewsService:
         Returns:
             기사 리스트
         """
-        self._articles = load_news_articles()
-        return self._articles
+        self._index = None
+        self._overlay_sets = None
+        self._article_index()
+        return self._current_articles()
+
+    def query(
+        self,
+        category: str | None = None,
+        sort: str = "stored",
+        cursor: str | None = None,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """기사 한 페이지를 조회한다.
+
+        나머지 기사는 만들지 않으므로 걸리는 시간은 페이지 크기에만 비례한다.
+
+        Args:
+            category: 카테고리 (None이면 전체)
+            sort: 정렬 방식 (SORT_ORDERS: "stored" 저장 순서, "newest" 수집 최신순,
+                "oldest" 수집 오래된 순)
+            cursor: 이전 조회가 돌려준 커서 (그 다음 기사부터 조회)
+            limit: 페이지 크기
+            offset: 건너뛸 기사 수 (커서가 있으면 커서 다음부터 센다, 페이지 번호 이동용)
+
+        Returns:
+            {"articles": 기사 리스트, "cursor": 다음 페이지 커서 (마지막 페이지면 None),
+            "total": 조건에 맞는 전체 기사 수}
+
+        Raises:
+            ValueError: 지원하지 않는 정렬 방식이거나 다른 정렬 방식의 커서
+        """
+        if sort not in SORT_ORDERS:
+            raise ValueError(f"지원하지 않는 정렬 방식입니다: {sort}")
+        after = None
+        if cursor is not None:
+            try:
+                cursor_sort, collected_at, article_id = json.loads(cursor)
+            except (TypeError, ValueError):
+                raise ValueError(f"잘못된 커서입니다: {cursor}") from None
+            if not isinstance(collected_at, str) or not isinstance(article_id, str):
+                raise ValueError(f"잘못된 커서입니다: {cursor}")
+            if cursor_sort != sort:
+                raise ValueError(f"다른 정렬 방식의 커서입니다: {cursor}")
+            after = (collected_at, article_id)
+
+        index = self._article_index()
+        articles, last = index.page(category, sort, after, max(offset, 0), limit)
+        return {
+            "articles": [self._view(article) for article in articles],
+            "cursor": None if last is None else json.dumps([sort, *last], ensure_ascii=False),
+            "total": index.count(category),
+        }
+
+    def list_ids(self, category: str | None = None) -> list[str]:
+        """카테고리(None이면 전체)의 기사 ID를 저장 순서로 반환한다.
+
+        기사 뷰를 만들지 않고 색인의 키만 읽는다 (전체 선택 등).
+
+        Args:
+            category: 카테고리 (None이면 전체)
+
+        Returns:
+            기사 ID 리스트
+        """
+        return self._article_index().ids(category)
 
     def save_articles(self, articles: list[dict[str, Any]]) -> bool:
         """뉴스 기사를 저장한다.
@@ -41,13 +397,16 @@ class NewsService:
         Returns:
             저장 성공 여부
         """
-        self._articles = articles
+        self._set_articles(articles)
         return save_news_articles(articles)
 
     def remove_duplicates(
         self, articles: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
-        """제목+카테고리 기준으로 중복 기사를 제거한다.
+        """기사 ID 기준으로 중복 기사를 제거한다.
+
+        ID는 기사 URL(oid/aid)에서 만들어지므로 여러 카테고리에 실린
+        같은 기사도 하나로 합쳐진다.
         
         Args:
             articles: 기사 리스트
@@ -55,16 +414,7 @@ class NewsService:
         Returns:
             중복 제거된 기사 리스트
         """
-        seen = set()
-        unique_articles = []
-        
-        for article in articles:
-            key = (article["title"], article["category"])
-            if key not in seen:
-                seen.add(key)
-                unique_articles.append(article)
-        
-        return unique_articles
+        return self.merge_articles([], articles)
 
     def merge_articles(
         self,
@@ -73,6 +423,9 @@ class NewsService:
     ) -> list[dict[str, Any]]:
         """기존 기사와 새 기사를 병합하고 중복을 제거한다.
         
+        같은 ID의 기사는 기존 레코드에 카테고리 정보만 합쳐지므로
+        같은 수집 결과를 여러 번 병합해도 결과가 같다.
+
         Args:
             existing: 기존 기사 리스트
             new_articles: 새로 수집된 기사 리스트
@@ -80,18 +433,19 @@ class NewsService:
         Returns:
             병합 및 중복 제거된 기사 리스트
         """
-        # 기존 기사의 key 집합 생성
-        existing_keys = {
-            (article["title"], article["category"]) for article in existing
-        }
-        
-        # 새 기사 중 중복되지 않는 것만 추가
         merged = existing.copy()
+        index = {article["id"]: i for i, article in enumerate(merged)}
+
         for article in new_articles:
-            key = (article["title"], article["category"])
-            if key not in existing_keys:
+            i = index.get(article["id"])
+            if i is None:
+                index[article["id"]] = len(merged)
                 merged.append(article)
-                existing_keys.add(key)
+            else:
+                # 저장소에서 읽은 기사는 읽기 전용 뷰이므로 복사해서 합친다
+                current = dict(merged[i])
+                merge_article_record(current, article)
+                merged[i] = current
         
         return merged
 
@@ -106,8 +460,9 @@ class NewsService:
         Returns:
             해당 카테고리의 기사 리스트
         """
-        articles = self._articles or self.load_articles()
-        return [a for a in articles if a.get("category") == category]
+        if self._index is None:
+            return query_news_articles(category=category)
+        return [self._view(article) for article in self._index.by_category(category)]
 
     def filter_by_date(
         self, date_str: str
@@ -120,29 +475,45 @@ class NewsService:
         Returns:
             해당 날짜의 기사 리스트
         """
-        articles = self._articles or self.load_articles()
-        return [
-            a for a in articles 
-            if a.get("collected_at", "").startswith(date_str)
-        ]
+        if self._index is None:
+            return query_news_articles(date=date_str)
+        articles = self._index.by_date_prefix(date_str[:10])
+        if len(date_str) > 10:
+            # 시각까지 준 경우 (날짜 색인으로 좁힌 뒤 확인)
+            articles = [a for a in articles if a.get("collected_at", "").startswith(date_str)]
+        return [self._view(article) for article in articles]
 
-    def get_dates_with_news(self) -> list[str]:
-        """뉴스가 있는 날짜 목록을 반환한다.
+    def filter_by_date_range(
+        self, start_date: str, end_date: str
+    ) -> list[dict[str, Any]]:
+        """수집 날짜가 기간 안에 있는 기사를 날짜순으로 반환한다.
         
+        Args:
+            start_date: YYYY-MM-DD 형식의 시작 날짜 (포함)
+            end_date: YYYY-MM-DD 형식의 끝 날짜 (포함)
+
         Returns:
-            YYYY-MM-DD 형식의 날짜 리스트 (정렬됨)
+            기간 안의 기사 리스트 (같은 날짜는 로드 순서)
         """
-        articles = self._articles or self.load_articles()
-        dates = set()
+        articles = self._article_index().by_date_range(start_date, end_date + "\uffff")
+        return [self._view(article) for article in articles]
+
+    def get_dates_with_news(self, month: str | None = None) -> list[str]:
+        """뉴스가 있는 날짜 목록을 반환한다.
         
-        for article in articles:
-            collected_at = article.get("collected_at", "")
-            if collected_at:
-                # ISO 형식에서 날짜만 추출
-                date_part = collected_at.split("T")[0]
-                dates.add(date_part)
+        Args:
+            month: YYYY-MM 형식의 수집 월 (주면 그 달의 기사만 읽는다)
         
-        return sorted(dates, reverse=True)
+        Returns:
+            YYYY-MM-DD 형식의 날짜 리스트 (정렬됨)
+        """
+        if month is not None and self._index is None:
+            # 전체를 로드하지 않고 그 달의 기사만 읽는다
+            return sorted(
+                {article_day(a) for a in query_news_articles(month=month)} - {""},
+                reverse=True,
+            )
+        return self._article_index().days(month or "")[::-1]
 
     def get_article_by_id(self, article_id: str) -> dict[str, Any] | None:
         """ID로 기사를 조회한다.
@@ -153,80 +524,241 @@ class NewsService:
         Returns:
             기사 데이터 또는 None
         """
-        articles = self._articles or self.load_articles()
-        for article in articles:
-            if article.get("id") == article_id:
-                return article
-        return None
+        article = self._article_index().by_id.get(article_id)
+        return None if article is None else self._view(article)
+
+    def search(
+        self, query: str, category: str | None = None, limit: int = SEARCH_LIMIT
+    ) -> list[dict[str, Any]]:
+        """제목/요약으로 기사를 검색한다.
+
+        공용 기사의 bigram 색인에서 BM25 점수 순으로 찾고,
+        현재 사용자에게 보이지 않는 기사(삭제/전체 삭제)는 뺀다.
+
+        Args:
+            query: 검색어
+            category: 카테고리 (None이면 전체)
+            limit: 최대 결과 수
+
+        Returns:
+            관련도 순 기사 리스트
+        """
+        by_id = self._article_index().by_id
+        hits = search_articles(
+            query,
+            limit,
+            lambda article_id: article_id in by_id
+            and (category is None or article_in_category(by_id[article_id], category)),
+        )
+        return [self._view(by_id[article_id]) for article_id, _ in hits]
+
+    def is_listed(self, article_id: str, category: str | None = None) -> bool:
+        """기사가 현재 목록(카테고리가 있으면 그 카테고리)에 있는지 확인한다.
+
+        Args:
+            article_id: 기사 ID
+            category: 카테고리 (None이면 전체)
+
+        Returns:
+            목록에 있는지 여부
+        """
+        article = self.get_article_by_id(article_id)
+        return article is not None and (category is None or article_in_category(article, category))
+
+    def get_favorite_status(self, article_id: str) -> bool:
+        """기사의 즐겨찾기 상태를 조회한다.
+
+        Args:
+            article_id: 기사 ID
+
+        Returns:
+            즐겨찾기 여부 (기사가 없으면 False)
+        """
+        return article_id in self._article_index().by_id and article_id in self._overlay()[0]
+
+    def toggle_favorite(self, article_id: str) -> bool:
+        """기사의 즐겨찾기 상태를 토글한다.
+
+        즐겨찾기는 조회할 때 표시하므로 기사 색인은 고치지 않는다.
+
+        Args:
+            article_id: 기사 ID
+
+        Returns:
+            성공 여부 (기사가 없으면 False)
+        """
+        if article_id not in self._article_index().by_id:
+            return False
+        if not set_article_favorite(article_id, not self.get_favorite_status(article_id)):
+            return False
+        self._overlay_sets = None
+        self._articles = None
+        return True
 
     def delete_article(self, article_id: str) -> bool:
         """ID로 기사를 삭제한다.
         
+        목록 전체를 다시 저장하지 않고 기사 ID 하나만 숨김으로 기록한다.
+
         Args:
             article_id: 기사 ID
             
         Returns:
             삭제 성공 여부
         """
-        articles = self.load_articles()
-        new_articles = [a for a in articles if a.get("id") != article_id]
+        return self.delete_articles([article_id]) == 1
+
+    def delete_articles(self, article_ids: Iterable[str]) -> int:
+        """현재 목록에 있는 기사들을 삭제한다.
         
-        if len(articles) == len(new_articles):
-            return False
+        기사 ID만 숨김으로 기록하고 색인에서 그 기사만 빼서 읽기 캐시에 다시 넣으므로
+        다음 조회도 색인을 다시 만들지 않는다.
+
+        Args:
+            article_ids: 삭제할 기사 ID
             
-        self.save_articles(new_articles)
-        return True
+        Returns:
+            삭제한 기사 수
+        """
+        by_id = self._article_index().by_id
+        visible_ids = [a for a in dict.fromkeys(article_ids) if a in by_id]
+        if not visible_ids or not hide_news_articles(visible_ids):
+            return 0
+        index = self._writable_index()
+        for article_id in visible_ids:
+            index.remove(article_id)
+        self._overlay_sets = None
+        self._articles = None
+        self._store_index()
+        return len(visible_ids)
 
     def collect_news(
-        self, categories: list[str] | None = None
+        self,
+        categories: list[str] | None = None,
+        engine: str = "subprocess",
+        on_event: Callable[[dict[str, Any]], None] | None = None,
+        deep: bool = False,
+        max_items: int | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
         """네이버 뉴스를 수집한다.
         
+        이미 수집한 기사 URL에 닿으면 카테고리별 수집을 멈추므로
+        반복 수집 시에는 새 기사만 가져온다.
+
         Args:
             categories: 수집할 카테고리 리스트 (None이면 전체)
+            engine: 수집 엔진 ("subprocess": 워커 프로세스,
+                "async": 관리형 이벤트 루프의 비동기 엔진. 항상 브라우저로 수집하며
+                수집 방식 지정, 같은 수집 합치기, on_event를 지원하지 않는다)
+            on_event: 수집 이벤트(기사/진행/오류)를 받을 콜백
+                (subprocess 엔진에서 수집 도중 호출된다)
+            deep: True면 "더보기"를 따라가며 이전 수집분이나 한도에 닿을 때까지 수집
+            max_items: 카테고리별 최대 수집 기사 수
+                (None이면 deep 여부에 따라 기본 한도 사용)
             
         Returns:
             카테고리별 수집된 기사
         """
-        from scraper.naver_scraper import scrape_all_categories
+        from scraper.naver_scraper import (
+            DEEP_CRAWL_MAX_ITEMS,
+            MAX_ARTICLES_PER_CATEGORY,
+        )
+
+        if max_items is None:
+            max_items = DEEP_CRAWL_MAX_ITEMS if deep else MAX_ARTICLES_PER_CATEGORY
+        from scraper.naver_scraper import CATEGORIES
+
+        targets = list(CATEGORIES.keys()) if categories is None else categories
+        # 증분 수집 중단 판단에는 수집할 카테고리의 최근 이력만 필요하다
+        seen_urls = load_seen_urls(targets)
+
+        if engine == "async":
+            from scraper.async_scraper import collect_categories
+
+            collected = collect_categories(
+                categories, max_items=max_items, seen_urls=seen_urls
+            )
+        else:
+            from scraper.naver_scraper import stream_categories
+
+            collected = {category: [] for category in targets}
+            events = stream_categories(
+                targets, max_items=max_items, seen_urls=seen_urls
+            )
+            for event in events:
+                if event["type"] == "article":
+                    collected[event["category"]].append(event["article"])
+                if on_event:
+                    on_event(event)
         
-        collected = scrape_all_categories(categories)
+        self.ingest_articles(collected, seen_urls)
+        return collected
+
+    def ingest_articles(
+        self,
+        collected: dict[str, list[dict[str, Any]]],
+        seen_urls: set[str] | None = None,
+    ) -> int:
+        """수집 결과를 공용 기사 저장소에 병합하고 수집 이력을 갱신한다.
         
-        # 기존 기사와 병합
-        existing = self.load_articles()
-        all_new_articles = []
+        공용 저장소는 모든 사용자가 함께 읽으므로 한 번의 수집 결과가
+        모든 사용자에게 보인다 (사용자별로 삭제한 기사는 제외).
         
+        Args:
+            collected: 카테고리별 수집된 기사
+            seen_urls: 이미 로드한 수집 카테고리의 수집 이력 URL 집합 (None이면 새로 로드)
+
+        Returns:
+            새로 추가된 기사 수
+        """
+        if seen_urls is None:
+            seen_urls = load_seen_urls(collected)
+
+        all_new_articles = []
         for category_articles in collected.values():
             all_new_articles.extend(category_articles)
         
-        merged = self.merge_articles(existing, all_new_articles)
-        self.save_articles(merged)
+        added = add_shared_articles(all_new_articles)
+        for category, category_articles in collected.items():
+            add_seen_urls(
+                (a["url"] for a in category_articles if a.get("url") and a["url"] not in seen_urls),
+                category,
+            )
+        if self._index is not None:
+            # 로드한 색인에는 수집된 기사만 저장소의 병합 결과로 반영한다
+            index = self._writable_index()
+            for article_id in dict.fromkeys(a["id"] for a in all_new_articles if a.get("id")):
+                article = get_article_by_id(article_id)
+                if article is None:
+                    index.remove(article_id)
+                else:
+                    index.add({key: value for key, value in article.items() if key != "is_favorite"})
+            self._articles = None
+            # 공용 기사가 바뀌었으므로 이 색인은 읽기 캐시에 넣지 않는다
+            self._index_base = None
         
-        return collected
-
+        return added
 
 # ──────────────────────────────────────────────────────────────────
 # 즐겨찾기 관련 독립 함수 (002 기능)
 # ──────────────────────────────────────────────────────────────────
 
-def toggle_favorite(article_id: str) -> bool:
+def toggle_favorite(article_id: str, service: NewsService | None = None) -> bool:
     """기사의 즐겨찾기 상태를 토글한다.
     
     Args:
         article_id: 토글할 기사 ID
+        service: 기사를 로드해 둔 뉴스 서비스 (주면 그 ID 색인으로 조회하고 갱신)
         
     Returns:
         성공 여부 (기사가 존재하지 않으면 False)
     """
-    articles = load_news_articles()
-    
-    for article in articles:
-        if article.get("id") == article_id:
-            current_status = article.get("is_favorite", False)
-            article["is_favorite"] = not current_status
-            return save_news_articles(articles)
-    
-    return False
+    if service is not None:
+        return service.toggle_favorite(article_id)
+    article = get_article_by_id(article_id)
+    if article is None:
+        return False
+    return set_article_favorite(article_id, not article.get("is_favorite", False))
 
 
 def get_favorites() -> list[dict[str, Any]]:
@@ -239,22 +771,20 @@ def get_favorites() -> list[dict[str, Any]]:
     return [a for a in articles if a.get("is_favorite", False) is True]
 
 
-def get_favorite_status(article_id: str) -> bool:
+def get_favorite_status(article_id: str, service: NewsService | None = None) -> bool:
     """특정 기사의 즐겨찾기 상태를 조회한다.
     
     Args:
         article_id: 조회할 기사 ID
+        service: 기사를 로드해 둔 뉴스 서비스 (주면 그 ID 색인으로 조회)
         
     Returns:
         즐겨찾기 여부 (기사가 없거나 is_favorite가 없으면 False)
     """
-    articles = load_news_articles()
-    
-    for article in articles:
-        if article.get("id") == article_id:
-            return article.get("is_favorite", False)
-    
-    return False
+    if service is not None:
+        return service.get_favorite_status(article_id)
+    article = get_article_by_id(article_id)
+    return bool(article and article.get("is_favorite", False))
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -282,65 +812,50 @@ def delete_all_articles() -> dict[str, Any]:
 def delete_articles_by_category(category: str) -> dict[str, Any]:
     """특정 카테고리의 기사와 관련 다이어리를 삭제한다.
     
+    여러 카테고리에 실린 기사는 대표 카테고리가 달라도 함께 삭제한다.
+
     Args:
         category: 삭제할 카테고리
         
     Returns:
         삭제 결과 {'success': bool, 'deleted_count': int}
     """
-    articles = load_news_articles()
-    diary_entries = load_diary_entries_dict()
-    
-    # 삭제할 기사 ID 수집
-    ids_to_delete = set()
-    remaining_articles = []
-    
-    for article in articles:
-        if article.get("category") == category:
-            ids_to_delete.add(article.get("id"))
-        else:
-            remaining_articles.append(article)
-    
+    # 삭제할 기사 ID 수집 (저장소의 카테고리 색인 사용)
+    ids_to_delete = [article["id"] for article in query_news_articles(category=category)]
     deleted_count = len(ids_to_delete)
     
-    # 기사 저장
-    save_news_articles(remaining_articles)
+    # 삭제한 기사만 기록
+    hide_news_articles(ids_to_delete)
     
     # 관련 다이어리 삭제
-    for article_id in ids_to_delete:
-        if article_id in diary_entries:
-            del diary_entries[article_id]
-    
-    save_diary_entries_dict(diary_entries)
+    delete_diary_entries(ids_to_delete)
     
     return {"success": True, "deleted_count": deleted_count}
 
 
-def delete_selected_articles(article_ids: list[str]) -> dict[str, Any]:
+def delete_selected_articles(
+    article_ids: list[str], service: NewsService | None = None
+) -> dict[str, Any]:
     """선택된 뉴스 기사와 관련 다이어리를 삭제한다.
     
     Args:
         article_ids: 삭제할 기사 ID 리스트
+        service: 기사를 로드해 둔 뉴스 서비스 (주면 그 색인으로 확인하고 갱신)
         
     Returns:
         삭제 결과 {'success': bool, 'deleted_count': int}
     """
-    articles = load_news_articles()
-    diary_entries = load_diary_entries_dict()
-    
     ids_to_delete = set(article_ids)
-    remaining_articles = [a for a in articles if a.get("id") not in ids_to_delete]
-    
-    deleted_count = len(articles) - len(remaining_articles)
-    
-    # 기사 저장
-    save_news_articles(remaining_articles)
+    if service is not None:
+        deleted_count = service.delete_articles(article_ids)
+    else:
+        articles = load_news_articles()
+        visible_ids = [a.get("id") for a in articles if a.get("id") in ids_to_delete]
+        deleted_count = len(visible_ids)
+        # 삭제한 기사만 기록
+        hide_news_articles(visible_ids)
     
     # 관련 다이어리 삭제
-    for article_id in ids_to_delete:
-        if article_id in diary_entries:
-            del diary_entries[article_id]
-    
-    save_diary_entries_dict(diary_entries)
+    delete_diary_entries(ids_to_delete)
     
     return {"success": True, "deleted_count": deleted_count}
@@ -0,0 +1,135 @@
+"""읽기 캐시 모듈.
+
+저장소에서 읽은 데이터를 (사용자, 파일) 같은 키로 프로세스 안에 보관한다.
+항목마다 파일 수정 시각/크기나 버전 번호 같은 스탬프를 함께 저장해
+스탬프가 같으면 다시 파싱하지 않고, 달라지면 새로 읽는다.
+
+캐시된 값은 여러 세션이 함께 보므로 변경할 수 없는 뷰(freeze)로 보관한다.
+수정이 필요한 호출자는 thaw()로 복사본을 만들어 사용한다.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from types import MappingProxyType
+from typing import Any
+
+# 캐시에 보관할 최대 항목 수 (오래 쓰지 않은 항목부터 버린다)
+MAX_ENTRIES = 512
+
+
+def freeze(value: Any) -> Any:
+    """dict/list를 변경할 수 없는 뷰(MappingProxyType/tuple)로 바꾼다."""
+    if isinstance(value, dict):
+        # 문자열/숫자 값은 그대로 두어 큰 색인(ID → 값)도 함수 호출 없이 감싼다
+        return MappingProxyType({
+            key: freeze(item) if isinstance(item, (dict, list)) else item
+            for key, item in value.items()
+        })
+    if isinstance(value, list):
+        return tuple(freeze(item) if isinstance(item, (dict, list)) else item for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """freeze()한 값을 수정 가능한 dict/list 복사본으로 되돌린다."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+def json_default(value: Any) -> Any:
+    """json.dump에서 freeze()한 뷰를 직렬화한다."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입: {type(value).__name__}")
+
+
+class ReadCache:
+    """스탬프로 유효성을 확인하는 스레드 안전한 읽기 캐시."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        """읽기 캐시를 생성한다.
+
+        Args:
+            max_entries: 보관할 최대 항목 수
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[Hashable, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, stamp: Hashable, loader: Callable[[], Any]) -> Any:
+        """스탬프가 같으면 캐시된 값을, 다르면 loader로 새로 읽은 값을 반환한다.
+
+        Args:
+            key: 캐시 키 (예: (사용자, 파일 이름))
+            stamp: 현재 데이터의 스탬프 (None이면 캐시하지 않음)
+            loader: 데이터를 새로 읽는 함수 (반환값은 그대로 보관되므로 freeze 권장)
+
+        Returns:
+            캐시된 값 또는 새로 읽은 값
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if stamp is not None and entry is not None and entry[0] == stamp:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            self.misses += 1
+
+        # 파싱은 잠금 밖에서 한다 (도중에 데이터가 바뀌면 다음 조회에서 다시 읽는다)
+        value = loader()
+        if stamp is not None:
+            self.put(key, stamp, value)
+        return value
+
+    def put(self, key: Hashable, stamp: Hashable, value: Any) -> None:
+        """값을 스탬프와 함께 보관한다 (고친 값을 다시 만들지 않고 넣을 때 사용).
+
+        Args:
+            key: 캐시 키
+            stamp: 값이 나타내는 데이터의 스탬프
+            value: 보관할 값 (그대로 보관되므로 이후에 고치지 않아야 한다)
+        """
+        with self._lock:
+            self._entries[key] = (stamp, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """항목을 버린다 (key가 None이면 전체)."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        """적중/실패 횟수와 항목 수를 반환한다."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                "entries": len(self._entries),
+            }
+
+    def reset_stats(self) -> None:
+        """적중/실패 횟수를 0으로 되돌린다."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+_cache = ReadCache()
+
+
+def get_read_cache() -> ReadCache:
+    """프로세스 공용 읽기 캐시를 반환한다."""
+    return _cache
@@ -0,0 +1,401 @@
+"""기사 보존 규칙과 보관(archive) 모듈.
+
+보존 기간이 지난 공용 기사를 저장소에서 빼서 수집 월별 gzip 보관 파일
+(data/_shared/archive/YYYY-MM.jsonl.gz)로 옮긴다. 자주 읽는 저장소에는
+최근 기사와 누군가 즐겨찾기하거나 다이어리를 쓴 기사만 남는다.
+
+보관 파일은 한 줄에 기사 하나씩 {"article": 기사, "hidden_by": 숨긴 사용자,
+"archived_at": 보관 시각}을 gzip 멤버 단위로 덧붙인다. 보관 파일에 먼저 쓰고
+저장소에서 지우므로 도중에 중단되어도 기사를 잃지 않는다 (같은 기사가 두 번
+보관될 수는 있으며, 읽을 때 마지막 레코드를 사용한다).
+
+보관한 기사는 search_archive()로 검색하고 restore_archived_articles()로
+저장소에 되돌릴 수 있다.
+
+    python -m app.services.retention [--days 90] [--search 검색어] [--restore ID ...]
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import os
+import threading
+import zlib
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from app.services.read_cache import json_default, thaw
+from app.services.search_index import unindex_shared_articles
+from app.services.storage_backend import UNDATED_MONTH, StorageBackend
+from app.services.storage_util import (
+    DIARY_DOCUMENT,
+    add_shared_articles,
+    get_shared_dir,
+    get_storage_backend,
+)
+
+logger = logging.getLogger(__name__)
+
+# 기본 보존 기간 (일, 0이면 보관하지 않음)
+RETENTION_DAYS = int(os.environ.get("NEWS_RETENTION_DAYS", "90"))
+
+# 백그라운드 보관 작업 주기 (초)
+PRUNE_INTERVAL = 6 * 3600
+
+# 보관 폴더 이름 (공용 데이터 폴더 아래)과 보관 파일 접미사
+ARCHIVE_DIRNAME = "archive"
+ARCHIVE_SUFFIX = ".jsonl.gz"
+
+# 검색 결과 기본 최대 개수
+SEARCH_LIMIT = 50
+
+
+class RetentionPolicy:
+    """공용 기사 보존 규칙.
+
+    수집된 지 max_age_days일이 지난 기사를 보관 대상으로 보되, 어느 사용자든
+    즐겨찾기한 기사(keep_favorites)와 다이어리를 쓴 기사(keep_diary)는 남긴다.
+    수집 시각이 없는 기사는 나이를 알 수 없으므로 남긴다.
+    """
+
+    def __init__(
+        self,
+        max_age_days: int = RETENTION_DAYS,
+        keep_favorites: bool = True,
+        keep_diary: bool = True,
+    ) -> None:
+        """보존 규칙을 생성한다.
+
+        Args:
+            max_age_days: 보존 기간 (일, 0 이하면 아무것도 보관하지 않음)
+            keep_favorites: 즐겨찾기한 기사를 남길지 여부
+            keep_diary: 다이어리를 쓴 기사를 남길지 여부
+        """
+        self.max_age_days = max_age_days
+        self.keep_favorites = keep_favorites
+        self.keep_diary = keep_diary
+
+    @property
+    def enabled(self) -> bool:
+        """보관할 기사가 생길 수 있는 규칙인지 여부."""
+        return self.max_age_days > 0
+
+    def cutoff(self, now: datetime | None = None) -> str:
+        """이 시각(ISO 형식) 이전에 수집된 기사가 보관 대상이다."""
+        now = now or datetime.now()
+        return (now - timedelta(days=self.max_age_days)).isoformat()
+
+    def pinned_ids(self, backend: StorageBackend, users: Iterable[str]) -> set[str]:
+        """규칙에 따라 남겨야 하는 기사 ID (즐겨찾기, 다이어리)."""
+        pinned: set[str] = set()
+        for user in users:
+            if self.keep_favorites:
+                overlay = backend.load_overlay(user)
+                if overlay:
+                    pinned.update(overlay["favorites"])
+            if self.keep_diary:
+                pinned.update(_diary_article_ids(backend.read_document(user, DIARY_DOCUMENT)))
+        return pinned
+
+    def is_expired(self, article: Mapping[str, Any], cutoff: str, pinned: set[str]) -> bool:
+        """기사가 보관 대상인지 확인한다."""
+        collected_at = article.get("collected_at") or ""
+        return bool(collected_at) and collected_at < cutoff and article.get("id") not in pinned
+
+
+def _diary_article_ids(entries: Any) -> set[str]:
+    """다이어리 문서(딕셔너리/리스트 형식)가 참조하는 기사 ID."""
+    if isinstance(entries, Mapping):
+        return set(entries)
+    if isinstance(entries, (list, tuple)):
+        return {e["article_id"] for e in entries if isinstance(e, Mapping) and e.get("article_id")}
+    return set()
+
+
+# 보관 파일 관련 함수
+def get_archive_dir() -> Path:
+    """보관 파일 폴더 경로를 반환한다."""
+    archive_dir = get_shared_dir() / ARCHIVE_DIRNAME
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    return archive_dir
+
+
+def archive_months() -> list[str]:
+    """보관 파일이 있는 수집 월을 최근 순으로 반환한다."""
+    return sorted(
+        (path.name[: -len(ARCHIVE_SUFFIX)] for path in get_archive_dir().glob("*" + ARCHIVE_SUFFIX)),
+        reverse=True,
+    )
+
+
+def append_to_archive(month: str, records: list[dict[str, Any]]) -> bool:
+    """보관 레코드를 월별 보관 파일 끝에 gzip 멤버 하나로 덧붙이고 fsync한다.
+
+    Args:
+        month: 수집 월 (YYYY-MM)
+        records: {"article", "hidden_by", "archived_at"} 레코드
+
+    Returns:
+        저장 성공 여부
+    """
+    if not records:
+        return True
+    data = "".join(
+        json.dumps(record, ensure_ascii=False, default=json_default) + "\n" for record in records
+    ).encode("utf-8")
+    path = get_archive_dir() / f"{month}{ARCHIVE_SUFFIX}"
+    try:
+        with open(path, "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="ab") as f:
+                f.write(data)
+            raw.flush()
+            os.fsync(raw.fileno())
+        return True
+    except OSError:
+        logger.exception("보관 파일에 쓰지 못했습니다: %s", path)
+        return False
+
+
+def read_archive(month: str) -> Iterator[dict[str, Any]]:
+    """월별 보관 파일의 레코드를 순서대로 읽는다.
+
+    쓰는 도중 중단되어 잘린 마지막 멤버와 깨진 줄은 건너뛴다.
+    """
+    path = get_archive_dir() / f"{month}{ARCHIVE_SUFFIX}"
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict) and isinstance(record.get("article"), dict):
+                    yield record
+    except FileNotFoundError:
+        return
+    except (EOFError, gzip.BadGzipFile, zlib.error):
+        logger.warning("보관 파일 끝이 잘려 있어 앞부분만 읽습니다: %s", path)
+
+
+def search_archive(
+    query: str = "",
+    months: Iterable[str] | None = None,
+    limit: int = SEARCH_LIMIT,
+) -> list[dict[str, Any]]:
+    """보관한 기사를 제목/요약/언론사로 검색한다 (최근 달부터).
+
+    Args:
+        query: 검색어 (빈 문자열이면 전체, 대소문자 무시)
+        months: 검색할 수집 월 (None이면 전체)
+        limit: 최대 결과 수
+
+    Returns:
+        보관 레코드 리스트 (기사 ID마다 가장 최근 레코드 하나)
+    """
+    needle = query.strip().lower()
+    results: list[dict[str, Any]] = []
+    for month in archive_months() if months is None else sorted(months, reverse=True):
+        latest: dict[str, dict[str, Any]] = {}
+        for record in read_archive(month):
+            latest[record["article"].get("id")] = record
+        for record in latest.values():
+            article = record["article"]
+            text = " ".join(
+                str(article.get(key) or "") for key in ("title", "summary", "publisher")
+            ).lower()
+            if needle in text:
+                results.append(record)
+                if len(results) >= limit:
+                    return results
+    return results
+
+
+def restore_archived_articles(article_ids: Iterable[str]) -> int:
+    """보관한 기사를 저장소로 되돌린다.
+
+    보관할 때 기사를 숨겨 두었던 사용자에게는 다시 숨긴다.
+    되돌린 기사도 보존 기간이 지났으면 다음 보관 때 다시 옮겨지므로,
+    남겨 두려면 즐겨찾기하거나 다이어리를 쓴다.
+
+    Args:
+        article_ids: 되돌릴 기사 ID
+
+    Returns:
+        저장소에 새로 추가된 기사 수
+    """
+    wanted = set(article_ids)
+    found: dict[str, dict[str, Any]] = {}
+    for month in archive_months():
+        for record in read_archive(month):
+            if record["article"].get("id") in wanted:
+                found[record["article"]["id"]] = record
+    if not found:
+        return 0
+
+    added = add_shared_articles(record["article"] for record in found.values())
+    backend = get_storage_backend()
+    hidden: dict[str, list[str]] = {}
+    for article_id, record in found.items():
+        for user in record.get("hidden_by") or ():
+            hidden.setdefault(user, []).append(article_id)
+    for user, ids in hidden.items():
+        backend.hide_articles(user, ids)
+    return added
+
+
+# 보관 작업
+def prune_expired_articles(
+    policy: RetentionPolicy | None = None, now: datetime | None = None
+) -> dict[str, int]:
+    """보존 기간이 지난 공용 기사를 보관 파일로 옮긴다.
+
+    오래된 달부터 한 달씩 처리하며, 달마다 즐겨찾기/다이어리를 다시 읽어
+    처리 중에 즐겨찾기한 기사도 남긴다. 옮긴 기사는 사용자 오버레이의 삭제 기록에서도
+    빼고 보관 레코드(hidden_by)에 남겨 오버레이가 계속 커지지 않게 한다.
+
+    Args:
+        policy: 보존 규칙 (None이면 기본 규칙)
+        now: 기준 시각 (None이면 현재)
+
+    Returns:
+        {"archived": 보관한 기사 수, "months": 처리한 달 수}
+    """
+    policy = policy or RetentionPolicy()
+    result = {"archived": 0, "months": 0}
+    if not policy.enabled:
+        return result
+
+    backend = get_storage_backend()
+    cutoff = policy.cutoff(now)
+    archived_at = (now or datetime.now()).isoformat()
+    for month in backend.article_months():
+        if month == UNDATED_MONTH:
+            continue
+        if month > cutoff[:7]:
+            break
+
+        users = backend.list_users()
+        pinned = policy.pinned_ids(backend, users)
+        articles = backend.load_articles([month])
+        expired = [
+            article_id
+            for article_id, article in articles.items()
+            if policy.is_expired(article, cutoff, pinned)
+        ]
+        if not expired:
+            continue
+
+        expired_set = set(expired)
+        hidden_by: dict[str, list[str]] = {}
+        for user in users:
+            overlay = backend.load_overlay(user)
+            if overlay:
+                for article_id in expired_set.intersection(overlay["deleted"]):
+                    hidden_by.setdefault(article_id, []).append(user)
+
+        records = [
+            {
+                "article": thaw(articles[article_id]),
+                "hidden_by": hidden_by.get(article_id, []),
+                "archived_at": archived_at,
+            }
+            for article_id in expired
+        ]
+        # 보관 파일에 먼저 기록한 뒤 지운다 (중단되어도 기사를 잃지 않음)
+        if not append_to_archive(month, records):
+            break
+        if not backend.remove_articles(expired):
+            # 보관 파일에는 남았으므로 다음 실행에서 다시 지운다
+            logger.warning("%s: 보관한 기사를 저장소에서 지우지 못했습니다", month)
+            break
+        unindex_shared_articles(expired)
+        hiding_users = {user for users_ in hidden_by.values() for user in users_}
+        for user in hiding_users:
+            backend.update_overlay(user, lambda overlay, ids=expired_set: _forget_deleted(overlay, ids))
+
+        result["archived"] += len(expired)
+        result["months"] += 1
+        logger.info("%s: 기사 %d건을 보관했습니다", month, len(expired))
+    return result
+
+
+def _forget_deleted(overlay: dict[str, Any], article_ids: set[str]) -> dict[str, Any]:
+    """오버레이의 삭제 기록에서 보관한 기사를 뺀다."""
+    overlay["deleted"] = [i for i in overlay["deleted"] if i not in article_ids]
+    return overlay
+
+
+class RetentionPruner:
+    """보존 기간이 지난 기사를 주기적으로 보관하는 백그라운드 작업."""
+
+    def __init__(
+        self, policy: RetentionPolicy | None = None, interval: float = PRUNE_INTERVAL
+    ) -> None:
+        """백그라운드 보관 작업을 생성한다.
+
+        Args:
+            policy: 보존 규칙 (None이면 기본 규칙)
+            interval: 보관 주기 (초)
+        """
+        self.policy = policy or RetentionPolicy()
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> dict[str, int]:
+        """한 번 보관한다 (실패해도 예외를 던지지 않음)."""
+        try:
+            return prune_expired_articles(self.policy)
+        except Exception:
+            logger.exception("기사 보관 실패")
+            return {"archived": 0, "months": 0}
+
+    def start(self) -> None:
+        """백그라운드 스레드에서 주기적으로 보관을 시작한다."""
+        if not self.policy.enabled or self._thread is not None:
+            return
+
+        def loop() -> None:
+            while not self._stop.is_set():
+                self.run_once()
+                self._stop.wait(self.interval)
+
+        self._thread = threading.Thread(target=loop, name="retention-pruner", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """백그라운드 보관을 멈추고 진행 중인 작업이 끝나기를 기다린다."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def main(argv: list[str] | None = None) -> None:
+    """명령행에서 보관, 보관 기사 검색, 복구를 실행한다."""
+    parser = argparse.ArgumentParser(description="기사 보존 기간 관리")
+    parser.add_argument("--days", type=int, default=RETENTION_DAYS, help="보존 기간 (일)")
+    parser.add_argument("--search", help="보관한 기사 검색어")
+    parser.add_argument("--restore", nargs="+", metavar="ID", help="저장소로 되돌릴 기사 ID")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    if args.search is not None:
+        for record in search_archive(args.search):
+            article = record["article"]
+            print(f"{article.get('id')}  {(article.get('collected_at') or '')[:10]}  {article.get('title')}")
+    elif args.restore:
+        print(f"되돌린 기사: {restore_archived_articles(args.restore)}건")
+    else:
+        print(prune_expired_articles(RetentionPolicy(args.days)))
+
+
+if __name__ == "__main__":
+    main()
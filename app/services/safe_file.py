@@ -0,0 +1,228 @@
+"""안전한 JSON 파일 저장 모듈.
+
+저장은 임시 파일에 쓰고 fsync한 뒤 이름을 바꿔(rename) 교체하므로, 쓰는 도중
+중단되어도 기존 파일이 잘린 채로 남지 않는다. 교체 직전 파일은 <이름>.bak으로
+한 세대 보관하고, 각 세대의 SHA-256 체크섬을 <이름>.sha256에 기록한다.
+
+읽을 때는 체크섬이 맞는 가장 최근 세대(현재 파일 → .bak 순)를 사용한다.
+체크섬 파일이 없는 파일(이 모듈 이전에 저장된 파일)은 JSON으로 읽히면 유효로 본다.
+
+저장 한 번에 fsync는 데이터 파일 한 번만 한다. 체크섬 파일이나 이름 바꾸기가
+디스크에 반영되기 전에 전원이 꺼지면 체크섬이 맞지 않거나 현재 파일이 없으므로
+이전 세대로 돌아간다.
+
+file_lock()은 여러 프로세스/스레드가 같은 파일을 고칠 때 짧은 커밋 구간만
+잠그는 데 사용한다 (POSIX는 flock, 그 밖에는 잠금 파일).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 이전 세대 파일 접미사
+BACKUP_SUFFIX = ".bak"
+
+# 체크섬 파일 접미사
+CHECKSUM_SUFFIX = ".sha256"
+
+# 유효한 세대가 없을 때 다시 읽는 횟수와 간격 (다른 저장이 세대를 돌리는 중일 수 있음)
+READ_RETRIES = 3
+READ_RETRY_DELAY = 0.05
+
+# 잠금 파일 방식(flock이 없는 환경)에서 잠금을 기다리는 간격과 버려진 잠금으로 볼 시간 (초)
+LOCK_POLL_INTERVAL = 0.005
+STALE_LOCK_AGE = 30.0
+
+# 읽을 때 현재 세대가 손상되어 있던 파일 (다음 저장 때 .bak을 덮어쓰지 않는다)
+_corrupt: set[Path] = set()
+_corrupt_lock = threading.Lock()
+
+
+def backup_path(path: Path) -> Path:
+    """이전 세대 파일 경로."""
+    return path.with_name(path.name + BACKUP_SUFFIX)
+
+
+def checksum_path(path: Path) -> Path:
+    """체크섬 파일 경로."""
+    return path.with_name(path.name + CHECKSUM_SUFFIX)
+
+
+def read_checksum(path: Path) -> str | None:
+    """파일의 현재 세대 체크섬을 반환한다 (체크섬 파일이 없으면 None)."""
+    try:
+        return checksum_path(path).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+@contextmanager
+def file_lock(lock_path: Path, timeout: float = 10.0) -> Iterator[None]:
+    """잠금 파일로 다른 프로세스/스레드와 배타적인 구간을 만든다.
+
+    같은 스레드에서 같은 잠금을 다시 잡으면 교착되므로 호출자가 피해야 한다.
+
+    Args:
+        lock_path: 잠금 파일 경로
+        timeout: 잠금을 기다리는 최대 시간 (초)
+
+    Raises:
+        TimeoutError: 제한 시간 안에 잠금을 얻지 못한 경우
+    """
+    deadline = time.monotonic() + timeout
+    if fcntl is not None:
+        fd = os.open(lock_path, os.O_CREAT | os.O_RDWR)
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"잠금을 얻지 못했습니다: {lock_path}") from None
+                    time.sleep(LOCK_POLL_INTERVAL)
+            yield
+        finally:
+            os.close(fd)
+        return
+
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.close(fd)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > STALE_LOCK_AGE:
+                    lock_path.unlink(missing_ok=True)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"잠금을 얻지 못했습니다: {lock_path}") from None
+            time.sleep(LOCK_POLL_INTERVAL)
+    try:
+        yield
+    finally:
+        lock_path.unlink(missing_ok=True)
+
+
+def _digest(data: bytes) -> str:
+    return f"sha256:{hashlib.sha256(data).hexdigest()} {len(data)}"
+
+
+def _write_checksum(path: Path, digest: str) -> None:
+    """체크섬 파일을 임시 파일 교체로 기록한다 (fsync는 하지 않음)."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(digest + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def atomic_write_json(
+    path: Path,
+    data: Any,
+    default: Callable[[Any], Any] | None = None,
+) -> None:
+    """데이터를 JSON 파일에 원자적으로 저장한다.
+
+    Args:
+        path: 저장할 파일 경로
+        data: 저장할 데이터
+        default: json.dump가 직렬화하지 못하는 값을 바꾸는 함수
+
+    Raises:
+        OSError: 파일을 쓰지 못한 경우
+        TypeError: 직렬화할 수 없는 데이터
+    """
+    payload = json.dumps(data, ensure_ascii=False, indent=2, default=default).encode("utf-8")
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+        with _corrupt_lock:
+            keep_backup = path in _corrupt
+            _corrupt.discard(path)
+        if path.exists() and not keep_backup:
+            # 현재 세대를 이전 세대로 돌린다 (손상된 현재 세대로 .bak을 덮지 않음)
+            os.replace(path, backup_path(path))
+            if checksum_path(path).exists():
+                os.replace(checksum_path(path), checksum_path(backup_path(path)))
+            else:
+                checksum_path(backup_path(path)).unlink(missing_ok=True)
+
+        _write_checksum(checksum_path(path), _digest(payload))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _read_generation(path: Path) -> tuple[bool, Any]:
+    """세대 하나를 검증해 읽는다.
+
+    Returns:
+        (유효 여부, 데이터)
+    """
+    try:
+        payload = path.read_bytes()
+    except OSError:
+        return False, None
+    expected = read_checksum(path)
+    if expected is not None and expected != _digest(payload):
+        return False, None
+    try:
+        return True, json.loads(payload)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return False, None
+
+
+def read_json_verified(path: Path) -> Any:
+    """체크섬이 맞는 가장 최근 세대의 JSON 데이터를 읽는다.
+
+    Args:
+        path: 읽을 파일 경로
+
+    Returns:
+        데이터 (파일이 없거나 유효한 세대가 없으면 None)
+    """
+    backup = backup_path(path)
+    for attempt in range(READ_RETRIES):
+        valid, data = _read_generation(path)
+        if valid:
+            return data
+        if not path.exists():
+            # 다른 저장이 세대를 돌리는 중이거나 그 도중에 중단됨: 이전 세대를 쓴다
+            valid, data = _read_generation(backup)
+            if valid or not backup.exists():
+                return data if valid else None
+        if attempt < READ_RETRIES - 1:
+            # 다른 저장이 데이터와 체크섬을 바꾸는 사이에 읽었을 수 있다
+            time.sleep(READ_RETRY_DELAY)
+
+    valid, data = _read_generation(backup)
+    if path.exists():
+        with _corrupt_lock:
+            _corrupt.add(path)
+        if valid:
+            logger.warning("손상된 파일을 이전 세대로 복구합니다: %s", path)
+        else:
+            logger.warning("손상된 파일이며 복구할 이전 세대가 없습니다: %s", path)
+    return data if valid else None
@@ -0,0 +1,668 @@
+"""기사 전문 검색 모듈.
+
+공용 기사의 제목과 요약을 글자 bigram(두 글자 조각)으로 나눈 역색인으로 검색하고
+BM25로 순위를 매긴다. 한국어는 띄어쓰기와 조사가 일정하지 않아 형태소 분석 없이도
+"반도체"로 "반도체가", "차세대반도체"를 찾을 수 있도록 단어를 bigram으로 자른다
+(한 글자 단어는 그 글자 하나를 쓴다). 검색어의 한 글자 단어는 bigram이 없으므로
+그 글자가 들어 있는 bigram을 모두 찾는다 ("쌀"로 "쌀값"을 찾는다).
+
+색인은 기사 저장소 옆(data/_shared/search/)에 스냅샷(index.json)과
+변경 기록(index.journal.jsonl)으로 저장한다. 기사가 추가/변경/보관될 때는
+기록에 기사 하나당 한 줄({"op": "add", "key": 기사 ID, "value": 색인할 글}
+또는 {"op": "delete", "key": 기사 ID})만 덧붙이고, 기록이 커지면 스냅샷으로 접는다.
+그래서 프로세스를 다시 시작해도 색인을 다시 만들지 않고 읽기만 한다.
+다른 프로세스(스케줄러 등)가 덧붙인 기록은 검색할 때 이어서 읽으며, 검색은 파일 잠금 없이
+메모리 색인과 읽은 위치만으로 하므로 여러 검색이 서로나 기록 추가를 기다리지 않는다.
+
+스냅샷의 게시 목록(posting)은 bigram마다 문서 번호와 빈도 배열을 base64로 담아 두고,
+검색어에 나온 bigram만 처음 쓸 때 풀어 놓는다.
+
+색인은 공용 기사 전체를 대상으로 하므로, 사용자에게 보이는 기사인지(삭제/전체 삭제)는
+검색하는 쪽(NewsService.search)에서 거른다.
+
+    python -m app.services.search_index [--rebuild] [--search 검색어]
+"""
+
+import argparse
+import base64
+import logging
+import math
+import re
+import sys
+import threading
+import unicodedata
+import zlib
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from app.services import journal
+from app.services.read_cache import json_default
+from app.services.safe_file import atomic_write_json, file_lock, read_json_verified
+from app.services.storage_util import (
+    get_shared_dir,
+    get_storage_backend,
+    load_shared_articles,
+)
+
+logger = logging.getLogger(__name__)
+
+# 검색 색인 폴더 이름 (공용 데이터 폴더 아래, 기사 저장소 옆)
+SEARCH_DIRNAME = "search"
+
+# 색인 스냅샷, 변경 기록, 잠금 파일 이름
+INDEX_FILENAME = "index.json"
+JOURNAL_FILENAME = "index.journal.jsonl"
+LOCK_FILENAME = "index.lock"
+
+# 스냅샷 형식 버전 (다르면 색인을 다시 만든다)
+INDEX_VERSION = 1
+
+# 색인할 기사 필드
+INDEXED_FIELDS = ("title", "summary")
+
+# BM25 매개변수 (빈도 포화, 문서 길이 보정)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 변경 기록의 연산 수가 이 값과 (색인 문서 수 × 비율) 중 큰 값을 넘으면 스냅샷으로 접는다
+COMPACT_MIN_OPS = 1000
+COMPACT_RATIO = 0.5
+
+# 검색 결과 기본 최대 개수
+SEARCH_LIMIT = 50
+
+# 이보다 많은 기사를 색인할 때는 한 건씩 조회하지 않고 공용 기사 전체(읽기 캐시)에서 찾는다
+BULK_LOOKUP_MIN = 200
+
+# 단어 분리 (한글/영문/숫자 연속 구간)
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """글을 검색용 bigram 리스트로 나눈다.
+
+    유니코드 정규화(NFKC)와 소문자 변환 뒤 단어마다 겹치는 두 글자 조각을 만든다.
+
+    Args:
+        text: 나눌 글
+
+    Returns:
+        bigram 리스트 (한 글자 단어는 그 글자)
+    """
+    grams: list[str] = []
+    for word in _WORD_RE.findall(unicodedata.normalize("NFKC", text).lower()):
+        if len(word) == 1:
+            grams.append(word)
+        else:
+            grams.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+def query_terms(text: str) -> tuple[set[str], set[str]]:
+    """검색어를 bigram과 한 글자 단어로 나눈다.
+
+    Args:
+        text: 검색어
+
+    Returns:
+        (bigram 집합, 한 글자 단어 집합)
+    """
+    grams: set[str] = set()
+    chars: set[str] = set()
+    for gram in tokenize(text):
+        (grams if len(gram) > 1 else chars).add(gram)
+    return grams, chars
+
+
+def article_text(article: Mapping[str, Any]) -> str:
+    """기사에서 색인할 글(제목, 요약)을 만든다."""
+    return "\n".join(str(article.get(field) or "") for field in INDEXED_FIELDS).strip()
+
+
+def _encode(values: array) -> str:
+    """배열을 리틀 엔디언 바이트의 base64 문자열로 바꾼다."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _decode(typecode: str, data: str) -> array:
+    """_encode()로 만든 문자열을 배열로 되돌린다."""
+    values = array(typecode)
+    values.frombytes(base64.b64decode(data))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class SearchIndex:
+    """기사 제목/요약의 bigram 역색인.
+
+    문서 번호는 색인에 들어온 순서이며, 지운 기사는 번호를 비워 두었다가
+    스냅샷으로 접을 때 번호를 다시 매긴다. 여러 스레드에서 써도 되고,
+    여러 프로세스가 같은 폴더를 쓰면 짧은 파일 잠금으로 기록 추가와 접기를 나눈다.
+    검색은 잠금 없이 메모리 색인을 읽고, 도중에 색인이 통째로 바뀌었으면
+    (스냅샷을 다시 읽은 경우) 스레드 잠금 안에서 다시 계산한다.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """색인 폴더의 검색 색인을 생성한다 (파일은 처음 쓸 때 읽는다).
+
+        Args:
+            directory: 색인 파일을 둘 폴더
+        """
+        self.directory = directory
+        self._lock = threading.RLock()
+        self._compacting = False
+        # 메모리 색인을 통째로 바꿀 때마다 늘린다 (잠금 없이 검색하던 중에 바뀌었는지 확인용)
+        self._generation = 0
+        self._reset()
+        # 읽은 스냅샷의 (inode, 수정 시각, 크기)와 변경 기록에서 읽은 위치/연산 수
+        self._snapshot_stamp: tuple[int, int, int] | None = None
+        self._journal_offset = 0
+        self._journal_ops = 0
+        self._loaded = False
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.directory / INDEX_FILENAME
+
+    @property
+    def journal_path(self) -> Path:
+        return self.directory / JOURNAL_FILENAME
+
+    def _reset(self) -> None:
+        """메모리의 색인을 비운다."""
+        self._generation += 1
+        # 문서 번호 → 기사 ID (지운 문서는 None), 기사 ID → 문서 번호
+        self._ids: list[str | None] = []
+        self._docs: dict[str, int] = {}
+        # 문서 번호별 bigram 수와 색인한 글의 CRC32 (바뀌었는지 확인용)
+        self._lengths = array("I")
+        self._checksums = array("I")
+        self._total_length = 0
+        # bigram → (문서 번호 배열, 빈도 배열), 아직 풀지 않은 스냅샷 게시 목록
+        self._postings: dict[str, tuple[array, array]] = {}
+        self._raw: dict[str, list[str]] = {}
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._docs)
+
+    def __contains__(self, article_id: object) -> bool:
+        self.refresh()
+        return article_id in self._docs
+
+    def exists(self) -> bool:
+        """디스크에 색인(스냅샷 또는 변경 기록)이 있는지 확인한다."""
+        return self.snapshot_path.exists() or self.journal_path.exists()
+
+    # ── 메모리 색인 ────────────────────────────────────────────────
+
+    def _posting(self, gram: str) -> tuple[array, array] | None:
+        """bigram의 게시 목록을 반환한다 (스냅샷에서 읽은 것이면 이때 푼다).
+
+        잠금 없이 검색하는 스레드도 부르므로, 푼 목록은 이미 있는 것을 덮어쓰지 않고
+        넣은 뒤에 스냅샷 게시 목록에서 뺀다 (어느 순간에도 둘 중 하나에는 있다).
+        """
+        posting = self._postings.get(gram)
+        if posting is None:
+            raw = self._raw.get(gram)
+            if raw is None:
+                return self._postings.get(gram)
+            decoded = (_decode("I", raw[0]), _decode("H", raw[1]))
+            posting = self._postings.setdefault(gram, decoded)
+            self._raw.pop(gram, None)
+        return posting
+
+    def _char_posting(self, char: str) -> dict[int, int]:
+        """한 글자가 들어 있는 bigram(과 그 글자)의 게시 목록을 문서별 빈도로 합친다."""
+        merged: dict[int, int] = {}
+        for gram in dict.fromkeys([*self._postings, *self._raw]):
+            if char not in gram:
+                continue
+            posting = self._posting(gram)
+            if posting is None:
+                continue
+            for doc, freq in zip(*posting, strict=True):
+                merged[doc] = merged.get(doc, 0) + freq
+        return merged
+
+    def _add_doc(self, article_id: str, text: str) -> None:
+        if article_id in self._docs:
+            self._remove_doc(article_id)
+        doc = len(self._ids)
+        counts = Counter(tokenize(text))
+        length = sum(counts.values())
+        self._ids.append(article_id)
+        self._docs[article_id] = doc
+        self._lengths.append(length)
+        self._checksums.append(zlib.crc32(text.encode("utf-8")))
+        self._total_length += length
+        for gram, freq in counts.items():
+            posting = self._posting(gram)
+            if posting is None:
+                posting = self._postings[gram] = (array("I"), array("H"))
+            posting[0].append(doc)
+            posting[1].append(min(freq, 0xFFFF))
+
+    def _remove_doc(self, article_id: str) -> None:
+        # 게시 목록에서는 빼지 않고 번호만 비운다 (접을 때 정리)
+        doc = self._docs.pop(article_id)
+        self._ids[doc] = None
+        self._total_length -= self._lengths[doc]
+
+    def _apply(self, op: Mapping[str, Any]) -> None:
+        key = op.get("key")
+        if not isinstance(key, str):
+            return
+        if op.get("op") == journal.DELETE:
+            if key in self._docs:
+                self._remove_doc(key)
+        else:
+            self._add_doc(key, str(op.get("value") or ""))
+
+    def _is_current(self, article_id: str, text: str) -> bool:
+        """기사가 같은 글로 이미 색인되어 있는지 확인한다."""
+        doc = self._docs.get(article_id)
+        return doc is not None and self._checksums[doc] == zlib.crc32(text.encode("utf-8"))
+
+    # ── 파일 ───────────────────────────────────────────────────────
+
+    def _stat_snapshot(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self.snapshot_path.stat()
+        except OSError:
+            return None
+        # 접을 때는 파일을 바꿔 치우므로 inode도 본다
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _is_stale(self) -> bool:
+        """디스크에 아직 읽지 않은 스냅샷이나 변경 기록이 있는지 확인한다 (잠금 없이)."""
+        if not self._loaded or self._stat_snapshot() != self._snapshot_stamp:
+            return True
+        try:
+            return self.journal_path.stat().st_size > self._journal_offset
+        except OSError:
+            return False
+
+    def _load_snapshot(self) -> None:
+        """스냅샷을 읽어 메모리 색인을 교체한다 (변경 기록은 처음부터 다시 읽는다)."""
+        stamp = self._stat_snapshot()
+        data = read_json_verified(self.snapshot_path) if stamp else None
+        self._use_snapshot(data, stamp)
+
+    def _use_snapshot(self, data: Any, stamp: tuple[int, int, int] | None) -> None:
+        """스냅샷 데이터로 메모리 색인을 교체한다."""
+        self._reset()
+        self._snapshot_stamp = stamp
+        self._journal_offset = 0
+        self._journal_ops = 0
+        if data is None:
+            return
+        try:
+            if data["version"] != INDEX_VERSION:
+                raise ValueError(data["version"])
+            self._ids = list(data["ids"])
+            self._lengths = _decode("I", data["lengths"])
+            self._checksums = _decode("I", data["checksums"])
+            self._raw = dict(data["postings"])
+        except (KeyError, TypeError, ValueError):
+            logger.warning("검색 색인 형식이 맞지 않아 무시합니다: %s", self.snapshot_path)
+            self._reset()
+            return
+        self._docs = {article_id: doc for doc, article_id in enumerate(self._ids) if article_id}
+        self._total_length = sum(self._lengths[doc] for doc in self._docs.values())
+
+    def _refresh(self) -> None:
+        """디스크의 스냅샷/변경 기록 중 아직 반영하지 않은 부분을 읽는다 (스레드 잠금 안에서 호출).
+
+        파일 잠금 없이 불러도 된다. 다른 프로세스의 접기는 스냅샷을 바꾼 뒤에
+        변경 기록을 지우므로, 변경 기록을 연 뒤에도 스냅샷이 읽은 것과 같으면
+        연 기록은 그 스냅샷의 것이다. 달라졌으면 스냅샷부터 다시 읽는다.
+        """
+        while True:
+            if not self._loaded or self._stat_snapshot() != self._snapshot_stamp:
+                self._load_snapshot()
+                self._loaded = True
+            try:
+                f = open(self.journal_path, "rb")
+            except FileNotFoundError:
+                return
+            with f:
+                if self._stat_snapshot() != self._snapshot_stamp:
+                    continue
+                f.seek(self._journal_offset)
+                data = f.read()
+            break
+        # 쓰는 도중인 마지막 줄은 다음에 읽는다
+        end = data.rfind(b"\n") + 1
+        for op in journal.parse_ops(data[:end].decode("utf-8", errors="replace")):
+            self._apply(op)
+            self._journal_ops += 1
+        self._journal_offset += end
+
+    def refresh(self) -> None:
+        """다른 프로세스가 바꾼 색인을 읽어 들인다 (읽을 것이 없으면 잠그지 않는다)."""
+        if self._is_stale():
+            with self._lock:
+                self._refresh()
+
+    def _write(self, ops: list[dict[str, Any]]) -> bool:
+        """연산을 변경 기록에 덧붙이고 메모리에 적용한다 (파일 잠금 안에서 호출)."""
+        if not ops:
+            return True
+        if not journal.append_ops(self.journal_path, ops, json_default):
+            logger.warning("검색 색인 기록에 쓰지 못했습니다: %s", self.journal_path)
+            return False
+        # 방금 덧붙인 연산도 다른 프로세스의 기록과 같은 방법으로 읽는다
+        self._refresh()
+        return True
+
+    def _maybe_compact(self) -> None:
+        """변경 기록이 기준보다 커졌으면 백그라운드에서 스냅샷으로 접는다."""
+        if self._journal_ops <= max(COMPACT_MIN_OPS, len(self._docs) * COMPACT_RATIO):
+            return
+        if self._compacting:
+            return
+        self._compacting = True
+        threading.Thread(target=self.compact, name="search-compact", daemon=True).start()
+
+    def _snapshot(self) -> dict[str, Any]:
+        """지운 문서를 빼고 번호를 다시 매긴 스냅샷 데이터를 만든다."""
+        live = [doc for doc, article_id in enumerate(self._ids) if article_id is not None]
+        renumber = len(live) != len(self._ids)
+        new_doc = {doc: i for i, doc in enumerate(live)} if renumber else None
+        postings: dict[str, list[str]] = {}
+        for gram in set(self._postings) | set(self._raw):
+            raw = self._raw.get(gram)
+            if not renumber and raw is not None:
+                postings[gram] = raw
+                continue
+            docs, freqs = self._posting(gram)
+            if renumber:
+                kept = [(new_doc[d], f) for d, f in zip(docs, freqs, strict=True) if d in new_doc]
+                if not kept:
+                    continue
+                docs = array("I", (d for d, _ in kept))
+                freqs = array("H", (f for _, f in kept))
+            postings[gram] = [_encode(docs), _encode(freqs)]
+        return {
+            "version": INDEX_VERSION,
+            "ids": [self._ids[doc] for doc in live],
+            "lengths": _encode(array("I", (self._lengths[doc] for doc in live))),
+            "checksums": _encode(array("I", (self._checksums[doc] for doc in live))),
+            "postings": postings,
+        }
+
+    def _save_snapshot(self) -> bool:
+        """메모리 색인을 스냅샷으로 저장하고 변경 기록을 비운다 (파일 잠금 안에서 호출)."""
+        data = self._snapshot()
+        try:
+            atomic_write_json(self.snapshot_path, data)
+            # 스냅샷에 이미 들어간 연산이므로 비워도 된다 (중단되면 다시 적용해도 결과가 같다)
+            self.journal_path.unlink(missing_ok=True)
+        except (OSError, TypeError):
+            logger.exception("검색 색인을 저장하지 못했습니다: %s", self.snapshot_path)
+            return False
+        # 번호를 다시 매긴 스냅샷으로 메모리 색인도 맞춘다
+        self._use_snapshot(data, self._stat_snapshot())
+        return True
+
+    # ── 공개 API ──────────────────────────────────────────────────
+
+    def add_articles(self, articles: Iterable[Mapping[str, Any]]) -> int:
+        """기사들을 색인에 넣는다 (같은 글로 이미 색인된 기사는 건너뛴다).
+
+        Args:
+            articles: 기사들 (id와 제목/요약)
+
+        Returns:
+            새로 색인하거나 다시 색인한 기사 수
+        """
+        with self._lock, file_lock(self.directory / LOCK_FILENAME):
+            self._refresh()
+            ops: dict[str, dict[str, Any]] = {}
+            for article in articles:
+                article_id = article.get("id")
+                if not article_id:
+                    continue
+                text = article_text(article)
+                if not self._is_current(article_id, text):
+                    ops[article_id] = journal.entry_op(journal.ADD, article_id, text)
+            if not self._write(list(ops.values())):
+                return 0
+            self._maybe_compact()
+            return len(ops)
+
+    def remove_articles(self, article_ids: Iterable[str]) -> int:
+        """기사들을 색인에서 뺀다.
+
+        Args:
+            article_ids: 뺄 기사 ID
+
+        Returns:
+            색인에서 뺀 기사 수
+        """
+        with self._lock, file_lock(self.directory / LOCK_FILENAME):
+            self._refresh()
+            ops = [
+                journal.entry_op(journal.DELETE, article_id)
+                for article_id in dict.fromkeys(article_ids)
+                if article_id in self._docs
+            ]
+            if not self._write(ops):
+                return 0
+            self._maybe_compact()
+            return len(ops)
+
+    def rebuild(self, articles: Iterable[Mapping[str, Any]]) -> bool:
+        """기사들로 색인을 처음부터 다시 만들어 스냅샷으로 저장한다.
+
+        Args:
+            articles: 색인할 전체 기사
+
+        Returns:
+            저장 성공 여부
+        """
+        with self._lock, file_lock(self.directory / LOCK_FILENAME):
+            self._reset()
+            for article in articles:
+                if article.get("id"):
+                    self._add_doc(article["id"], article_text(article))
+            self._loaded = True
+            return self._save_snapshot()
+
+    def compact(self) -> bool:
+        """변경 기록을 스냅샷에 접는다 (지운 기사의 자리도 정리한다).
+
+        Returns:
+            저장 성공 여부
+        """
+        try:
+            with self._lock, file_lock(self.directory / LOCK_FILENAME):
+                self._refresh()
+                return self._save_snapshot()
+        except TimeoutError:
+            logger.warning("검색 색인을 접지 못했습니다 (잠금 대기 시간 초과)")
+            return False
+        finally:
+            self._compacting = False
+
+    def search(
+        self,
+        query: str,
+        limit: int = SEARCH_LIMIT,
+        accept: Callable[[str], bool] | None = None,
+    ) -> list[tuple[str, float]]:
+        """검색어와 관련된 기사를 BM25 점수 순으로 찾는다.
+
+        검색어의 bigram 중 하나라도 들어 있는 기사가 후보가 되며, 많이 겹칠수록,
+        드문 bigram일수록, 짧은 글일수록 점수가 높다. 점수가 같으면 나중에 색인된 기사가 먼저다.
+        한 글자 단어는 그 글자가 들어 있는 bigram을 모두 하나의 단어로 친다.
+        파일 잠금은 잡지 않으며, 다른 프로세스가 덧붙인 기록만 먼저 읽어 들인다.
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+            accept: 결과에 넣을 기사 ID인지 확인하는 함수 (None이면 모두)
+
+        Returns:
+            (기사 ID, 점수) 리스트
+        """
+        grams, chars = query_terms(query)
+        if not (grams or chars) or limit <= 0:
+            return []
+        self.refresh()
+        ranked = self._rank(grams, chars)
+        if ranked is None:
+            # 계산하는 동안 메모리 색인이 바뀌었으면 잠금 안에서 다시 계산한다
+            with self._lock:
+                ranked = self._rank(grams, chars) or []
+        results = []
+        for article_id, score in ranked:
+            if accept is None or accept(article_id):
+                results.append((article_id, score))
+                if len(results) >= limit:
+                    break
+        return results
+
+    def _rank(self, grams: set[str], chars: set[str]) -> list[tuple[str, float]] | None:
+        """검색어의 bigram/한 글자 단어로 (기사 ID, 점수)를 점수 순으로 만든다.
+
+        Returns:
+            결과 리스트 (계산하는 동안 메모리 색인이 통째로 바뀌었으면 None)
+        """
+        generation = self._generation
+        ids = self._ids
+        lengths = self._lengths
+        count = len(self._docs)
+        if not count:
+            return []
+        average = self._total_length / count or 1.0
+        # 검색어 단어마다 (문서 빈도, (문서 번호, 빈도)들)
+        terms: list[tuple[int, Iterable[tuple[int, int]]]] = []
+        for gram in grams:
+            posting = self._posting(gram)
+            if posting is not None:
+                terms.append((len(posting[0]), zip(*posting, strict=True)))
+        for char in chars:
+            merged = self._char_posting(char)
+            terms.append((len(merged), merged.items()))
+        scores: dict[int, float] = {}
+        try:
+            for df, term in terms:
+                # 지운 문서도 게시 목록에 남아 있으므로 문서 빈도는 접기 전까지 약간 크다
+                df = min(df, count)
+                idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+                for doc, freq in term:
+                    if ids[doc] is None:
+                        continue
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc] / average)
+                    scores[doc] = scores.get(doc, 0.0) + idf * freq * (BM25_K1 + 1) / (freq + norm)
+            ranked = sorted(scores.items(), key=lambda item: (item[1], item[0]), reverse=True)
+            results = [(ids[doc], score) for doc, score in ranked]
+        except IndexError:
+            return None
+        if generation != self._generation or None in (article_id for article_id, _ in results):
+            return None
+        return results
+
+
+# 색인 폴더 → 검색 색인 (프로세스 안에서 공유)
+_indexes: dict[Path, SearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index() -> SearchIndex:
+    """공용 기사 저장소 옆의 검색 색인을 반환한다.
+
+    디스크에 색인이 없으면 (처음 실행하거나 이 모듈 이전의 데이터) 저장소의
+    기사 전체로 한 번 만든다.
+    """
+    directory = get_shared_dir() / SEARCH_DIRNAME
+    with _indexes_lock:
+        index = _indexes.get(directory)
+        if index is None:
+            directory.mkdir(parents=True, exist_ok=True)
+            index = _indexes[directory] = SearchIndex(directory)
+            if not index.exists():
+                index.rebuild(load_shared_articles().values())
+    return index
+
+
+def index_shared_articles(article_ids: Iterable[str]) -> int:
+    """공용 저장소에 저장된(병합된) 기사들을 검색 색인에 반영한다.
+
+    Args:
+        article_ids: 추가되거나 병합된 기사 ID
+
+    Returns:
+        새로 색인하거나 다시 색인한 기사 수 (실패하면 0)
+    """
+    try:
+        ids = list(dict.fromkeys(article_ids))
+        if len(ids) >= BULK_LOOKUP_MIN:
+            lookup = load_shared_articles().get
+        else:
+            lookup = get_storage_backend().get_article
+        articles = (lookup(article_id) for article_id in ids)
+        return get_search_index().add_articles(a for a in articles if a is not None)
+    except Exception:
+        logger.exception("검색 색인을 갱신하지 못했습니다")
+        return 0
+
+
+def unindex_shared_articles(article_ids: Iterable[str]) -> int:
+    """저장소에서 빠진 기사들을 검색 색인에서 뺀다 (실패하면 0)."""
+    try:
+        return get_search_index().remove_articles(article_ids)
+    except Exception:
+        logger.exception("검색 색인을 갱신하지 못했습니다")
+        return 0
+
+
+def rebuild_search_index() -> bool:
+    """공용 저장소의 기사 전체로 검색 색인을 다시 만든다."""
+    return get_search_index().rebuild(load_shared_articles().values())
+
+
+def search_articles(
+    query: str,
+    limit: int = SEARCH_LIMIT,
+    accept: Callable[[str], bool] | None = None,
+) -> list[tuple[str, float]]:
+    """공용 기사를 검색한다 (SearchIndex.search() 참고)."""
+    return get_search_index().search(query, limit, accept)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """명령행에서 검색 색인을 다시 만들거나 검색한다."""
+    parser = argparse.ArgumentParser(description="기사 전문 검색 색인")
+    parser.add_argument("--rebuild", action="store_true", help="저장소의 기사 전체로 색인을 다시 만든다")
+    parser.add_argument("--search", help="검색어")
+    parser.add_argument("--limit", type=int, default=SEARCH_LIMIT, help="최대 결과 수")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    if args.rebuild:
+        print("색인을 다시 만들었습니다" if rebuild_search_index() else "색인을 만들지 못했습니다")
+    if args.search is not None:
+        backend = get_storage_backend()
+        for article_id, score in search_articles(args.search, args.limit):
+            article = backend.get_article(article_id) or {}
+            print(f"{score:6.2f}  {article_id}  {(article.get('collected_at') or '')[:10]}  {article.get('title')}")
+    if not args.rebuild and args.search is None:
+        print(f"색인된 기사: {len(get_search_index())}건")
+
+
+if __name__ == "__main__":
+    main()
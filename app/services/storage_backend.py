@@ -0,0 +1,1357 @@
+"""저장소 백엔드 모듈.
+
+뉴스/다이어리/캘린더/사용자 서비스가 사용하는 저장소 인터페이스와
+두 가지 구현을 제공한다.
+
+- JsonBackend: data/ 폴더의 JSON 파일 (기본값, 기존 파일 형식 그대로)
+- SqliteBackend: data/news.db 하나에 저장하며, 기사 ID/카테고리/수집 날짜와
+  사용자별 즐겨찾기에 인덱스를 두어 한 건 조회/수정이 O(log n)이다.
+
+JSON 백엔드는 즐겨찾기/숨김/다이어리 저장/기사 추가를 파일 전체를 다시 쓰지 않고
+변경 기록(journal)에 한 줄씩 추가하며, 기록이 커지면 백그라운드에서 스냅샷으로 접는다.
+
+여러 세션이 같은 문서를 읽고-고치고-저장할 때는 update_document()를 쓴다.
+JSON은 읽은 버전(체크섬, 기록 크기)을 들고 짧은 파일 잠금 안에서 비교해
+다른 세션이 먼저 저장했으면 최신 문서에 연산을 다시 적용하고(낙관적 동시성),
+SQLite는 쓰기 트랜잭션 하나로 처리한다.
+
+JSON 백엔드의 공용 기사는 수집 월별 파일(_shared/news/2026-10.json 등)로 나누고,
+월별 기사 수/날짜별 기사 수를 담은 목록(manifest.json)과 기사 ID → 월 색인(index.json)을 둔다.
+특정 월/날짜 조회는 그 달의 파일만 읽고, 기사 추가/병합은 바뀐 달의 파일만 다시 쓴다.
+
+두 백엔드 모두 통째로 읽는 데이터(문서, 공용 기사 전체)는 읽기 캐시에 두고
+변경할 수 없는 뷰로 반환한다. JSON은 파일 수정 시각/크기, SQLite는 쓰기마다
+올리는 버전 번호로 캐시가 최신인지 확인한다.
+
+백엔드는 NEWS_STORAGE_BACKEND 환경 변수("json", "sqlite")로 고른다.
+"""
+
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+from app.services import journal
+from app.services.read_cache import freeze, get_read_cache, json_default, thaw
+from app.services.safe_file import (
+    atomic_write_json,
+    backup_path,
+    checksum_path,
+    file_lock,
+    read_checksum,
+    read_json_verified,
+)
+
+logger = logging.getLogger(__name__)
+
+# 지원하는 저장소 백엔드
+BACKEND_CHOICES = ("json", "sqlite")
+DEFAULT_BACKEND = "json"
+
+# 공용 기사 저장소 범위(scope) 이름 (data/ 아래 폴더 이름)
+SHARED_SCOPE = "_shared"
+
+# SQLite 데이터베이스 파일 이름 (data/ 아래)
+SQLITE_FILENAME = "news.db"
+
+# 사용자 오버레이 파일 이름 (JSON 백엔드)
+OVERLAY_FILENAME = "news_overlay.json"
+
+# 월별로 나누기 전의 공용 기사 파일 이름 (JSON 백엔드, 처음 읽을 때 월별 파일로 이전)
+ARTICLES_FILENAME = "articles.json"
+
+# 월별 기사 파일 범위 (data/_shared/news/YYYY-MM.json)
+SHARD_SCOPE = f"{SHARED_SCOPE}/news"
+
+# 월별 기사 목록 파일과 기사 ID → 월 색인 파일 이름 (SHARD_SCOPE 아래)
+MANIFEST_FILENAME = "manifest.json"
+SHARD_INDEX_FILENAME = "index.json"
+
+# 수집 시각이 없는 기사를 모으는 월 이름
+UNDATED_MONTH = "undated"
+
+# 변경 기록 파일 접미사 (예: news_overlay.json → news_overlay.journal.jsonl)
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+# 변경 기록을 스냅샷으로 접는 기준: 기록 크기가 이 값과 스냅샷 크기 × 비율 중 큰 값을 넘으면
+COMPACT_MIN_BYTES = 64 * 1024
+COMPACT_RATIO = 0.5
+
+# 잠금 파일 접미사 (예: news_overlay.json → .news_overlay.json.lock)
+LOCK_SUFFIX = ".lock"
+
+# update_document()가 다른 세션과 충돌했을 때 낙관적으로 다시 시도하는 횟수와
+# 첫 대기 시간 상한 (초). 모두 충돌하면 잠금을 잡은 채로 읽고-고치고-저장한다.
+UPDATE_RETRIES = 4
+UPDATE_BACKOFF = 0.002
+
+# 문서 변경 함수: 수정 가능한 현재 문서(없으면 None) -> 저장할 문서
+MutateFunc = Callable[[Any], Any]
+
+# 기사 레코드 병합 함수: (기존 레코드, 새 레코드) -> None (기존 레코드를 갱신)
+MergeFunc = Callable[[dict[str, Any], dict[str, Any]], None]
+
+
+def empty_overlay() -> dict[str, Any]:
+    """빈 사용자 오버레이를 반환한다."""
+    return {"favorites": [], "deleted": [], "cleared_at": None}
+
+
+def _article_categories(article: dict[str, Any]) -> list[str]:
+    """기사가 실린 카테고리 리스트 (여러 카테고리 기사 포함)."""
+    categories = list(article.get("categories") or [])
+    if article.get("category") and article["category"] not in categories:
+        categories.insert(0, article["category"])
+    return categories
+
+
+def article_month(article: Mapping[str, Any]) -> str:
+    """기사의 수집 월(YYYY-MM)을 반환한다 (수집 시각이 없으면 UNDATED_MONTH)."""
+    month = (article.get("collected_at") or "")[:7]
+    if len(month) == 7 and month[4] == "-" and month[:4].isdigit() and month[5:].isdigit():
+        return month
+    return UNDATED_MONTH
+
+
+def _month_order(month: str) -> tuple[bool, str]:
+    """월 정렬 키 (수집 시각이 없는 기사가 가장 먼저)."""
+    return (month != UNDATED_MONTH, month)
+
+
+def _month_summary(articles: Iterable[Mapping[str, Any]]) -> dict[str, Any]:
+    """월별 목록에 기록할 기사 수와 날짜별 기사 수."""
+    dates: dict[str, int] = {}
+    count = 0
+    for article in articles:
+        count += 1
+        date = (article.get("collected_at") or "")[:10]
+        if date:
+            dates[date] = dates.get(date, 0) + 1
+    return {"count": count, "dates": dict(sorted(dates.items()))}
+
+
+class StorageBackend:
+    """저장소 백엔드 인터페이스.
+
+    문서(document)는 다이어리/캘린더/사용자 목록처럼 통째로 읽고 쓰는 데이터이고,
+    기사와 사용자 오버레이(즐겨찾기/삭제 기록)는 한 건 단위로 다룰 수 있다.
+    scope는 사용자 아이디(공용 데이터는 SHARED_SCOPE, 전역 데이터는 None)다.
+
+    read_document()와 load_articles()는 캐시된 읽기 전용 뷰를 반환하므로
+    수정하려면 복사(read_cache.thaw)해서 사용해야 한다.
+    """
+
+    name = ""
+
+    def change_stamp(self, scope: str | None, month: str | None = None) -> Hashable:
+        """scope의 기사/오버레이가 바뀔 때마다 달라지는 값을 반환한다.
+
+        SHARED_SCOPE는 공용 기사, 사용자 아이디는 그 사용자의 오버레이를 뜻한다.
+        month를 주면 공용 기사 중 그 달(YYYY-MM)의 기사만 본다.
+        읽기 캐시가 데이터를 다시 읽지 않고 최신인지 확인하는 데 사용한다.
+        """
+        raise NotImplementedError
+
+    # ── 문서 ──────────────────────────────────────────────────────
+
+    def read_document(self, scope: str | None, name: str) -> Any:
+        """문서를 읽는다 (없거나 손상되었으면 None)."""
+        raise NotImplementedError
+
+    def write_document(self, scope: str | None, name: str, data: Any) -> bool:
+        """문서를 통째로 저장한다."""
+        raise NotImplementedError
+
+    def update_document(self, scope: str | None, name: str, mutate: MutateFunc) -> Any:
+        """문서를 읽어 mutate를 적용한 결과를 다른 세션의 저장과 겹치지 않게 저장한다.
+
+        다른 세션이 먼저 저장하면 최신 문서로 mutate를 다시 호출하므로
+        mutate는 인자로 받은 문서만 보고 결과를 만들어야 한다.
+
+        Returns:
+            저장한 문서 (저장하지 못했으면 None)
+        """
+        document = mutate(thaw(self.read_document(scope, name)))
+        return document if self.write_document(scope, name, document) else None
+
+    def append_ops(self, scope: str | None, name: str, ops: list[dict[str, Any]]) -> bool:
+        """문서에 변경 연산(journal 모듈)을 적용해 저장한다.
+
+        기본 구현은 update_document()로 읽고 적용한 뒤 통째로 저장한다.
+        """
+        if not ops:
+            return True
+        default = empty_overlay if name == OVERLAY_FILENAME else dict
+        result = self.update_document(
+            scope, name, lambda document: journal.apply_ops(document, ops, default)
+        )
+        return result is not None
+
+    # ── 공용 기사 ──────────────────────────────────────────────────
+
+    def article_months(self) -> list[str]:
+        """공용 기사가 있는 수집 월(YYYY-MM) 리스트를 오래된 순으로 반환한다."""
+        raise NotImplementedError
+
+    def load_articles(self, months: Iterable[str] | None = None) -> Mapping[str, dict[str, Any]]:
+        """공용 기사를 수집 월, 수집 순서대로 반환한다 (key: 기사 ID).
+
+        Args:
+            months: 읽을 수집 월 (None이면 전체)
+        """
+        raise NotImplementedError
+
+    def save_articles(self, articles: dict[str, dict[str, Any]]) -> bool:
+        """공용 기사 전체를 교체한다."""
+        raise NotImplementedError
+
+    def upsert_articles(self, articles: Iterable[dict[str, Any]], merge: MergeFunc) -> int:
+        """기사를 추가하고, 이미 있는 기사는 merge로 병합한다.
+
+        Returns:
+            새로 추가된 기사 수 (저장하지 못했으면 0)
+        """
+        raise NotImplementedError
+
+    def remove_articles(self, article_ids: Iterable[str]) -> int:
+        """공용 기사를 저장소에서 지운다 (보존 기간이 지난 기사 보관 등).
+
+        Returns:
+            지운 기사 수 (지우지 못했으면 0)
+        """
+        raise NotImplementedError
+
+    def get_article(self, article_id: str) -> dict[str, Any] | None:
+        """ID로 공용 기사를 조회한다."""
+        raise NotImplementedError
+
+    def query_articles(
+        self, category: str | None = None, date: str | None = None, month: str | None = None
+    ) -> list[dict[str, Any]]:
+        """카테고리/수집 날짜(YYYY-MM-DD)/수집 월(YYYY-MM)로 공용 기사를 조회한다 (수집 순서)."""
+        raise NotImplementedError
+
+    # ── 사용자 오버레이 ─────────────────────────────────────────────
+
+    def load_overlay(self, user: str) -> dict[str, Any] | None:
+        """사용자 오버레이를 읽는다 (한 번도 저장하지 않았으면 None)."""
+        raise NotImplementedError
+
+    def save_overlay(self, user: str, overlay: dict[str, Any]) -> bool:
+        """사용자 오버레이를 통째로 저장한다."""
+        raise NotImplementedError
+
+    def update_overlay(self, user: str, mutate: MutateFunc) -> dict[str, Any] | None:
+        """사용자 오버레이를 update_document()처럼 읽고-고치고-저장한다.
+
+        mutate는 빈 오버레이 형식이 보장된 현재 오버레이를 받는다.
+        """
+        overlay = mutate(self.load_overlay(user) or empty_overlay())
+        return overlay if self.save_overlay(user, overlay) else None
+
+    def get_article_flags(self, user: str, article_id: str) -> dict[str, Any]:
+        """기사 하나에 대한 사용자 상태를 반환한다.
+
+        Returns:
+            {"is_favorite": bool, "is_deleted": bool, "is_visible": bool,
+            "cleared_at": str | None} (is_visible이면 cleared_at 이전 기사도 보인다)
+        """
+        raise NotImplementedError
+
+    def apply_overlay_ops(self, user: str, ops: list[dict[str, Any]]) -> bool:
+        """사용자 오버레이에 기사 연산(journal.article_op)들을 한 번의 저장으로 적용한다.
+
+        기본 구현은 update_overlay()로 읽고 적용한 뒤 통째로 저장한다.
+        """
+        if not ops:
+            return True
+        result = self.update_overlay(
+            user, lambda overlay: journal.apply_ops(overlay, ops, empty_overlay)
+        )
+        return result is not None
+
+    def set_favorite(self, user: str, article_id: str, value: bool) -> bool:
+        """기사 하나의 즐겨찾기 상태를 바꾼다."""
+        return self.apply_overlay_ops(
+            user, [journal.article_op(journal.FAVORITE, article_id, value)]
+        )
+
+    def hide_articles(self, user: str, article_ids: Iterable[str]) -> bool:
+        """기사들을 사용자 목록에서 숨긴다 (즐겨찾기도 해제)."""
+        return self.apply_overlay_ops(
+            user, [journal.article_op(journal.DELETE, article_id) for article_id in article_ids]
+        )
+
+    def list_users(self) -> list[str]:
+        """기사 오버레이나 문서가 있는 사용자 아이디를 반환한다."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """열린 자원을 정리한다."""
+
+
+class JsonBackend(StorageBackend):
+    """data/ 폴더의 JSON 파일 저장소 (기본 백엔드).
+
+    문서마다 스냅샷(<이름>.json)과 변경 기록(<이름>.journal.jsonl)을 두며,
+    읽을 때 스냅샷에 기록을 적용한 결과를 반환한다. 스냅샷은 safe_file로
+    원자적으로 저장하고, 손상되었으면 이전 세대(.bak)를 사용한다.
+
+    공용 기사는 수집 월별 문서(SHARD_SCOPE/YYYY-MM.json)에 나눠 두며,
+    월별 문서를 고치는 작업은 모두 월별 목록(manifest) 잠금 안에서 한다.
+    """
+
+    name = "json"
+
+    def __init__(self, data_dir: Path) -> None:
+        """JSON 파일 저장소를 생성한다.
+
+        Args:
+            data_dir: 데이터 루트 폴더
+        """
+        self.data_dir = data_dir
+        # 충돌로 update_document()를 다시 시도한 횟수 (동시성 측정용)
+        self.conflicts = 0
+        # 이 프로세스에서 쓴 횟수 (수정 시각 해상도 안에서 연달아 쓴 경우 구분)
+        self._versions: dict[Path, int] = {}
+        self._compacting: set[Path] = set()
+        self._state_lock = threading.Lock()
+        # 스레드가 이미 잡고 있는 문서 잠금 (같은 잠금을 다시 잡지 않도록)
+        self._held = threading.local()
+        # 이전 형식의 공용 기사 파일을 월별 파일로 옮겼는지 확인했는지
+        self._sharded = False
+
+    def _path(self, scope: str | None, name: str) -> Path:
+        directory = self.data_dir / scope if scope else self.data_dir
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory / name
+
+    @staticmethod
+    def _journal_path(path: Path) -> Path:
+        return path.with_name(path.stem + JOURNAL_SUFFIX)
+
+    @contextmanager
+    def _locked(self, path: Path) -> Iterator[None]:
+        """문서의 커밋 구간을 다른 프로세스/스레드와 배타적으로 잠근다 (재진입 가능)."""
+        held = self._held.__dict__.setdefault("paths", set())
+        if path in held:
+            yield
+            return
+        with file_lock(path.with_name("." + path.name + LOCK_SUFFIX)):
+            held.add(path)
+            try:
+                yield
+            finally:
+                held.discard(path)
+
+    def _version(self, path: Path) -> Hashable:
+        """문서 내용이 바뀌면 달라지는 버전 (스냅샷 체크섬, 변경 기록 크기)."""
+        snapshot = read_checksum(path)
+        if snapshot is None:
+            try:
+                stat = path.stat()
+                snapshot = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                snapshot = None
+        try:
+            journal_size = self._journal_path(path).stat().st_size
+        except OSError:
+            journal_size = 0
+        return (snapshot, journal_size)
+
+    def _stamp(self, path: Path) -> Hashable:
+        """문서의 (스냅샷, 이전 세대, 변경 기록)별 (수정 시각, 크기)와 버전, 쓰기 횟수.
+
+        파일이 하나도 없으면 None.
+        """
+        stamps = []
+        for file_path in (path, backup_path(path), self._journal_path(path)):
+            try:
+                stat = file_path.stat()
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamps.append(None)
+        if stamps == [None, None, None]:
+            return None
+        return (*stamps, read_checksum(path), self._versions.get(path, 0))
+
+    def _touch(self, path: Path) -> None:
+        with self._state_lock:
+            self._versions[path] = self._versions.get(path, 0) + 1
+
+    def change_stamp(self, scope: str | None, month: str | None = None) -> Hashable:
+        if scope != SHARED_SCOPE:
+            return self._stamp(self._path(scope, OVERLAY_FILENAME))
+        self._ensure_sharded()
+        name = MANIFEST_FILENAME if month is None else self._shard_name(month)
+        return self._stamp(self._path(SHARD_SCOPE, name))
+
+    def read_document(self, scope: str | None, name: str) -> Any:
+        path = self._path(scope, name)
+        stamp = self._stamp(path)
+        if stamp is None:
+            return None
+        return get_read_cache().get(
+            ("json", str(path)), stamp, lambda: freeze(self._load(path, name))
+        )
+
+    def _load(self, path: Path, name: str) -> Any:
+        """스냅샷에 변경 기록을 적용한 문서를 반환한다 (없거나 손상되었으면 None)."""
+        document = self._parse(path)
+        ops = journal.read_ops(self._journal_path(path))
+        default = empty_overlay if name == OVERLAY_FILENAME else dict
+        return journal.apply_ops(document, ops, default)
+
+    @staticmethod
+    def _parse(path: Path) -> Any:
+        """스냅샷의 유효한 최신 세대를 읽는다 (없거나 모두 손상되었으면 None)."""
+        return read_json_verified(path)
+
+    def _replace(self, path: Path, data: Any) -> None:
+        """스냅샷을 원자적으로 교체하고 변경 기록을 비운다 (잠금 안에서 호출)."""
+        try:
+            atomic_write_json(path, data, default=json_default)
+            # 새 스냅샷이 이전 기록을 모두 포함하므로 기록을 비운다
+            self._journal_path(path).unlink(missing_ok=True)
+        finally:
+            self._touch(path)
+
+    def write_document(self, scope: str | None, name: str, data: Any) -> bool:
+        path = self._path(scope, name)
+        try:
+            with self._locked(path):
+                self._replace(path, data)
+            return True
+        except OSError:
+            return False
+
+    def update_document(self, scope: str | None, name: str, mutate: MutateFunc) -> Any:
+        path = self._path(scope, name)
+        for attempt in range(UPDATE_RETRIES):
+            version = self._version(path)
+            document = mutate(thaw(self.read_document(scope, name)))
+            try:
+                with self._locked(path):
+                    # 읽은 뒤 다른 세션이 저장하지 않았을 때만 커밋한다
+                    if self._version(path) == version:
+                        self._replace(path, document)
+                        return document
+            except OSError:
+                return None
+            with self._state_lock:
+                self.conflicts += 1
+            time.sleep(random.uniform(0, UPDATE_BACKOFF * 2 ** attempt))
+
+        # 경합이 심하면 잠금 안에서 처리해 반드시 진행되게 한다
+        logger.info("충돌이 계속되어 잠금을 잡고 저장합니다: %s", path)
+        try:
+            with self._locked(path):
+                document = mutate(thaw(self.read_document(scope, name)))
+                self._replace(path, document)
+            return document
+        except OSError:
+            return None
+
+    def append_ops(self, scope: str | None, name: str, ops: list[dict[str, Any]]) -> bool:
+        path = self._path(scope, name)
+        try:
+            with self._locked(path):
+                ok = self._append(path, ops)
+        except OSError:
+            return False
+        if ok:
+            self._maybe_compact(path, name)
+        return ok
+
+    def _append(self, path: Path, ops: list[dict[str, Any]]) -> bool:
+        """변경 기록 끝에 연산을 추가한다 (잠금 안에서 호출)."""
+        try:
+            return journal.append_ops(self._journal_path(path), ops, json_default)
+        finally:
+            self._touch(path)
+
+    def _maybe_compact(self, path: Path, name: str) -> None:
+        """변경 기록이 기준보다 커졌으면 백그라운드에서 스냅샷으로 접는다."""
+        try:
+            journal_size = self._journal_path(path).stat().st_size
+            snapshot_size = path.stat().st_size if path.exists() else 0
+        except OSError:
+            return
+        if journal_size <= max(COMPACT_MIN_BYTES, snapshot_size * COMPACT_RATIO):
+            return
+        with self._state_lock:
+            if path in self._compacting:
+                return
+            self._compacting.add(path)
+        threading.Thread(target=self.compact, args=(path, name), daemon=True).start()
+
+    def compact(self, path: Path, name: str) -> bool:
+        """문서의 변경 기록을 스냅샷에 접고 기록을 비운다.
+
+        Args:
+            path: 스냅샷 경로
+            name: 문서 이름 (빈 문서 기본값 결정에 사용)
+
+        Returns:
+            성공 여부
+        """
+        try:
+            with self._locked(path):
+                if not self._journal_path(path).exists():
+                    return True
+                self._replace(path, self._load(path, name))
+                return True
+        except OSError:
+            return False
+        finally:
+            with self._state_lock:
+                self._compacting.discard(path)
+
+    def compact_all(self) -> int:
+        """모든 문서의 변경 기록을 접고 접은 문서 수를 반환한다."""
+        count = 0
+        for journal_path in self.data_dir.rglob("*" + JOURNAL_SUFFIX):
+            name = journal_path.name[: -len(JOURNAL_SUFFIX)] + ".json"
+            if self.compact(journal_path.with_name(name), name):
+                count += 1
+        return count
+
+    @staticmethod
+    def _shard_name(month: str) -> str:
+        return f"{month}.json"
+
+    def _ensure_sharded(self) -> None:
+        """월별로 나누기 전의 공용 기사 파일이 남아 있으면 월별 파일로 옮긴다.
+
+        옮긴 파일은 articles.json.migrated로 이름을 바꾼다.
+        """
+        if self._sharded:
+            return
+        legacy = self._path(SHARED_SCOPE, ARTICLES_FILENAME)
+        manifest_path = self._path(SHARD_SCOPE, MANIFEST_FILENAME)
+        try:
+            with self._locked(manifest_path):
+                if legacy.exists() and not manifest_path.exists():
+                    articles = self._load(legacy, ARTICLES_FILENAME)
+                    self._write_shards(articles if isinstance(articles, Mapping) else {})
+                    legacy.replace(legacy.with_name(legacy.name + ".migrated"))
+                    self._journal_path(legacy).unlink(missing_ok=True)
+                    logger.info("공용 기사를 월별 파일로 옮겼습니다: %s", legacy)
+            self._sharded = True
+        except OSError as e:
+            logger.warning("공용 기사를 월별 파일로 옮기지 못했습니다: %s", e)
+
+    def _manifest(self) -> Mapping[str, Any]:
+        """월별 목록 {월: {"count": 기사 수, "dates": {날짜: 기사 수}}}을 반환한다."""
+        self._ensure_sharded()
+        return self._read_manifest()
+
+    def _read_manifest(self) -> Mapping[str, Any]:
+        data = self.read_document(SHARD_SCOPE, MANIFEST_FILENAME)
+        months = data.get("months") if isinstance(data, Mapping) else None
+        return months if isinstance(months, Mapping) else {}
+
+    def _shard_index(self) -> Mapping[str, str]:
+        """기사 ID → 수집 월 색인을 반환한다."""
+        data = self.read_document(SHARD_SCOPE, SHARD_INDEX_FILENAME)
+        return data if isinstance(data, Mapping) else {}
+
+    def _read_shard(self, month: str) -> Mapping[str, dict[str, Any]]:
+        data = self.read_document(SHARD_SCOPE, self._shard_name(month))
+        return data if isinstance(data, Mapping) else {}
+
+    def _remove(self, path: Path) -> None:
+        """문서의 스냅샷, 이전 세대, 체크섬, 변경 기록을 지운다 (잠금 안에서 호출)."""
+        try:
+            for file_path in (path, backup_path(path), self._journal_path(path)):
+                file_path.unlink(missing_ok=True)
+                checksum_path(file_path).unlink(missing_ok=True)
+        finally:
+            self._touch(path)
+
+    def _write_shards(self, articles: Mapping[str, Mapping[str, Any]]) -> None:
+        """공용 기사 전체를 월별 문서, 색인, 월별 목록으로 저장한다 (목록 잠금 안에서 호출)."""
+        shards: dict[str, dict[str, Any]] = {}
+        for article_id, article in articles.items():
+            shards.setdefault(article_month(article), {})[article_id] = article
+        for month in self._read_manifest().keys() - shards.keys():
+            self._remove(self._path(SHARD_SCOPE, self._shard_name(month)))
+        for month, shard in shards.items():
+            path = self._path(SHARD_SCOPE, self._shard_name(month))
+            with self._locked(path):
+                self._replace(path, shard)
+        index_path = self._path(SHARD_SCOPE, SHARD_INDEX_FILENAME)
+        with self._locked(index_path):
+            self._replace(
+                index_path,
+                {article_id: month for month, shard in shards.items() for article_id in shard},
+            )
+        months = {month: _month_summary(shard.values()) for month, shard in shards.items()}
+        self._replace(self._path(SHARD_SCOPE, MANIFEST_FILENAME), {"months": months})
+
+    def article_months(self) -> list[str]:
+        return sorted(self._manifest(), key=_month_order)
+
+    def load_articles(self, months: Iterable[str] | None = None) -> Mapping[str, dict[str, Any]]:
+        months = self.article_months() if months is None else sorted(set(months), key=_month_order)
+        if len(months) == 1:
+            return self._read_shard(months[0])
+
+        def load() -> Mapping[str, dict[str, Any]]:
+            articles: dict[str, dict[str, Any]] = {}
+            for month in months:
+                articles.update(self._read_shard(month))
+            return MappingProxyType(articles)
+
+        # 월별 문서는 각자 캐시되고, 합친 결과는 모든 달의 스탬프가 같을 때만 재사용한다
+        stamp = tuple(self.change_stamp(SHARED_SCOPE, month) for month in months)
+        return get_read_cache().get(
+            ("json", str(self.data_dir / SHARD_SCOPE), tuple(months)), stamp, load
+        )
+
+    def save_articles(self, articles: dict[str, dict[str, Any]]) -> bool:
+        self._ensure_sharded()
+        try:
+            with self._locked(self._path(SHARD_SCOPE, MANIFEST_FILENAME)):
+                self._write_shards(articles)
+            return True
+        except OSError:
+            return False
+
+    def upsert_articles(self, articles: Iterable[dict[str, Any]], merge: MergeFunc) -> int:
+        self._ensure_sharded()
+        manifest_path = self._path(SHARD_SCOPE, MANIFEST_FILENAME)
+        try:
+            # 병합 결과가 다른 세션의 병합을 덮지 않도록 최신 기사를 잠금 안에서 읽는다
+            with self._locked(manifest_path):
+                index = self._shard_index()
+                shards: dict[str, Mapping[str, dict[str, Any]]] = {}
+                pending: dict[str, dict[str, dict[str, Any]]] = {}
+                removed: dict[str, set[str]] = {}
+                months: dict[str, str | None] = {}
+                added = 0
+                for article in articles:
+                    article_id = article["id"]
+                    month = months.get(article_id) or index.get(article_id)
+                    current = None
+                    if month is not None:
+                        if month not in shards:
+                            shards[month] = self._read_shard(month)
+                        current = pending.get(month, {}).get(article_id) or shards[month].get(article_id)
+                    if current is None:
+                        month = article_month(article)
+                        pending.setdefault(month, {})[article_id] = article
+                        months[article_id] = month
+                        added += 1
+                        continue
+                    before = thaw(current)
+                    merged = thaw(current)
+                    merge(merged, article)
+                    if merged == before:
+                        continue
+                    target = article_month(merged)
+                    if target != month:
+                        # 더 이른 수집 시각으로 병합되면 그 달의 문서로 옮긴다
+                        removed.setdefault(month, set()).add(article_id)
+                        pending.get(month, {}).pop(article_id, None)
+                        months[article_id] = target
+                    pending.setdefault(target, {})[article_id] = merged
+
+                touched = self._commit_articles(shards, pending, removed, months)
+        except OSError as e:
+            # 잠금 시간 초과(TimeoutError)도 OSError다
+            logger.warning("공용 기사를 저장하지 못했습니다: %s", e)
+            return 0
+        for path in touched:
+            self._maybe_compact(path, path.name)
+        return added
+
+    def _commit_articles(
+        self,
+        shards: dict[str, Mapping[str, dict[str, Any]]],
+        pending: dict[str, dict[str, dict[str, Any]]],
+        removed: dict[str, set[str]],
+        months: dict[str, str | None],
+    ) -> list[Path]:
+        """기사 변경을 월별 문서, 색인, 월별 목록에 기록한다 (목록 잠금 안에서 호출).
+
+        Args:
+            shards: 이미 읽은 월별 문서 (월 → 기사)
+            pending: 월 → {기사 ID: 저장할 레코드}
+            removed: 월 → 그 달의 문서에서 뺄 기사 ID
+            months: 색인에서 바꿀 기사 ID → 월 (None이면 색인에서 삭제)
+
+        Returns:
+            기록한 문서 경로 (변경 기록을 접을 대상)
+        """
+        touched: list[Path] = []
+        summaries = dict(self._read_manifest())
+        for month in pending.keys() | removed.keys():
+            path = self._path(SHARD_SCOPE, self._shard_name(month))
+            shard = shards[month] if month in shards else self._read_shard(month)
+            records = pending.get(month, {})
+            gone = removed.get(month, set()) & shard.keys()
+            ops = [journal.entry_op(journal.DELETE, article_id) for article_id in gone]
+            ops += [
+                journal.entry_op(
+                    journal.UPDATE if article_id in shard else journal.ADD, article_id, record
+                )
+                for article_id, record in records.items()
+            ]
+            if not ops:
+                continue
+            document = {i: a for i, a in shard.items() if i not in gone}
+            document.update(records)
+            with self._locked(path):
+                if len(ops) > len(shard) * COMPACT_RATIO:
+                    # 대량 변경은 기록을 쌓는 것보다 스냅샷을 한 번 쓰는 편이 읽기에 유리하다
+                    self._replace(path, document)
+                else:
+                    self._append(path, ops)
+            touched.append(path)
+            summaries[month] = _month_summary(document.values())
+
+        if months:
+            index_path = self._path(SHARD_SCOPE, SHARD_INDEX_FILENAME)
+            index = self._shard_index()
+            with self._locked(index_path):
+                if len(months) > len(index) * COMPACT_RATIO:
+                    updated = {**index, **months}
+                    self._replace(
+                        index_path, {i: m for i, m in updated.items() if m is not None}
+                    )
+                else:
+                    self._append(index_path, [
+                        journal.entry_op(journal.UPDATE, i, m)
+                        if m is not None else journal.entry_op(journal.DELETE, i)
+                        for i, m in months.items()
+                    ])
+            touched.append(index_path)
+        if touched:
+            summaries = {m: v for m, v in summaries.items() if v["count"]}
+            self._replace(self._path(SHARD_SCOPE, MANIFEST_FILENAME), {"months": summaries})
+        return touched
+
+    def remove_articles(self, article_ids: Iterable[str]) -> int:
+        self._ensure_sharded()
+        try:
+            with self._locked(self._path(SHARD_SCOPE, MANIFEST_FILENAME)):
+                index = self._shard_index()
+                removed: dict[str, set[str]] = {}
+                months: dict[str, str | None] = {}
+                for article_id in article_ids:
+                    month = index.get(article_id)
+                    if month is not None:
+                        removed.setdefault(month, set()).add(article_id)
+                        months[article_id] = None
+                touched = self._commit_articles({}, {}, removed, months)
+        except OSError as e:
+            logger.warning("공용 기사를 지우지 못했습니다: %s", e)
+            return 0
+        for path in touched:
+            self._maybe_compact(path, path.name)
+        return len(months)
+
+    def list_users(self) -> list[str]:
+        users = []
+        for directory in self.data_dir.iterdir():
+            if not directory.is_dir() or directory.name == SHARED_SCOPE:
+                continue
+            if any(directory.glob("*.json")) or any(directory.glob("*" + JOURNAL_SUFFIX)):
+                users.append(directory.name)
+        return sorted(users)
+
+    def get_article(self, article_id: str) -> dict[str, Any] | None:
+        self._ensure_sharded()
+        month = self._shard_index().get(article_id)
+        if month is None:
+            return None
+        return self._read_shard(month).get(article_id)
+
+    def query_articles(
+        self, category: str | None = None, date: str | None = None, month: str | None = None
+    ) -> list[dict[str, Any]]:
+        if date is not None:
+            month = date[:7]
+        months = self.article_months() if month is None else [month]
+        return [
+            article
+            for month in months
+            for article in self._read_shard(month).values()
+            if (category is None or category in _article_categories(article))
+            and (date is None or article.get("collected_at", "").startswith(date))
+        ]
+
+    def load_overlay(self, user: str) -> dict[str, Any] | None:
+        data = self.read_document(user, OVERLAY_FILENAME)
+        if not isinstance(data, Mapping):
+            return None
+        overlay = empty_overlay()
+        overlay.update(thaw(data))
+        return overlay
+
+    def save_overlay(self, user: str, overlay: dict[str, Any]) -> bool:
+        return self.write_document(user, OVERLAY_FILENAME, overlay)
+
+    def update_overlay(self, user: str, mutate: MutateFunc) -> dict[str, Any] | None:
+        def apply(document: Any) -> dict[str, Any]:
+            overlay = empty_overlay()
+            if isinstance(document, dict):
+                overlay.update(document)
+            return mutate(overlay)
+
+        return self.update_document(user, OVERLAY_FILENAME, apply)
+
+    def get_article_flags(self, user: str, article_id: str) -> dict[str, Any]:
+        favorites, deleted, cleared_at, visible = self._overlay_sets(user)
+        return {
+            "is_favorite": article_id in favorites,
+            "is_deleted": article_id in deleted,
+            "is_visible": article_id in visible,
+            "cleared_at": cleared_at,
+        }
+
+    def _overlay_sets(
+        self, user: str
+    ) -> tuple[frozenset[str], frozenset[str], str | None, frozenset[str]]:
+        """오버레이의 즐겨찾기/삭제 ID 집합, 전체 삭제 시각, 보이는 기사 ID 집합을 반환한다 (오버레이가 바뀔 때만 다시 만든다)."""
+        path = self._path(user, OVERLAY_FILENAME)
+
+        def build() -> tuple[frozenset[str], frozenset[str], str | None, frozenset[str]]:
+            overlay = self.read_document(user, OVERLAY_FILENAME)
+            if not isinstance(overlay, Mapping):
+                return frozenset(), frozenset(), None, frozenset()
+            return (
+                frozenset(overlay.get("favorites") or ()),
+                frozenset(overlay.get("deleted") or ()),
+                overlay.get("cleared_at"),
+                frozenset(overlay.get("visible") or ()),
+            )
+
+        return get_read_cache().get(("overlay_sets", str(path)), self._stamp(path), build)
+
+    def apply_overlay_ops(self, user: str, ops: list[dict[str, Any]]) -> bool:
+        return self.append_ops(user, OVERLAY_FILENAME, ops)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    scope TEXT NOT NULL,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (scope, name)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS articles (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    category TEXT,
+    collected_date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_category ON articles (category);
+CREATE INDEX IF NOT EXISTS idx_articles_collected_date ON articles (collected_date);
+
+CREATE TABLE IF NOT EXISTS article_categories (
+    category TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    PRIMARY KEY (category, article_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS user_articles (
+    user TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    is_favorite INTEGER NOT NULL DEFAULT 0,
+    is_deleted INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user, article_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_user_articles_favorite ON user_articles (user, is_favorite);
+
+CREATE TABLE IF NOT EXISTS user_state (
+    user TEXT PRIMARY KEY,
+    cleared_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS user_visible (
+    user TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    PRIMARY KEY (user, article_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class SqliteBackend(StorageBackend):
+    """SQLite 데이터베이스 하나에 모든 데이터를 두는 저장소."""
+
+    name = "sqlite"
+
+    def __init__(self, db_path: Path) -> None:
+        """SQLite 저장소를 생성한다 (스키마는 처음 연결할 때 만든다).
+
+        Args:
+            db_path: 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결을 반환한다."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _version_key(scope: str | None, month: str | None = None) -> str:
+        """change_stamp()가 읽는 meta 버전 키.
+
+        JsonBackend가 파일마다 스탬프를 두는 것처럼 공용 기사는 전체/수집 월별로,
+        사용자 오버레이는 사용자별로 버전을 따로 둔다.
+        """
+        if scope == SHARED_SCOPE:
+            return "articles" if month is None else f"articles|{month}"
+        return f"overlay|{scope or ''}"
+
+    @staticmethod
+    def _document_key(scope: str | None, name: str) -> str:
+        """문서 버전의 meta 키."""
+        return f"document|{scope or ''}|{name}"
+
+    @staticmethod
+    def _row_month(collected_date: str | None) -> str:
+        """articles.collected_date의 수집 월 (article_months()와 같은 계산)."""
+        return (collected_date or "")[:7] or UNDATED_MONTH
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, *keys: str) -> None:
+        """쓰기 트랜잭션 안에서 키들의 버전을 올린다 (다른 프로세스의 캐시도 무효화)."""
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, 1) "
+            "ON CONFLICT (key) DO UPDATE SET value = value + 1",
+            [(key,) for key in dict.fromkeys(keys)],
+        )
+
+    def _bump_articles(self, conn: sqlite3.Connection, months: Iterable[str]) -> None:
+        """공용 기사 전체와 바뀐 수집 월의 버전을 올린다."""
+        self._bump(
+            conn,
+            self._version_key(SHARED_SCOPE),
+            *(self._version_key(SHARED_SCOPE, month) for month in months),
+        )
+
+    def _version(self, key: str) -> Hashable:
+        row = self._conn().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return (str(self.db_path), key, row[0] if row else 0)
+
+    def change_stamp(self, scope: str | None, month: str | None = None) -> Hashable:
+        return self._version(self._version_key(scope, month))
+
+    def read_document(self, scope: str | None, name: str) -> Any:
+        return get_read_cache().get(
+            ("sqlite", str(self.db_path), scope or "", name),
+            self._version(self._document_key(scope, name)),
+            lambda: self._read_document(scope, name),
+        )
+
+    def _read_document(self, scope: str | None, name: str) -> Any:
+        row = self._conn().execute(
+            "SELECT data FROM documents WHERE scope = ? AND name = ?",
+            (scope or "", name),
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return freeze(json.loads(row[0]))
+        except json.JSONDecodeError:
+            return None
+
+    def write_document(self, scope: str | None, name: str, data: Any) -> bool:
+        try:
+            with self._conn() as conn:
+                self._write_document(conn, scope, name, data)
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _write_document(
+        self, conn: sqlite3.Connection, scope: str | None, name: str, data: Any
+    ) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO documents (scope, name, data) VALUES (?, ?, ?)",
+            (scope or "", name, json.dumps(data, ensure_ascii=False, default=json_default)),
+        )
+        self._bump(conn, self._document_key(scope, name))
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        """처음부터 쓰기 잠금을 잡는 트랜잭션 (읽고-고치고-저장이 다른 연결과 겹치지 않음)."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def update_document(self, scope: str | None, name: str, mutate: MutateFunc) -> Any:
+        try:
+            with self._write_transaction() as conn:
+                document = mutate(thaw(self._read_document(scope, name)))
+                self._write_document(conn, scope, name, document)
+            return document
+        except sqlite3.Error:
+            return None
+
+    @staticmethod
+    def _write_article(conn: sqlite3.Connection, article: dict[str, Any]) -> str:
+        """기사 한 건과 카테고리 색인을 저장하고 수집 월을 반환한다 (수집 순서 seq는 유지)."""
+        collected_date = (article.get("collected_at") or "")[:10]
+        conn.execute(
+            "INSERT INTO articles (id, category, collected_date, data) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET category = excluded.category, "
+            "collected_date = excluded.collected_date, data = excluded.data",
+            (
+                article["id"],
+                article.get("category"),
+                collected_date,
+                json.dumps(article, ensure_ascii=False, default=json_default),
+            ),
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO article_categories (category, article_id) VALUES (?, ?)",
+            [(category, article["id"]) for category in _article_categories(article)],
+        )
+        return SqliteBackend._row_month(collected_date)
+
+    @staticmethod
+    def _month_clause(months: Iterable[str]) -> tuple[str, list[str]]:
+        """수집 월 조건 SQL과 인자 (collected_date 색인을 쓰는 범위 조건)."""
+        clauses = []
+        params: list[str] = []
+        for month in months:
+            if month == UNDATED_MONTH:
+                clauses.append("a.collected_date = ''")
+            else:
+                clauses.append("a.collected_date BETWEEN ? AND ?")
+                params += [f"{month}-01", f"{month}-31"]
+        return "(" + " OR ".join(clauses or ["0"]) + ")", params
+
+    def article_months(self) -> list[str]:
+        def load() -> tuple[str, ...]:
+            rows = self._conn().execute(
+                "SELECT DISTINCT substr(collected_date, 1, 7) FROM articles"
+            )
+            return tuple(month or UNDATED_MONTH for (month,) in rows)
+
+        months = get_read_cache().get(
+            ("sqlite", str(self.db_path), SHARED_SCOPE, "months"),
+            self.change_stamp(SHARED_SCOPE),
+            load,
+        )
+        return sorted(months, key=_month_order)
+
+    def load_articles(self, months: Iterable[str] | None = None) -> Mapping[str, dict[str, Any]]:
+        months = None if months is None else tuple(sorted(set(months), key=_month_order))
+        if months is None:
+            stamp = self.change_stamp(SHARED_SCOPE)
+        else:
+            # 일부 달만 읽은 결과는 다른 달의 기사가 바뀌어도 다시 읽지 않는다
+            stamp = tuple(self.change_stamp(SHARED_SCOPE, month) for month in months)
+        return get_read_cache().get(
+            ("sqlite", str(self.db_path), SHARED_SCOPE, "articles", months),
+            stamp,
+            lambda: self._load_articles(months),
+        )
+
+    def _load_articles(self, months: tuple[str, ...] | None) -> Mapping[str, dict[str, Any]]:
+        sql = "SELECT a.id, a.data FROM articles a"
+        params: list[str] = []
+        if months is not None:
+            clause, params = self._month_clause(months)
+            sql += " WHERE " + clause
+        rows = self._conn().execute(sql + " ORDER BY a.seq", params)
+        return freeze({article_id: json.loads(data) for article_id, data in rows})
+
+    def save_articles(self, articles: dict[str, dict[str, Any]]) -> bool:
+        try:
+            with self._conn() as conn:
+                months = {
+                    self._row_month(date)
+                    for (date,) in conn.execute("SELECT DISTINCT collected_date FROM articles")
+                }
+                conn.execute("DELETE FROM articles")
+                conn.execute("DELETE FROM article_categories")
+                for article in articles.values():
+                    months.add(self._write_article(conn, article))
+                self._bump_articles(conn, months)
+            return True
+        except sqlite3.Error:
+            return False
+
+    def upsert_articles(self, articles: Iterable[dict[str, Any]], merge: MergeFunc) -> int:
+        added = 0
+        months: set[str] = set()
+        try:
+            # 병합 결과가 다른 연결의 병합을 덮지 않도록 처음부터 쓰기 잠금을 잡는다
+            with self._write_transaction() as conn:
+                for article in articles:
+                    row = conn.execute(
+                        "SELECT data, collected_date FROM articles WHERE id = ?",
+                        (article["id"],),
+                    ).fetchone()
+                    if row is None:
+                        added += 1
+                    else:
+                        current = json.loads(row[0])
+                        merge(current, article)
+                        article = current
+                        months.add(self._row_month(row[1]))
+                    months.add(self._write_article(conn, article))
+                self._bump_articles(conn, months)
+        except sqlite3.Error as e:
+            logger.warning("공용 기사를 저장하지 못했습니다: %s", e)
+            return 0
+        return added
+
+    def remove_articles(self, article_ids: Iterable[str]) -> int:
+        ids = [(article_id,) for article_id in article_ids]
+        try:
+            with self._write_transaction() as conn:
+                months = set()
+                for (article_id,) in ids:
+                    row = conn.execute(
+                        "SELECT collected_date FROM articles WHERE id = ?", (article_id,)
+                    ).fetchone()
+                    if row is not None:
+                        months.add(self._row_month(row[0]))
+                removed = conn.executemany("DELETE FROM articles WHERE id = ?", ids).rowcount
+                conn.executemany("DELETE FROM article_categories WHERE article_id = ?", ids)
+                self._bump_articles(conn, months)
+        except sqlite3.Error as e:
+            logger.warning("공용 기사를 지우지 못했습니다: %s", e)
+            return 0
+        return removed
+
+    def get_article(self, article_id: str) -> dict[str, Any] | None:
+        row = self._conn().execute(
+            "SELECT data FROM articles WHERE id = ?", (article_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def query_articles(
+        self, category: str | None = None, date: str | None = None, month: str | None = None
+    ) -> list[dict[str, Any]]:
+        sql = "SELECT a.data FROM articles a"
+        clauses = []
+        params: list[str] = []
+        if category is not None:
+            sql += " JOIN article_categories c ON c.article_id = a.id"
+            clauses.append("c.category = ?")
+            params.append(category)
+        if date is not None:
+            clauses.append("a.collected_date = ?")
+            params.append(date)
+        elif month is not None:
+            clause, month_params = self._month_clause([month])
+            clauses.append(clause)
+            params += month_params
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY a.seq"
+        return [json.loads(data) for (data,) in self._conn().execute(sql, params)]
+
+    def load_overlay(self, user: str) -> dict[str, Any] | None:
+        conn = self._conn()
+        state = conn.execute(
+            "SELECT cleared_at FROM user_state WHERE user = ?", (user,)
+        ).fetchone()
+        if state is None:
+            return None
+        overlay = empty_overlay()
+        overlay["cleared_at"] = state[0]
+        rows = conn.execute(
+            "SELECT article_id, is_favorite, is_deleted FROM user_articles WHERE user = ?",
+            (user,),
+        )
+        for article_id, is_favorite, is_deleted in rows:
+            if is_favorite:
+                overlay["favorites"].append(article_id)
+            if is_deleted:
+                overlay["deleted"].append(article_id)
+        visible = [
+            article_id
+            for (article_id,) in conn.execute(
+                "SELECT article_id FROM user_visible WHERE user = ?", (user,)
+            )
+        ]
+        if visible:
+            overlay["visible"] = visible
+        return overlay
+
+    def save_overlay(self, user: str, overlay: dict[str, Any]) -> bool:
+        try:
+            with self._conn() as conn:
+                self._write_overlay(conn, user, overlay)
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _write_overlay(self, conn: sqlite3.Connection, user: str, overlay: dict[str, Any]) -> None:
+        flags: dict[str, list[int]] = {}
+        for article_id in overlay.get("favorites", ()):
+            flags.setdefault(article_id, [0, 0])[0] = 1
+        for article_id in overlay.get("deleted", ()):
+            flags.setdefault(article_id, [0, 0])[1] = 1
+        conn.execute("DELETE FROM user_articles WHERE user = ?", (user,))
+        conn.executemany(
+            "INSERT INTO user_articles (user, article_id, is_favorite, is_deleted) "
+            "VALUES (?, ?, ?, ?)",
+            [(user, a, fav, deleted) for a, (fav, deleted) in flags.items()],
+        )
+        conn.execute("DELETE FROM user_visible WHERE user = ?", (user,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO user_visible (user, article_id) VALUES (?, ?)",
+            [(user, article_id) for article_id in overlay.get("visible") or ()],
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO user_state (user, cleared_at) VALUES (?, ?)",
+            (user, overlay.get("cleared_at")),
+        )
+        self._bump(conn, self._version_key(user))
+
+    def update_overlay(self, user: str, mutate: MutateFunc) -> dict[str, Any] | None:
+        try:
+            with self._write_transaction() as conn:
+                overlay = mutate(self.load_overlay(user) or empty_overlay())
+                self._write_overlay(conn, user, overlay)
+            return overlay
+        except sqlite3.Error:
+            return None
+
+    def get_article_flags(self, user: str, article_id: str) -> dict[str, Any]:
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT is_favorite, is_deleted FROM user_articles "
+            "WHERE user = ? AND article_id = ?",
+            (user, article_id),
+        ).fetchone()
+        state = conn.execute(
+            "SELECT cleared_at FROM user_state WHERE user = ?", (user,)
+        ).fetchone()
+        visible = conn.execute(
+            "SELECT 1 FROM user_visible WHERE user = ? AND article_id = ?",
+            (user, article_id),
+        ).fetchone()
+        return {
+            "is_favorite": bool(row and row[0]),
+            "is_deleted": bool(row and row[1]),
+            "is_visible": visible is not None,
+            "cleared_at": state[0] if state else None,
+        }
+
+    def apply_overlay_ops(self, user: str, ops: list[dict[str, Any]]) -> bool:
+        try:
+            with self._conn() as conn:
+                for op in ops:
+                    if op["op"] == journal.FAVORITE:
+                        conn.execute(
+                            "INSERT INTO user_articles (user, article_id, is_favorite) "
+                            "VALUES (?, ?, ?) ON CONFLICT (user, article_id) "
+                            "DO UPDATE SET is_favorite = excluded.is_favorite",
+                            (user, op["id"], int(bool(op.get("value")))),
+                        )
+                    elif op["op"] == journal.DELETE:
+                        conn.execute(
+                            "INSERT INTO user_articles (user, article_id, is_deleted) "
+                            "VALUES (?, ?, 1) ON CONFLICT (user, article_id) "
+                            "DO UPDATE SET is_favorite = 0, is_deleted = 1",
+                            (user, op["id"]),
+                        )
+                conn.execute(
+                    "INSERT OR IGNORE INTO user_state (user, cleared_at) VALUES (?, NULL)",
+                    (user,),
+                )
+                self._bump(conn, self._version_key(user))
+            return True
+        except sqlite3.Error:
+            return False
+
+    def list_users(self) -> list[str]:
+        rows = self._conn().execute(
+            "SELECT user FROM user_state UNION "
+            "SELECT scope FROM documents WHERE scope NOT IN ('', ?) ORDER BY 1",
+            (SHARED_SCOPE,),
+        )
+        return [user for (user,) in rows]
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def copy_backend(
+    source: StorageBackend,
+    target: StorageBackend,
+    users: Iterable[str],
+    documents: Iterable[str] = ("diary_entries.json", "calendar_issues.json"),
+) -> None:
+    """한 백엔드의 데이터를 다른 백엔드로 복사한다 (예: JSON → SQLite 전환).
+
+    Args:
+        source: 원본 백엔드
+        target: 대상 백엔드
+        users: 복사할 사용자 아이디
+        documents: 사용자별로 복사할 문서 이름
+    """
+    target.save_articles(source.load_articles())
+    users_data = source.read_document(None, "users.json")
+    if users_data is not None:
+        target.write_document(None, "users.json", users_data)
+    for user in users:
+        overlay = source.load_overlay(user)
+        if overlay is not None:
+            target.save_overlay(user, overlay)
+        for name in documents:
+            data = source.read_document(user, name)
+            if data is not None:
+                target.write_document(user, name, data)
+
+
+def create_backend(name: str, data_dir: Path) -> StorageBackend:
+    """이름에 해당하는 저장소 백엔드를 만든다.
+
+    Args:
+        name: 백엔드 이름 ("json", "sqlite")
+        data_dir: 데이터 루트 폴더
+
+    Returns:
+        저장소 백엔드
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드
+    """
+    if name == "json":
+        return JsonBackend(data_dir)
+    if name == "sqlite":
+        return SqliteBackend(data_dir / SQLITE_FILENAME)
+    raise ValueError(f"지원하지 않는 저장소 백엔드: {name}")
@@ -1,36 +1,260 @@
-"""로컬 JSON 스토리지 유틸리티 모듈.
+"""로컬 스토리지 유틸리티 모듈.
 
-data/ 폴더의 JSON 파일을 읽고 쓰는 공통 기능을 제공한다.
+data/ 폴더의 데이터를 읽고 쓰는 공통 기능을 제공한다.
+기사 본문은 모든 사용자가 공유하는 저장소에 한 번만 저장하고,
+사용자별로는 즐겨찾기/삭제 기록(오버레이)과 다이어리, 캘린더만 둔다.
+실제 저장 방식은 저장소 백엔드(storage_backend)가 맡는다 (기본값: JSON 파일).
 """
 
-import json
-import streamlit as st
+import copy
+import logging
+import os
+import threading
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Set
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
-from datetime import datetime
 
+import streamlit as st
+
+from app.services import journal
+from app.services.read_cache import get_read_cache, thaw
+from app.services.safe_file import atomic_write_json, file_lock, read_json_verified
+from app.services.storage_backend import (
+    DEFAULT_BACKEND,
+    OVERLAY_FILENAME,
+    SHARED_SCOPE,
+    StorageBackend,
+    create_backend,
+    empty_overlay,
+)
+from scraper.article_id import (
+    article_id_from_url,
+    canonical_article_url,
+    is_canonical_id,
+)
+
+logger = logging.getLogger(__name__)
 
 # 프로젝트 루트 기준 data 폴더 경로
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 
+# 저장소 백엔드 ("json": data/ 폴더의 JSON 파일, "sqlite": data/news.db)
+STORAGE_BACKEND = os.environ.get("NEWS_STORAGE_BACKEND", DEFAULT_BACKEND)
+
+# 다이어리/캘린더 문서 이름
+DIARY_DOCUMENT = "diary_entries.json"
+CALENDAR_DOCUMENT = "calendar_issues.json"
+
+# 수집 이력에 카테고리별로 남기는 최근 URL 수 (증분 수집은 최근 수집분에 닿으면 멈춘다)
+SEEN_URLS_PER_CATEGORY = 1000
+
+# 수집 이력 파일이 이 크기(바이트)를 넘으면 카테고리별 최근 URL만 남기고 다시 쓴다
+SEEN_URLS_COMPACT_BYTES = 1 << 20
+
+# Streamlit 세션 밖(스케줄러 등)에서 사용할 스레드별 사용자 지정
+_user_override = threading.local()
+
+
+def get_current_user() -> str | None:
+    """현재 작업 대상 사용자를 반환한다.
+
+    as_user()로 지정한 사용자가 있으면 우선하고, 없으면 로그인 세션의 사용자다.
+    """
+    user = getattr(_user_override, "user", None)
+    if user:
+        return user
+    if "user" in st.session_state and st.session_state["user"]:
+        return st.session_state["user"]
+    return None
+
+
+@contextmanager
+def as_user(user: str) -> Iterator[None]:
+    """블록 안의 스토리지 함수가 지정한 사용자의 데이터를 사용하게 한다.
+
+    Args:
+        user: 사용자 아이디
+    """
+    previous = getattr(_user_override, "user", None)
+    _user_override.user = user
+    try:
+        yield
+    finally:
+        _user_override.user = previous
+
+
 def get_user_data_dir() -> Path:
     """현재 로그인한 사용자의 데이터 디렉토리 경로를 반환한다."""
-    if "user" in st.session_state and st.session_state["user"]:
-        user_dir = DATA_DIR / st.session_state["user"]
+    user = get_current_user()
+    if user:
+        user_dir = DATA_DIR / user
         user_dir.mkdir(parents=True, exist_ok=True)
         return user_dir
     return DATA_DIR
 
+_backend: StorageBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def get_storage_backend() -> StorageBackend:
+    """프로세스 공용 저장소 백엔드를 반환한다 (처음 호출할 때 STORAGE_BACKEND로 생성)."""
+    global _backend
+
+    with _backend_lock:
+        if _backend is None:
+            _backend = create_backend(STORAGE_BACKEND, DATA_DIR)
+        return _backend
+
+
+def set_storage_backend(backend: StorageBackend | str) -> StorageBackend:
+    """저장소 백엔드를 바꾼다 (벤치마크, 데이터 이전 등).
+
+    Args:
+        backend: 백엔드 객체 또는 이름 ("json", "sqlite")
+
+    Returns:
+        새로 사용할 백엔드
+    """
+    global _backend
+
+    if isinstance(backend, str):
+        backend = create_backend(backend, DATA_DIR)
+    with _backend_lock:
+        if _backend is not None and _backend is not backend:
+            _backend.close()
+        _backend = backend
+    return backend
+
+
+class UnitOfWork:
+    """한 번의 rerun이나 트랜잭션 동안의 사용자 데이터 변경을 모아 두는 쓰기 버퍼.
+
+    변경은 (사용자, 문서)마다 순서대로 쌓아 두었다가 flush()에서 문서마다
+    한 번씩 저장한다. 연산만 쌓인 문서는 변경 기록에 한 번 추가하고, 문서를
+    고치는 함수가 섞여 있으면 update_document()로 한 번 읽고-고치고-저장한다.
+    같은 스레드의 읽기 함수는 저장소의 데이터에 쌓인 변경을 적용한 결과를 본다.
+    """
+
+    def __init__(self) -> None:
+        """빈 쓰기 버퍼를 생성한다."""
+        # (사용자, 문서 이름) -> [("ops", 연산 리스트) | ("mutate", 변경 함수)]
+        self._steps: dict[tuple[str, str], list[tuple[str, Any]]] = {}
+
+    def append_ops(self, user: str, name: str, ops: list[dict[str, Any]]) -> None:
+        """문서에 변경 연산(journal 모듈)을 쌓는다."""
+        if ops:
+            self._steps.setdefault((user, name), []).append(("ops", list(ops)))
+
+    def update(self, user: str, name: str, mutate: Callable[[Any], Any]) -> None:
+        """문서에 변경 함수를 쌓는다 (저장할 때 최신 문서로 다시 호출된다)."""
+        self._steps.setdefault((user, name), []).append(("mutate", mutate))
+
+    def has_pending(self, user: str, name: str) -> bool:
+        """문서에 아직 저장하지 않은 변경이 있는지 확인한다."""
+        return (user, name) in self._steps
+
+    def apply(self, user: str, name: str, document: Any) -> Any:
+        """수정 가능한 문서에 쌓인 변경을 적용한 결과를 반환한다."""
+        return self._apply_steps(self._steps.get((user, name), ()), document, name)
+
+    @staticmethod
+    def _apply_steps(steps: Iterable[tuple[str, Any]], document: Any, name: str) -> Any:
+        default = empty_overlay if name == OVERLAY_FILENAME else dict
+        for kind, value in steps:
+            if kind == "ops":
+                document = journal.apply_ops(document, value, default)
+            else:
+                document = value(document)
+        return document
+
+    def flush(self) -> bool:
+        """쌓인 변경을 문서마다 한 번씩 저장하고 버퍼를 비운다.
+
+        Returns:
+            모든 문서를 저장했는지 여부
+        """
+        steps, self._steps = self._steps, {}
+        backend = get_storage_backend()
+        ok = True
+        for (user, name), doc_steps in steps.items():
+            if all(kind == "ops" for kind, _ in doc_steps):
+                ops = [op for _, batch in doc_steps for op in batch]
+                if name == OVERLAY_FILENAME:
+                    saved = backend.apply_overlay_ops(user, ops)
+                else:
+                    saved = backend.append_ops(user, name, ops)
+            else:
+                def apply(document: Any, doc_steps=doc_steps, name=name) -> Any:
+                    return self._apply_steps(doc_steps, document, name)
+
+                if name == OVERLAY_FILENAME:
+                    saved = backend.update_overlay(user, apply) is not None
+                else:
+                    saved = backend.update_document(user, name, apply) is not None
+            if not saved:
+                logger.warning("변경을 저장하지 못했습니다: %s/%s", user, name)
+                ok = False
+        return ok
+
+
+_work = threading.local()
+
+
+def get_unit_of_work() -> UnitOfWork | None:
+    """현재 스레드에서 진행 중인 쓰기 버퍼를 반환한다 (없으면 None)."""
+    return getattr(_work, "current", None)
+
+
+@contextmanager
+def unit_of_work() -> Iterator[UnitOfWork]:
+    """블록 안의 사용자 데이터 변경을 모아 블록이 끝날 때 문서마다 한 번 저장한다.
+
+    Streamlit 페이지 렌더링 전체를 감싸면 한 번의 rerun에서 일어난 저장이 합쳐진다.
+    st.rerun()처럼 예외로 블록을 빠져나가도 저장하며, 이미 진행 중인 버퍼가
+    있으면 바깥 블록이 끝날 때 함께 저장한다.
+    """
+    current = get_unit_of_work()
+    if current is not None:
+        yield current
+        return
+    work = UnitOfWork()
+    _work.current = work
+    try:
+        yield work
+    finally:
+        _work.current = None
+        work.flush()
+
+
+def get_shared_dir() -> Path:
+    """사용자와 무관한 공용 데이터 디렉토리 경로를 반환한다."""
+    shared_dir = DATA_DIR / SHARED_SCOPE
+    shared_dir.mkdir(parents=True, exist_ok=True)
+    return shared_dir
+
+
 def get_news_path() -> Path:
+    """공용 저장소 이전 전의 사용자별 기사 파일 경로를 반환한다."""
     return get_user_data_dir() / "news_articles.json"
 
 
 def get_diary_path() -> Path:
-    return get_user_data_dir() / "diary_entries.json"
+    return get_user_data_dir() / DIARY_DOCUMENT
 
 
 def get_calendar_path() -> Path:
-    return get_user_data_dir() / "calendar_issues.json"
+    return get_user_data_dir() / CALENDAR_DOCUMENT
+
+
+def get_seen_urls_path() -> Path:
+    return get_shared_dir() / "seen_urls.txt"
+
+
+def get_seen_urls_lock_path() -> Path:
+    return get_shared_dir() / "seen_urls.lock"
 
 
 def ensure_data_dir() -> None:
@@ -45,24 +269,20 @@ def read_json(file_path: Path) -> list[dict[str, Any]]:
         file_path: 읽을 JSON 파일 경로
         
     Returns:
-        JSON 데이터 리스트 (파일이 없거나 비어있으면 빈 리스트)
+        JSON 데이터 리스트 (파일이 없거나 비어있으면 빈 리스트).
+        파일이 손상되었으면 이전 세대(.bak)를 사용한다.
     """
     ensure_data_dir()
     
-    if not file_path.exists():
-        return []
-    
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, list) else []
-    except (json.JSONDecodeError, IOError):
-        return []
+    data = read_json_verified(file_path)
+    return data if isinstance(data, list) else []
 
 
 def write_json(file_path: Path, data: list[dict[str, Any]]) -> bool:
     """데이터를 JSON 파일에 저장한다.
     
+    임시 파일에 쓰고 교체하므로 중단되어도 기존 파일이 잘리지 않는다.
+
     Args:
         file_path: 저장할 JSON 파일 경로
         data: 저장할 데이터 리스트
@@ -73,8 +293,7 @@ def write_json(file_path: Path, data: list[dict[str, Any]]) -> bool:
     ensure_data_dir()
     
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        atomic_write_json(file_path, data)
         return True
     except IOError:
         return False
@@ -103,49 +322,644 @@ def get_current_date() -> str:
     return datetime.now().strftime("%Y-%m-%d")
 
 
+# 공용 기사 저장소 관련 함수
+def load_shared_articles(months: Iterable[str] | None = None) -> Mapping[str, dict[str, Any]]:
+    """공용 기사 저장소를 로드한다.
+
+    기사 ID는 URL(oid/aid)에서 만들어지는 내용 주소이므로, 같은 기사는
+    몇 명이 수집하든 한 번만 저장된다.
+
+    Args:
+        months: 읽을 수집 월(YYYY-MM) (None이면 전체). JSON 백엔드는 해당 월의 파일만 읽는다.
+
+    Returns:
+        읽기 전용 기사 딕셔너리 (key: 기사 ID, 수집 월/수집 순서 유지)
+    """
+    return get_storage_backend().load_articles(months)
+
+
+def get_article_months() -> list[str]:
+    """공용 기사가 있는 수집 월(YYYY-MM) 리스트를 오래된 순으로 반환한다."""
+    return get_storage_backend().article_months()
+
+
+def save_shared_articles(articles: dict[str, dict[str, Any]]) -> bool:
+    """공용 기사 저장소 전체를 교체한다 (검색 색인도 다시 만든다)."""
+    from app.services.search_index import rebuild_search_index
+
+    if not get_storage_backend().save_articles(articles):
+        return False
+    rebuild_search_index()
+    return True
+
+
+def _shared_record(article: dict[str, Any]) -> dict[str, Any]:
+    """사용자별 상태(즐겨찾기)를 뺀 공용 저장용 기사 레코드를 만든다."""
+    record = dict(article)
+    record.pop("is_favorite", None)
+    return record
+
+
+def _merge_into_shared(
+    shared: dict[str, dict[str, Any]], articles: Iterable[dict[str, Any]]
+) -> int:
+    """기사들을 공용 저장소 딕셔너리에 병합하고 새로 추가된 수를 반환한다."""
+    added = 0
+    for article in articles:
+        article_id = article.get("id")
+        if not article_id:
+            continue
+        current = shared.get(article_id)
+        if current is None:
+            shared[article_id] = _shared_record(article)
+            added += 1
+        else:
+            merge_article_record(current, _shared_record(article))
+    return added
+
+
+def add_shared_articles(articles: Iterable[dict[str, Any]]) -> int:
+    """수집한 기사를 공용 저장소에 병합해 저장하고 검색 색인에 반영한다.
+
+    Args:
+        articles: 수집된 기사들
+
+    Returns:
+        새로 추가된 기사 수
+    """
+    from app.services.search_index import index_shared_articles
+
+    records = [_shared_record(a) for a in articles if a.get("id")]
+    if not records:
+        return 0
+    added = get_storage_backend().upsert_articles(records, merge_article_record)
+    # 병합된 결과(요약이 채워진 경우 등)로 검색 색인을 갱신한다
+    index_shared_articles(record["id"] for record in records)
+    return added
+
+
+# 사용자별 기사 오버레이 관련 함수
+def load_news_overlay() -> dict[str, Any]:
+    """현재 사용자의 기사 오버레이(즐겨찾기, 삭제 기록)를 로드한다.
+
+    공용 저장소 이전 전의 사용자별 기사 파일이 남아 있으면 한 번 이전한다.
+
+    Returns:
+        {"favorites": 기사 ID 리스트, "deleted": 기사 ID 리스트,
+        "cleared_at": 전체 삭제 시각 (이 시각 이전에 수집된 기사는 숨김)}
+        이전한 사용자는 "visible"(cleared_at 이전이어도 보이는 기사 ID 리스트)도 가진다.
+    """
+    user = get_current_user()
+    if not user:
+        return empty_overlay()
+
+    overlay = get_storage_backend().load_overlay(user)
+    if overlay is None:
+        overlay = _migrate_user_articles() if get_news_path().exists() else empty_overlay()
+    work = get_unit_of_work()
+    if work is not None and work.has_pending(user, OVERLAY_FILENAME):
+        overlay = work.apply(user, OVERLAY_FILENAME, overlay)
+    return overlay
+
+
+def save_news_overlay(overlay: dict[str, Any]) -> bool:
+    """현재 사용자의 기사 오버레이를 저장한다."""
+    user = get_current_user()
+    if not user:
+        return False
+    work = get_unit_of_work()
+    if work is not None:
+        saved = copy.deepcopy(overlay)
+        work.update(user, OVERLAY_FILENAME, lambda _: copy.deepcopy(saved))
+        return True
+    return get_storage_backend().save_overlay(user, overlay)
+
+
+def _is_hidden(
+    article: dict[str, Any],
+    deleted: set[str],
+    cleared_at: str | None,
+    visible: Set[str] = frozenset(),
+) -> bool:
+    """오버레이 기준으로 사용자에게 숨겨진 기사인지 확인한다."""
+    article_id = article.get("id")
+    if article_id in deleted:
+        return True
+    if article_id in visible:
+        return False
+    return bool(cleared_at) and article.get("collected_at", "") <= cleared_at
+
+
 # 뉴스 기사 관련 함수
-def load_news_articles() -> list[dict[str, Any]]:
-    """뉴스 기사 목록을 로드한다."""
-    if "user" not in st.session_state or not st.session_state["user"]:
+def load_news_articles(months: Iterable[str] | None = None) -> list[dict[str, Any]]:
+    """현재 사용자에게 보이는 뉴스 기사 목록을 로드한다.
+
+    공용 저장소의 기사에 사용자 오버레이를 적용한 목록을 반환한다
+    (삭제한 기사는 빼고, 즐겨찾기한 기사에는 is_favorite를 표시).
+    결과는 수집 월마다 (사용자, 그 달의 공용 기사/오버레이 스탬프)로 캐시되므로
+    새 기사가 들어와도 바뀐 달만 다시 만든다. 각 기사는 읽기 전용 뷰이며,
+    리스트 자체는 호출할 때마다 새로 만든다.
+
+    Args:
+        months: 읽을 수집 월(YYYY-MM) (None이면 전체)
+    """
+    user = get_current_user()
+    if not user:
+        return []
+
+    overlay = load_news_overlay()
+    backend = get_storage_backend()
+    if months is None:
+        months = backend.article_months()
+    work = get_unit_of_work()
+    if work is not None and work.has_pending(user, OVERLAY_FILENAME):
+        # 아직 저장하지 않은 변경이 있으면 캐시하지 않고 그 변경을 반영해 만든다
+        return [view for month in months for view in _build_news_view(overlay, month)]
+    overlay_stamp = backend.change_stamp(user)
+    articles: list[dict[str, Any]] = []
+    for month in months:
+        stamp = (backend.change_stamp(SHARED_SCOPE, month), overlay_stamp)
+        articles.extend(get_read_cache().get(
+            ("news_view", id(backend), user, month),
+            stamp,
+            lambda month=month: _build_news_view(overlay, month),
+        ))
+    return articles
+
+
+def get_shared_articles_stamp() -> Hashable:
+    """공용 기사 전체의 변경 스탬프를 반환한다.
+
+    공용 기사의 어느 달이 바뀌어도 달라지므로, 공용 기사에서 만든 값을
+    읽기 캐시에 둘 때 스탬프로 쓴다 (사용자 오버레이는 포함하지 않는다).
+    """
+    backend = get_storage_backend()
+    months = tuple(backend.article_months())
+    return (
+        id(backend),
+        months,
+        tuple(backend.change_stamp(SHARED_SCOPE, month) for month in months),
+    )
+
+
+def load_news_overlay_sets() -> tuple[frozenset[str], frozenset[str], str | None, frozenset[str]]:
+    """현재 사용자의 (즐겨찾기 ID 집합, 삭제 ID 집합, 전체 삭제 시각, 보이는 ID 집합)을 반환한다.
+
+    오버레이가 바뀌지 않았으면 읽기 캐시에서 재사용하며, 쓰기 버퍼에
+    저장하지 않은 변경이 있으면 그 변경을 반영해 새로 만든다.
+    """
+    user = get_current_user()
+    if not user:
+        return frozenset(), frozenset(), None, frozenset()
+
+    def build() -> tuple[frozenset[str], frozenset[str], str | None, frozenset[str]]:
+        overlay = load_news_overlay()
+        return (
+            frozenset(overlay["favorites"]),
+            frozenset(overlay["deleted"]),
+            overlay["cleared_at"],
+            frozenset(overlay.get("visible") or ()),
+        )
+
+    work = get_unit_of_work()
+    if work is not None and work.has_pending(user, OVERLAY_FILENAME):
+        return build()
+    backend = get_storage_backend()
+    return get_read_cache().get(
+        ("news_overlay_sets", id(backend), user), backend.change_stamp(user), build
+    )
+
+
+def load_visible_articles(
+    deleted: Iterable[str], cleared_at: str | None, visible: Iterable[str] = ()
+) -> list[dict[str, Any]]:
+    """공용 기사 중 오버레이로 숨기지 않은 기사를 수집 월 순서로 반환한다.
+
+    즐겨찾기는 표시하지 않은 공용 기사 그대로이므로, 결과는 삭제 기록과
+    전체 삭제 시각이 같은 동안 즐겨찾기를 바꿔도 그대로 쓸 수 있다.
+
+    Args:
+        deleted: 삭제한 기사 ID
+        cleared_at: 전체 삭제 시각 (None이면 없음)
+        visible: 전체 삭제 시각 이전이어도 보이는 기사 ID
+    """
+    deleted = set(deleted)
+    visible = set(visible)
+    return [
+        article
+        for month in get_article_months()
+        for article in load_shared_articles([month]).values()
+        if not _is_hidden(article, deleted, cleared_at, visible)
+    ]
+
+
+def _build_news_view(overlay: dict[str, Any], month: str) -> tuple[Mapping[str, Any], ...]:
+    """한 달의 공용 기사에 오버레이를 적용한 읽기 전용 기사 뷰를 만든다."""
+    favorites = set(overlay["favorites"])
+    deleted = set(overlay["deleted"])
+    cleared_at = overlay["cleared_at"]
+    visible = set(overlay.get("visible") or ())
+
+    views = []
+    for article_id, article in load_shared_articles([month]).items():
+        if _is_hidden(article, deleted, cleared_at, visible):
+            continue
+        if article_id in favorites:
+            article = MappingProxyType({**article, "is_favorite": True})
+        views.append(article)
+    return tuple(views)
+
+
+def get_read_cache_stats() -> dict[str, Any]:
+    """읽기 캐시의 적중/실패 횟수와 항목 수를 반환한다."""
+    return get_read_cache().stats()
+
+
+def query_news_articles(
+    category: str | None = None, date: str | None = None, month: str | None = None
+) -> list[dict[str, Any]]:
+    """카테고리/수집 날짜/수집 월로 현재 사용자에게 보이는 기사를 조회한다.
+
+    저장소 백엔드의 색인(카테고리, 수집 날짜)과 월별 파일을 사용하므로
+    전체 기사를 읽지 않고 해당하는 기사만 가져온다.
+
+    Args:
+        category: 카테고리 (None이면 전체)
+        date: YYYY-MM-DD 형식의 수집 날짜 (None이면 전체)
+        month: YYYY-MM 형식의 수집 월 (None이면 전체, date가 있으면 무시)
+    """
+    if not get_current_user():
         return []
-    return read_json(get_news_path())
+
+    overlay = load_news_overlay()
+    favorites = set(overlay["favorites"])
+    deleted = set(overlay["deleted"])
+    visible = set(overlay.get("visible") or ())
+
+    articles = []
+    for article in get_storage_backend().query_articles(category, date, month):
+        if _is_hidden(article, deleted, overlay["cleared_at"], visible):
+            continue
+        if article["id"] in favorites:
+            article = {**article, "is_favorite": True}
+        articles.append(article)
+    return articles
 
 
 def save_news_articles(articles: list[dict[str, Any]]) -> bool:
-    """뉴스 기사 목록을 저장한다."""
-    if "user" not in st.session_state or not st.session_state["user"]:
+    """현재 사용자에게 보이는 뉴스 기사 목록을 저장한다.
+
+    기사 본문은 공용 저장소에 병합하고, 사용자 파일에는 즐겨찾기와
+    목록에서 빠진(삭제된) 기사 ID만 오버레이로 기록한다.
+    다른 세션이 그 사이 오버레이를 저장했으면 최신 오버레이에 다시 적용한다.
+    """
+    user = get_current_user()
+    if not user:
+        return False
+
+    # 사용자별 파일 이전 전이면 오버레이를 먼저 만든다
+    load_news_overlay()
+    shared = dict(load_shared_articles())
+    kept_ids = {a.get("id") for a in articles}
+    missing = [a for a in articles if a.get("id") and a["id"] not in shared]
+    if missing:
+        add_shared_articles(missing)
+        _merge_into_shared(shared, missing)
+    now = get_current_datetime()
+
+    def apply(overlay: dict[str, Any]) -> dict[str, Any]:
+        if not articles:
+            # 전체 삭제는 ID 목록 대신 시각 하나로 기록한다
+            cleared = empty_overlay()
+            cleared["cleared_at"] = now
+            return cleared
+
+        deleted = set(overlay["deleted"])
+        visible = set(overlay.get("visible") or ())
+        for article_id, article in shared.items():
+            if article_id not in kept_ids and not _is_hidden(
+                article, deleted, overlay["cleared_at"], visible
+            ):
+                deleted.add(article_id)
+        deleted -= kept_ids
+        overlay["favorites"] = [a["id"] for a in articles if a.get("is_favorite")]
+        overlay["deleted"] = sorted(deleted & shared.keys())
+        return overlay
+
+    work = get_unit_of_work()
+    if work is not None:
+        work.update(user, OVERLAY_FILENAME, apply)
+        return True
+    return get_storage_backend().update_overlay(user, apply) is not None
+
+
+def hide_news_articles(article_ids: Iterable[str]) -> bool:
+    """현재 사용자의 목록에서 기사들을 숨긴다 (즐겨찾기도 해제).
+
+    전체 목록을 다시 저장하지 않고 숨길 기사 ID만 오버레이에 기록한다.
+
+    Args:
+        article_ids: 숨길 기사 ID
+
+    Returns:
+        저장 성공 여부
+    """
+    user = get_current_user()
+    if not user:
         return False
-    return write_json(get_news_path(), articles)
+    ids = [article_id for article_id in article_ids if article_id]
+    if not ids:
+        return True
+    # 사용자별 파일 이전 전이면 오버레이를 먼저 만든다
+    load_news_overlay()
+    return _apply_overlay_ops(
+        user, [journal.article_op(journal.DELETE, article_id) for article_id in ids]
+    )
+
+
+def _apply_overlay_ops(user: str, ops: list[dict[str, Any]]) -> bool:
+    """사용자 오버레이에 기사 연산을 저장한다 (쓰기 버퍼가 있으면 버퍼에 쌓는다)."""
+    work = get_unit_of_work()
+    if work is not None:
+        work.append_ops(user, OVERLAY_FILENAME, ops)
+        return True
+    return get_storage_backend().apply_overlay_ops(user, ops)
+
+
+def _migrate_user_articles() -> dict[str, Any]:
+    """사용자별 기사 파일을 공용 저장소와 오버레이로 이전한다.
+
+    기존 기사는 공용 저장소에 병합하고, 이전 시점에 공용 저장소에만 있던
+    기사는 전체 삭제 시각(그 기사들의 가장 늦은 수집 시각)으로 숨긴다.
+    그 시각 이전에 수집된 사용자 기사는 보이는 기사로 기록하므로 오버레이
+    크기는 공용 저장소가 아니라 사용자 파일 크기만큼만 늘어난다.
+    이전이 끝난 파일은 news_articles.json.migrated로 이름을 바꾼다.
+
+    Returns:
+        새로 만든 오버레이
+    """
+    path = get_news_path()
+    articles = read_json(path)
+    if any(_needs_id_migration(a) for a in articles):
+        articles = migrate_article_ids(articles)
+
+    shared = load_shared_articles()
+    others = set(shared)
+    add_shared_articles(articles)
+    new_urls: dict[str, list[str]] = {}
+    for article in articles:
+        if article.get("url") and article["id"] not in others:
+            new_urls.setdefault(article.get("category") or "", []).append(article["url"])
+    for category, urls in new_urls.items():
+        add_seen_urls(urls, category)
+
+    own_ids = {a.get("id") for a in articles}
+    overlay = empty_overlay()
+    overlay["favorites"] = [a["id"] for a in articles if a.get("is_favorite")]
+    hidden = others - own_ids
+    # 수집 시각이 없는 기사는 시각으로 숨길 수 없으므로 삭제 기록에 남긴다
+    overlay["deleted"] = sorted(i for i in hidden if not shared[i].get("collected_at"))
+    dated = [shared[i]["collected_at"] for i in hidden if shared[i].get("collected_at")]
+    if dated:
+        cleared_at = max(dated)
+        overlay["cleared_at"] = cleared_at
+        merged = load_shared_articles()
+        overlay["visible"] = sorted(
+            article_id
+            for article_id in own_ids
+            if article_id in merged and merged[article_id].get("collected_at", "") <= cleared_at
+        )
+    # 이전 파일 이름을 바꾸기 전에 저장해야 하므로 쓰기 버퍼를 거치지 않는다
+    get_storage_backend().save_overlay(get_current_user(), overlay)
+    path.replace(path.with_name(path.name + ".migrated"))
+    return overlay
+
+
+# 수집 이력(URL) 인덱스 관련 함수
+def _read_seen_entries(path: Path) -> list[tuple[str, str]]:
+    """수집 이력 파일의 (카테고리, URL) 줄을 파일 순서대로 읽는다.
+
+    카테고리 없이 URL만 있는 이전 형식 줄은 카테고리를 빈 문자열로 읽는다.
+    """
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            category, sep, url = line.rstrip("\n").rpartition("\t")
+            if not url.strip():
+                continue
+            entries.append((category, url if sep else canonical_article_url(url)))
+    return entries
+
+
+def _write_seen_entries(path: Path, entries: Iterable[tuple[str, str]]) -> None:
+    """수집 이력 파일을 임시 파일 교체로 다시 쓴다."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(f"{category}\t{url}\n" for category, url in entries)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _recent_seen_entries(entries: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+    """카테고리별로 가장 최근 SEEN_URLS_PER_CATEGORY개만 중복 없이 남긴다."""
+    kept: dict[tuple[str, str], None] = {}
+    counts: dict[str, int] = {}
+    for entry in reversed(list(entries)):
+        if entry in kept or counts.get(entry[0], 0) >= SEEN_URLS_PER_CATEGORY:
+            continue
+        kept[entry] = None
+        counts[entry[0]] = counts.get(entry[0], 0) + 1
+    return list(reversed(kept))
+
+
+def _build_seen_urls(path: Path) -> None:
+    """수집 이력 파일이 없을 때 공용 저장소의 최근 기사로 만든다."""
+    entries = []
+    for article in load_shared_articles().values():
+        url = article.get("url")
+        if not url:
+            continue
+        categories = dict.fromkeys((article.get("category"), *article.get("categories", ())))
+        entries.extend((category, url) for category in categories if category)
+    _write_seen_entries(path, _recent_seen_entries(entries))
+
+
+def load_seen_urls(categories: Iterable[str] | None = None) -> set[str]:
+    """최근 수집한 기사 URL 집합을 로드한다.
+
+    증분 수집 중단 조건에 쓰이는 공용 수집 이력 파일(한 줄당 "카테고리\tURL")을 읽으며,
+    파일이 없으면 공용 저장소의 기사로 한 번 만든다. 중단 판단에는 각 카테고리의
+    최근 수집분만 있으면 되므로 파일은 카테고리별 최근 SEEN_URLS_PER_CATEGORY개로 유지된다.
+
+    Args:
+        categories: 이 카테고리들의 수집 이력만 읽는다 (None이면 전체).
+            카테고리가 없는 이전 형식 줄은 항상 포함한다.
+
+    Returns:
+        기사 URL 집합
+    """
+    path = get_seen_urls_path()
+    wanted = None if categories is None else set(categories)
+    try:
+        with file_lock(get_seen_urls_lock_path()):
+            if not path.exists():
+                _build_seen_urls(path)
+            entries = _read_seen_entries(path)
+    except (OSError, TimeoutError):
+        logger.exception("수집 이력을 읽지 못했습니다")
+        return set()
+    return {
+        url
+        for category, url in entries
+        if wanted is None or not category or category in wanted
+    }
+
+
+def add_seen_urls(urls: Iterable[str], category: str = "") -> bool:
+    """수집한 기사 URL을 공용 수집 이력 파일 끝에 추가한다.
+
+    파일이 SEEN_URLS_COMPACT_BYTES를 넘으면 카테고리별 최근 URL만 남기고 다시 쓴다.
+
+    Args:
+        urls: 기사 URL들
+        category: URL을 수집한 카테고리
+    """
+    lines = [f"{category}\t{canonical_article_url(url)}\n" for url in urls if url]
+    if not lines:
+        return True
+    path = get_seen_urls_path()
+    try:
+        with file_lock(get_seen_urls_lock_path()):
+            with open(path, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+            if path.stat().st_size > SEEN_URLS_COMPACT_BYTES:
+                _write_seen_entries(path, _recent_seen_entries(_read_seen_entries(path)))
+        return True
+    except (OSError, TimeoutError):
+        logger.exception("수집 이력을 기록하지 못했습니다")
+        return False
+
+
+# 사용자 문서 관련 함수
+def load_user_document(name: str, default_type: type = list) -> Any:
+    """현재 사용자의 문서를 저장소 백엔드에서 읽는다.
+
+    Args:
+        name: 문서 이름 (예: "diary_entries.json")
+        default_type: 기대하는 데이터 타입 (list 또는 dict)
+
+    Returns:
+        수정 가능한 문서 데이터 사본 (사용자가 없거나 문서가 없거나 타입이 다르면 빈 값)
+    """
+    user = get_current_user()
+    if not user:
+        return default_type()
+    data = thaw(get_storage_backend().read_document(user, name))
+    work = get_unit_of_work()
+    if work is not None and work.has_pending(user, name):
+        data = work.apply(user, name, data)
+    return data if isinstance(data, default_type) else default_type()
+
+
+def save_user_document(name: str, data: Any) -> bool:
+    """현재 사용자의 문서를 저장소 백엔드에 저장한다."""
+    user = get_current_user()
+    if not user:
+        return False
+    work = get_unit_of_work()
+    if work is not None:
+        saved = copy.deepcopy(data)
+        work.update(user, name, lambda _: copy.deepcopy(saved))
+        return True
+    return get_storage_backend().write_document(user, name, data)
+
+
+def update_user_document(
+    name: str, mutate: Callable[[Any], Any], default_type: type = list
+) -> Any:
+    """현재 사용자의 문서를 다른 세션의 저장과 겹치지 않게 읽고-고치고-저장한다.
+
+    다른 세션이 먼저 저장했으면 최신 문서로 mutate를 다시 호출하므로,
+    mutate는 받은 문서에 연산 하나를 적용하는 함수여야 한다.
+
+    Args:
+        name: 문서 이름
+        mutate: 수정 가능한 현재 문서를 받아 저장할 문서를 반환하는 함수
+        default_type: 문서가 없거나 타입이 다를 때 만들 빈 값의 타입
+
+    Returns:
+        저장한 문서 (사용자가 없거나 저장하지 못했으면 None).
+        쓰기 버퍼 안에서는 버퍼의 변경까지 적용한 문서를 반환하고 저장은 나중에 한다.
+    """
+    user = get_current_user()
+    if not user:
+        return None
+
+    def apply(document: Any) -> Any:
+        return mutate(document if isinstance(document, default_type) else default_type())
+
+    work = get_unit_of_work()
+    if work is not None:
+        document = apply(load_user_document(name, default_type))
+        work.update(user, name, apply)
+        return document
+    return get_storage_backend().update_document(user, name, apply)
+
+
+def append_user_ops(name: str, ops: list[dict[str, Any]]) -> bool:
+    """현재 사용자 문서에 변경 연산(journal 모듈)을 추가한다.
+
+    JSON 백엔드에서는 문서 전체를 다시 쓰지 않고 변경 기록 끝에 추가한다.
+    """
+    user = get_current_user()
+    if not user:
+        return False
+    work = get_unit_of_work()
+    if work is not None:
+        work.append_ops(user, name, ops)
+        return True
+    return get_storage_backend().append_ops(user, name, ops)
 
 
 # 다이어리 엔트리 관련 함수
 def load_diary_entries() -> list[dict[str, Any]]:
     """다이어리 엔트리 목록을 로드한다."""
-    if "user" not in st.session_state or not st.session_state["user"]:
-        return []
-    return read_json(get_diary_path())
+    return load_user_document(DIARY_DOCUMENT)
 
 
 def save_diary_entries(entries: list[dict[str, Any]]) -> bool:
     """다이어리 엔트리 목록을 저장한다."""
-    if "user" not in st.session_state or not st.session_state["user"]:
-        return False
-    return write_json(get_diary_path(), entries)
+    return save_user_document(DIARY_DOCUMENT, entries)
+
+
+def update_diary_entries(
+    mutate: Callable[[list[dict[str, Any]]], list[dict[str, Any]]]
+) -> list[dict[str, Any]] | None:
+    """다이어리 엔트리 목록에 연산을 적용해 저장한다 (update_user_document 참고)."""
+    return update_user_document(DIARY_DOCUMENT, mutate)
 
 
 # 캘린더 이슈 관련 함수
 def load_calendar_issues() -> list[dict[str, Any]]:
     """캘린더 이슈 목록을 로드한다."""
-    if "user" not in st.session_state or not st.session_state["user"]:
-        return []
-    return read_json(get_calendar_path())
+    return load_user_document(CALENDAR_DOCUMENT)
 
 
 def save_calendar_issues(issues: list[dict[str, Any]]) -> bool:
     """캘린더 이슈 목록을 저장한다."""
-    if "user" not in st.session_state or not st.session_state["user"]:
-        return False
-    return write_json(get_calendar_path(), issues)
+    return save_user_document(CALENDAR_DOCUMENT, issues)
+
+
+def update_calendar_issues(
+    mutate: Callable[[list[dict[str, Any]]], list[dict[str, Any]]]
+) -> list[dict[str, Any]] | None:
+    """캘린더 이슈 목록에 연산을 적용해 저장한다 (update_user_document 참고)."""
+    return update_user_document(CALENDAR_DOCUMENT, mutate)
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -159,19 +973,13 @@ def read_json_dict(file_path: Path) -> dict[str, Any]:
         file_path: 읽을 JSON 파일 경로
         
     Returns:
-        JSON 데이터 딕셔너리 (파일이 없거나 비어있으면 빈 딕셔너리)
+        JSON 데이터 딕셔너리 (파일이 없거나 비어있으면 빈 딕셔너리).
+        파일이 손상되었으면 이전 세대(.bak)를 사용한다.
     """
     ensure_data_dir()
     
-    if not file_path.exists():
-        return {}
-    
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, dict) else {}
-    except (json.JSONDecodeError, IOError):
-        return {}
+    data = read_json_verified(file_path)
+    return data if isinstance(data, dict) else {}
 
 
 def write_json_dict(file_path: Path, data: dict[str, Any]) -> bool:
@@ -187,8 +995,7 @@ def write_json_dict(file_path: Path, data: dict[str, Any]) -> bool:
     ensure_data_dir()
     
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        atomic_write_json(file_path, data)
         return True
     except IOError:
         return False
@@ -196,16 +1003,24 @@ def write_json_dict(file_path: Path, data: dict[str, Any]) -> bool:
 
 def load_diary_entries_dict() -> dict[str, dict[str, Any]]:
     """다이어리 엔트리를 딕셔너리(key: article_id) 형태로 로드한다."""
-    if "user" not in st.session_state or not st.session_state["user"]:
-        return {}
-    return read_json_dict(get_diary_path())
+    return load_user_document(DIARY_DOCUMENT, dict)
 
 
 def save_diary_entries_dict(entries: dict[str, dict[str, Any]]) -> bool:
     """다이어리 엔트리를 딕셔너리 형태로 저장한다."""
-    if "user" not in st.session_state or not st.session_state["user"]:
-        return False
-    return write_json_dict(get_diary_path(), entries)
+    return save_user_document(DIARY_DOCUMENT, entries)
+
+
+def save_diary_entry(article_id: str, entry: dict[str, Any]) -> bool:
+    """기사 하나의 다이어리 엔트리를 추가하거나 수정한다 (딕셔너리 형식)."""
+    return append_user_ops(DIARY_DOCUMENT, [journal.entry_op(journal.UPDATE, article_id, entry)])
+
+
+def delete_diary_entries(article_ids: Iterable[str]) -> bool:
+    """기사들의 다이어리 엔트리를 삭제한다 (딕셔너리 형식, 없는 기사는 무시)."""
+    entries = load_diary_entries_dict()
+    ops = [journal.entry_op(journal.DELETE, i) for i in article_ids if i in entries]
+    return append_user_ops(DIARY_DOCUMENT, ops)
 
 
 def get_article_by_id(article_id: str) -> dict[str, Any] | None:
@@ -215,13 +1030,54 @@ def get_article_by_id(article_id: str) -> dict[str, Any] | None:
         article_id: 조회할 기사 ID
         
     Returns:
-        기사 딕셔너리 또는 None
+        현재 사용자에게 보이는 기사 딕셔너리 (없거나 삭제한 기사면 None)
     """
-    articles = load_news_articles()
-    for article in articles:
-        if article.get("id") == article_id:
-            return article
-    return None
+    user = get_current_user()
+    if not user:
+        return None
+
+    backend = get_storage_backend()
+    article = backend.get_article(article_id)
+    if article is None:
+        return None
+
+    work = get_unit_of_work()
+    if work is not None and work.has_pending(user, OVERLAY_FILENAME):
+        overlay = load_news_overlay()
+        flags = {
+            "is_favorite": article_id in overlay["favorites"],
+            "is_deleted": article_id in overlay["deleted"],
+            "is_visible": article_id in (overlay.get("visible") or ()),
+            "cleared_at": overlay["cleared_at"],
+        }
+    else:
+        if get_news_path().exists():
+            # 사용자별 파일 이전 전이면 오버레이를 먼저 만든다
+            load_news_overlay()
+        flags = backend.get_article_flags(user, article_id)
+    visible = {article_id} if flags.get("is_visible") else frozenset()
+    if flags["is_deleted"] or _is_hidden(article, set(), flags["cleared_at"], visible):
+        return None
+    if flags["is_favorite"]:
+        article = {**article, "is_favorite": True}
+    return article
+
+
+def set_article_favorite(article_id: str, value: bool) -> bool:
+    """현재 사용자의 기사 즐겨찾기 상태를 기사 한 건만 바꿔 저장한다.
+
+    Args:
+        article_id: 기사 ID
+        value: 즐겨찾기 여부
+
+    Returns:
+        성공 여부 (사용자에게 보이지 않는 기사면 False)
+    """
+    if get_article_by_id(article_id) is None:
+        return False
+    return _apply_overlay_ops(
+        get_current_user(), [journal.article_op(journal.FAVORITE, article_id, value)]
+    )
 
 
 def delete_diary_entry_by_article_id(article_id: str) -> bool:
@@ -233,9 +1089,104 @@ def delete_diary_entry_by_article_id(article_id: str) -> bool:
     Returns:
         삭제 성공 여부
     """
-    entries = load_diary_entries_dict()
-    if article_id in entries:
-        del entries[article_id]
-        return save_diary_entries_dict(entries)
-    return True  # 없어도 성공으로 간주
+    return delete_diary_entries([article_id])  # 없어도 성공으로 간주
+
+
+
+# ──────────────────────────────────────────────────────────────────
+# URL 기반 기사 ID 이전
+# ──────────────────────────────────────────────────────────────────
+
+def _needs_id_migration(article: dict[str, Any]) -> bool:
+    """URL이 있는데 URL 기반 ID가 아닌 기사인지 확인한다."""
+    return bool(article.get("url")) and not is_canonical_id(article.get("id"))
+
+
+def merge_article_record(target: dict[str, Any], other: dict[str, Any]) -> None:
+    """같은 기사로 식별된 두 레코드를 target 하나로 합친다.
+
+    여러 카테고리에서 수집된 경우 categories에 모두 기록하고,
+    즐겨찾기는 어느 한쪽이라도 켜져 있으면 유지한다.
+    """
+    categories = list(target.get("categories") or [target.get("category")])
+    for category in other.get("categories") or [other.get("category")]:
+        if category and category not in categories:
+            categories.append(category)
+    if len(categories) > 1:
+        target["categories"] = categories
+
+    if other.get("is_favorite"):
+        target["is_favorite"] = True
+    if other.get("collected_at") and other["collected_at"] < target.get("collected_at", other["collected_at"]):
+        target["collected_at"] = other["collected_at"]
+    for key in ("summary", "publisher"):
+        if not target.get(key) and other.get(key):
+            target[key] = other[key]
+
+
+def _remap_diary_entries(id_map: dict[str, str]) -> None:
+    """다이어리 파일의 기사 ID 참조를 새 ID로 바꾼다.
+
+    딕셔너리(key: article_id) 형식과 리스트(article_id 필드) 형식을 모두 처리하며,
+    두 엔트리가 같은 기사로 합쳐지면 더 최근에 수정된 엔트리를 남긴다.
+    """
+    entries_dict = load_diary_entries_dict()
+    if entries_dict:
+        remapped: dict[str, dict[str, Any]] = {}
+        for article_id, entry in entries_dict.items():
+            new_id = id_map.get(article_id, article_id)
+            current = remapped.get(new_id)
+            if current is None or entry.get("updated_at", "") > current.get("updated_at", ""):
+                remapped[new_id] = entry
+        if remapped != entries_dict:
+            save_diary_entries_dict(remapped)
+        return
+
+    entries_list = load_diary_entries()
+    changed = False
+    for entry in entries_list:
+        new_id = id_map.get(entry.get("article_id"))
+        if new_id:
+            entry["article_id"] = new_id
+            changed = True
+    if changed:
+        save_diary_entries(entries_list)
+
+
+def migrate_article_ids(articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """기사 ID를 URL 기반 결정적 ID로 이전한다.
+
+    같은 기사로 밝혀진 레코드는 하나로 합치며, 다이어리의 기사 참조도 함께 바꾼다.
+    기사 저장은 호출자가 한다.
+
+    Args:
+        articles: 현재 저장된 기사 리스트
+
+    Returns:
+        이전된 기사 리스트
+    """
+    id_map: dict[str, str] = {}
+    by_id: dict[str, dict[str, Any]] = {}
+    migrated: list[dict[str, Any]] = []
+
+    for article in articles:
+        old_id = article.get("id")
+        if article.get("url"):
+            article["url"] = canonical_article_url(article["url"])
+            new_id = article_id_from_url(article["url"])
+        else:
+            new_id = old_id
+        if old_id and old_id != new_id:
+            id_map[old_id] = new_id
+
+        existing = by_id.get(new_id)
+        if existing is not None:
+            merge_article_record(existing, article)
+            continue
+        article["id"] = new_id
+        by_id[new_id] = article
+        migrated.append(article)
 
+    if id_map:
+        _remap_diary_entries(id_map)
+    return migrated
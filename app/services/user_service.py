@@ -11,11 +11,15 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.header import Header
 from email.utils import formataddr
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import Any, Dict, Optional
 from datetime import datetime
 import streamlit as st
 
+from app.services.read_cache import thaw
+from app.services.storage_util import get_storage_backend
+
 # 프로젝트 루트 기준 data 폴더 경로
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 USERS_FILE = DATA_DIR / "users.json"
@@ -36,22 +40,22 @@ class UserService:
 
     @staticmethod
     def _load_users() -> Dict[str, Any]:
-        ensure_user_storage()
-        try:
-            with open(USERS_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {}
+        users = get_storage_backend().read_document(None, USERS_FILE.name)
+        return thaw(users) if isinstance(users, Mapping) else {}
 
     @staticmethod
-    def _save_users(users: Dict[str, Any]) -> bool:
-        ensure_user_storage()
-        try:
-            with open(USERS_FILE, "w", encoding="utf-8") as f:
-                json.dump(users, f, ensure_ascii=False, indent=2)
-            return True
-        except IOError:
-            return False
+    def _update_users(mutate: Callable[[dict[str, Any]], None]) -> bool:
+        """최신 사용자 목록에 mutate를 적용해 저장한다.
+
+        다른 세션이 그 사이 저장했으면 그 목록에 다시 적용하므로
+        동시에 가입해도 한쪽이 사라지지 않는다.
+        """
+        def apply(users: Any) -> dict[str, Any]:
+            users = users if isinstance(users, dict) else {}
+            mutate(users)
+            return users
+
+        return get_storage_backend().update_document(None, USERS_FILE.name, apply) is not None
 
     @classmethod
     def register(cls, username: str, password: str, email: str) -> tuple[bool, str]:
@@ -60,15 +64,23 @@ class UserService:
         if username in users:
             return False, "이미 존재하는 아이디입니다."
         
-        users[username] = {
+        record = {
             "password": hash_password(password),
             "email": email,
             "created_at": datetime.now().isoformat(),
             "reset_code": None,
             "is_verified": False
         }
-        
-        if cls._save_users(users):
+        taken = False
+
+        def add(users: dict[str, Any]) -> None:
+            nonlocal taken
+            taken = username in users
+            users.setdefault(username, record)
+
+        if cls._update_users(add):
+            if taken:
+                return False, "이미 존재하는 아이디입니다."
             # 사용자 전용 폴더 생성
             user_data_path = DATA_DIR / username
             user_data_path.mkdir(parents=True, exist_ok=True)
@@ -118,8 +130,10 @@ class UserService:
         """비밀번호 재설정 코드를 저장한다."""
         users = cls._load_users()
         if username in users:
-            users[username]["reset_code"] = code
-            return cls._save_users(users)
+            def set_code(users: dict[str, Any]) -> None:
+                if username in users:
+                    users[username]["reset_code"] = code
+            return cls._update_users(set_code)
         return False
 
     @classmethod
@@ -130,9 +144,12 @@ class UserService:
         if not user or user.get("reset_code") != code:
             return False, "인증 코드가 일치하지 않거나 사용자를 찾을 수 없습니다."
         
-        user["password"] = hash_password(new_password)
-        user["reset_code"] = None # 코드 사용 후 제거
-        if cls._save_users(users):
+        def reset(users: dict[str, Any]) -> None:
+            if username in users:
+                users[username]["password"] = hash_password(new_password)
+                users[username]["reset_code"] = None # 코드 사용 후 제거
+
+        if cls._update_users(reset):
             return True, "비밀번호가 성공적으로 변경되었습니다."
         return False, "저장 중 오류가 발생했습니다."
 
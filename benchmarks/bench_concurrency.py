@@ -0,0 +1,115 @@
+"""동시 세션 스트레스 벤치마크.
+
+같은 사용자로 여러 스레드(브라우저 탭)가 동시에 즐겨찾기, 기사 삭제,
+다이어리 저장, 캘린더 이슈 추가를 섞어 실행하고 처리량(ops/s)과
+충돌 재시도 횟수, 사라진 변경(lost update) 수를 출력한다.
+임시 폴더를 사용하므로 data/ 폴더는 건드리지 않는다.
+
+    python -m benchmarks.bench_concurrency [--threads 1 4 8] [--ops 200]
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from app.services import storage_util
+from app.services.calendar_service import CalendarService
+from app.services.news_service import delete_selected_articles, toggle_favorite
+from app.services.storage_backend import BACKEND_CHOICES, create_backend
+from benchmarks.bench_storage import make_articles
+
+USER = "bench"
+
+
+def worker(
+    index: int,
+    ops: int,
+    articles: list[dict[str, Any]],
+    barrier: threading.Barrier,
+) -> None:
+    """스레드 하나의 작업: 연산 네 가지를 번갈아 실행한다."""
+    calendar = CalendarService()
+    barrier.wait()
+    with storage_util.as_user(USER):
+        for j in range(ops):
+            article_id = articles[index * ops + j]["id"]
+            kind = j % 4
+            if kind == 0:
+                toggle_favorite(article_id)
+            elif kind == 1:
+                delete_selected_articles([article_id])
+            elif kind == 2:
+                storage_util.save_diary_entry(article_id, {"content": f"{index}-{j}"})
+            else:
+                calendar.create_issue("2026-10-17", f"이슈 {index}-{j}", "")
+
+
+def run(backend_name: str, threads: int, ops: int) -> dict[str, float]:
+    """스레드 threads개가 각각 ops번 연산했을 때의 결과를 측정한다."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        storage_util.DATA_DIR = data_dir
+        backend = storage_util.set_storage_backend(create_backend(backend_name, data_dir))
+
+        articles = make_articles(threads * ops)
+        with storage_util.as_user(USER):
+            storage_util.add_shared_articles(articles)
+            storage_util.load_news_articles()
+
+        barrier = threading.Barrier(threads + 1)
+        pool = [
+            threading.Thread(target=worker, args=(i, ops, articles, barrier))
+            for i in range(threads)
+        ]
+        for thread in pool:
+            thread.start()
+        barrier.wait()
+        started = time.perf_counter()
+        for thread in pool:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        # 연산 종류별 기대값과 실제 저장된 결과를 비교한다
+        expected = {kind: threads * len(range(kind, ops, 4)) for kind in range(4)}
+        with storage_util.as_user(USER):
+            overlay = storage_util.load_news_overlay()
+            actual = {
+                0: len(overlay["favorites"]),
+                1: len(overlay["deleted"]),
+                2: len(storage_util.load_diary_entries_dict()),
+                3: len(storage_util.load_calendar_issues()),
+            }
+        lost = sum(expected[kind] - actual[kind] for kind in expected)
+
+        result = {
+            "ops_per_sec": threads * ops / elapsed,
+            "conflicts": getattr(backend, "conflicts", 0),
+            "lost": lost,
+        }
+        storage_util.get_storage_backend().close()
+        return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    """명령행 인자로 벤치마크를 실행하고 결과 표를 출력한다."""
+    parser = argparse.ArgumentParser(description="동시 세션 스트레스 벤치마크")
+    parser.add_argument("--threads", nargs="+", type=int, default=[1, 4, 8])
+    parser.add_argument("--ops", type=int, default=200, help="스레드당 연산 수")
+    parser.add_argument("--backends", nargs="+", choices=BACKEND_CHOICES, default=list(BACKEND_CHOICES))
+    args = parser.parse_args(argv)
+
+    print(f"{'backend':<8} {'threads':>7} {'ops/s':>10} {'conflicts':>10} {'lost':>6}")
+    for threads in args.threads:
+        for backend_name in args.backends:
+            result = run(backend_name, threads, args.ops)
+            print(
+                f"{backend_name:<8} {threads:>7} {result['ops_per_sec']:>10.1f} "
+                f"{result['conflicts']:>10} {result['lost']:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""저장소 백엔드 벤치마크.
+
+JSON/SQLite 백엔드에서 기사 수(기본 1k/10k/100k)별로 일괄 저장, 전체 로드,
+변경 없이 다시 로드(읽기 캐시 적중), ID 조회, 즐겨찾기 토글,
+카테고리/날짜 조회 시간을 측정한다.
+임시 폴더를 사용하므로 data/ 폴더는 건드리지 않는다.
+
+    python -m benchmarks.bench_storage [--sizes 1000 10000 100000] [--repeat 50]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from app.services import storage_util
+from app.services.news_service import toggle_favorite
+from app.services.storage_backend import BACKEND_CHOICES, create_backend
+
+CATEGORIES = ["정치", "경제", "사회", "생활/문화", "IT/과학", "세계"]
+
+
+def make_articles(count: int) -> list[dict[str, Any]]:
+    """벤치마크용 기사를 만든다 (5분 간격으로 과거로 분포)."""
+    start = datetime(2026, 10, 17, 12, 0, 0)
+    articles = []
+    for i in range(count):
+        aid = f"{i:010d}"
+        articles.append({
+            "id": f"news_001_{aid}",
+            "title": f"벤치마크 기사 제목 {i}",
+            "url": f"https://n.news.naver.com/mnews/article/001/{aid}",
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "collected_at": (start - timedelta(minutes=5 * i)).isoformat(),
+            "source": "naver",
+            "summary": "요약 " * 20,
+            "publisher": "연합뉴스",
+        })
+    return articles
+
+
+def timed(func: Callable[[], Any], repeat: int = 1) -> float:
+    """함수를 repeat번 실행한 평균 시간(ms)을 반환한다."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+def run(backend_name: str, size: int, repeat: int) -> dict[str, float]:
+    """백엔드 하나를 기사 size건으로 측정한다."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        storage_util.DATA_DIR = data_dir
+        storage_util.set_storage_backend(create_backend(backend_name, data_dir))
+
+        articles = make_articles(size)
+        ids = [a["id"] for a in random.sample(articles, min(repeat, size))]
+        sample_date = articles[size // 2]["collected_at"][:10]
+
+        with storage_util.as_user("bench"):
+            result = {
+                "insert": timed(lambda: storage_util.add_shared_articles(articles)),
+                "load_all": timed(storage_util.load_news_articles),
+                "reload": timed(storage_util.load_news_articles, repeat),
+            }
+            it = iter(ids)
+            result["get_by_id"] = timed(
+                lambda: storage_util.get_article_by_id(next(it)), len(ids)
+            )
+            it = iter(ids)
+            result["toggle_favorite"] = timed(lambda: toggle_favorite(next(it)), len(ids))
+            result["by_category"] = timed(
+                lambda: storage_util.query_news_articles(category="경제")
+            )
+            result["by_date"] = timed(
+                lambda: storage_util.query_news_articles(date=sample_date)
+            )
+
+        storage_util.get_storage_backend().close()
+        return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    """명령행 인자로 벤치마크를 실행하고 결과 표를 출력한다."""
+    parser = argparse.ArgumentParser(description="저장소 백엔드 벤치마크")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000, 100000])
+    parser.add_argument("--backends", nargs="+", choices=BACKEND_CHOICES, default=list(BACKEND_CHOICES))
+    parser.add_argument("--repeat", type=int, default=50, help="한 건 연산 반복 횟수")
+    args = parser.parse_args(argv)
+
+    columns = ["insert", "load_all", "reload", "get_by_id", "toggle_favorite", "by_category", "by_date"]
+    print(f"{'backend':<8} {'size':>7} " + " ".join(f"{c:>16}" for c in columns) + "  (ms)")
+    for size in args.sizes:
+        for backend_name in args.backends:
+            result = run(backend_name, size, args.repeat)
+            print(
+                f"{backend_name:<8} {size:>7} "
+                + " ".join(f"{result[c]:>16.2f}" for c in columns)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""기사 식별자 모듈.
+
+네이버 기사 URL에서 언론사 ID(oid)와 기사 ID(aid)를 추출해
+URL 표기와 무관한 정규 URL과 결정적(deterministic) 기사 ID를 만든다.
+같은 기사는 몇 번을 수집하든, 어느 카테고리에서 수집하든 같은 ID를 갖는다.
+"""
+
+import hashlib
+import re
+from urllib.parse import parse_qs, urlsplit
+
+# /mnews/article/001/0014000001, /article/001/0014000001 형태의 경로
+_ARTICLE_PATH = re.compile(r"/(?:mnews/)?article/(?:comment/)?(\d{3,})/(\d{5,})")
+
+# 결정적 기사 ID 형식 (news_<oid>_<aid> 또는 URL 해시 기반 news_u<hash>)
+_CANONICAL_ID = re.compile(r"^news_(?:\d+_\d+|u[0-9a-f]{16})$")
+
+
+def extract_oid_aid(url: str) -> tuple[str, str] | None:
+    """기사 URL에서 (oid, aid)를 추출한다.
+
+    Args:
+        url: 기사 URL
+
+    Returns:
+        (oid, aid) 튜플 (네이버 기사 URL이 아니면 None)
+    """
+    if not url:
+        return None
+
+    parts = urlsplit(url)
+    match = _ARTICLE_PATH.search(parts.path)
+    if match:
+        return match.group(1), match.group(2)
+
+    # 구형 URL: /main/read.naver?oid=001&aid=0014000001
+    query = parse_qs(parts.query)
+    if query.get("oid") and query.get("aid"):
+        return query["oid"][0], query["aid"][0]
+    return None
+
+
+def canonical_article_url(url: str) -> str:
+    """기사 URL을 정규 형식으로 변환한다.
+
+    네이버 기사는 카테고리(sid) 등 쿼리와 무관하게
+    https://n.news.naver.com/mnews/article/<oid>/<aid> 로 통일하고,
+    그 밖의 URL은 fragment만 제거한다.
+    """
+    ids = extract_oid_aid(url)
+    if ids:
+        return f"https://n.news.naver.com/mnews/article/{ids[0]}/{ids[1]}"
+    return url.split("#", 1)[0] if url else url
+
+
+def article_id_from_url(url: str) -> str:
+    """기사 URL로부터 결정적 기사 ID를 만든다.
+
+    Args:
+        url: 기사 URL
+
+    Returns:
+        news_<oid>_<aid> (네이버 기사가 아니면 정규 URL 해시 기반 news_u<hash>)
+    """
+    ids = extract_oid_aid(url)
+    if ids:
+        return f"news_{ids[0]}_{ids[1]}"
+    digest = hashlib.sha1(canonical_article_url(url).encode("utf-8")).hexdigest()
+    return f"news_u{digest[:16]}"
+
+
+def is_canonical_id(article_id: str | None) -> bool:
+    """URL 기반 결정적 ID 형식인지 확인한다."""
+    return bool(article_id) and _CANONICAL_ID.match(article_id) is not None
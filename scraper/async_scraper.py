@@ -0,0 +1,316 @@
+"""비동기 네이버 뉴스 스크래퍼 모듈.
+
+Playwright async API로 카테고리들을 같은 프로세스 안에서 동시에 수집한다.
+카테고리마다 개별 제한 시간을 두어 느린 카테고리만 멈추고 (그때까지 받은 기사는 남긴다),
+Streamlit 등 동기 코드에서는 전용 이벤트 루프 스레드를 통해 사용한다.
+
+기본 수집 경로(naver_scraper.stream_categories)와 달리 항상 브라우저로 수집하는
+제한된 엔진이다. HTTP/auto 수집 방식(FETCH_MODES), 같은 수집 합치기(single-flight),
+수집 중 이벤트(on_event 진행 표시)는 지원하지 않으며, 속도 제한, 재시도와
+회로 차단기만 공유한다.
+"""
+
+import asyncio
+import sys
+import threading
+from collections.abc import Collection, Coroutine
+from typing import Any, TypeVar
+
+from scraper.naver_scraper import (
+    CATEGORIES,
+    CIRCUIT_BREAKERS,
+    DEFAULT_CONCURRENCY,
+    EXTRACTION_SPEC,
+    MORE_PAGE_TIMEOUT,
+    RATE_LIMITER,
+    RESOURCE_POLICY,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    ScraperError,
+    ensure_browser_ready,
+    get_wait_condition,
+    record_metrics,
+)
+from scraper.resilience import backoff_delay
+from scraper.worker import MAX_ARTICLES_PER_CATEGORY, CrawlLimit, scrape_page
+
+T = TypeVar("T")
+
+# 카테고리별 기본 수집 제한 시간 (초, 첫 페이지 기준)
+CATEGORY_DEADLINE = 40.0
+
+
+def category_deadline(max_items: int = MAX_ARTICLES_PER_CATEGORY) -> float:
+    """수집 한도에 맞춘 카테고리 제한 시간을 반환한다.
+
+    워커 수집(_stream_browser)과 같이 "더보기"가 필요한 페이지 수만큼
+    MORE_PAGE_TIMEOUT을 더한다.
+    """
+    extra_pages = max(0, -(-max_items // MAX_ARTICLES_PER_CATEGORY) - 1)
+    return CATEGORY_DEADLINE + MORE_PAGE_TIMEOUT * extra_pages
+
+
+async def _scrape_with_deadline(
+    browser: Any,
+    category: str,
+    deadline: float | None = None,
+    max_items: int = MAX_ARTICLES_PER_CATEGORY,
+    seen_urls: Collection[str] | None = None,
+) -> list[dict[str, Any]]:
+    """제한 시간 안에 한 카테고리를 수집한다.
+
+    시간을 넘기면 수집을 멈추고 그때까지 받은 기사를 반환한다
+    (하나도 받지 못했으면 ScraperError).
+    """
+    if deadline is None:
+        deadline = category_deadline(max_items)
+    metrics: dict[str, Any] = {}
+    received: list[dict[str, Any]] = []
+    try:
+        return await asyncio.wait_for(
+            scrape_page(
+                browser,
+                category,
+                CATEGORIES[category],
+                EXTRACTION_SPEC,
+                RESOURCE_POLICY,
+                get_wait_condition(category),
+                metrics,
+                on_article=received.append,
+                limit=CrawlLimit(max_items, seen_urls),
+            ),
+            timeout=deadline,
+        )
+    except TimeoutError:
+        if received:
+            return received
+        raise ScraperError(f"뉴스 수집 시간 초과 ({category})") from None
+    except ScraperError:
+        raise
+    except Exception as e:
+        raise ScraperError(f"뉴스 수집 실패 ({category}): {e}") from e
+    finally:
+        if metrics:
+            record_metrics(category, metrics)
+
+
+async def scrape_category_async(
+    category: str,
+    browser: Any | None = None,
+    deadline: float | None = None,
+    max_items: int = MAX_ARTICLES_PER_CATEGORY,
+    seen_urls: Collection[str] | None = None,
+) -> list[dict[str, Any]]:
+    """특정 카테고리의 뉴스를 비동기로 수집한다.
+
+    Args:
+        category: 수집할 카테고리
+        browser: 재사용할 Playwright 비동기 Browser (None이면 새로 실행)
+        deadline: 카테고리 수집 제한 시간 (초, None이면 max_items에 맞춘 시간)
+        max_items: 최대 수집 기사 수 (깊은 수집 한도)
+        seen_urls: 이미 수집한 기사 URL 집합 (증분 수집 중단 기준)
+
+    Returns:
+        수집된 기사 리스트
+
+    Raises:
+        ScraperError: 수집 실패 또는 시간 초과 시
+        ValueError: 잘못된 카테고리
+    """
+    if category not in CATEGORIES:
+        raise ValueError(f"지원하지 않는 카테고리: {category}")
+
+    if browser is not None:
+        return await _scrape_with_deadline(
+            browser, category, deadline, max_items, seen_urls
+        )
+
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            return await _scrape_with_deadline(
+                browser, category, deadline, max_items, seen_urls
+            )
+        finally:
+            await browser.close()
+
+
+async def scrape_all_categories_async(
+    categories: list[str] | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    deadline: float | None = None,
+    max_items: int = MAX_ARTICLES_PER_CATEGORY,
+    seen_urls: Collection[str] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """여러 카테고리의 뉴스를 하나의 브라우저로 비동기 수집한다.
+
+    세마포어로 동시 페이지 수를 제한하고, 각 카테고리의 제한 시간은
+    해당 카테고리가 실행을 시작한 시점부터 적용된다. 시간을 넘긴
+    카테고리는 그때까지 받은 기사만 남기며 나머지 결과는 그대로 반환된다.
+    실패한 카테고리는 백오프 후 재시도하고, 회로가 열린 카테고리는 건너뛴다.
+
+    Args:
+        categories: 수집할 카테고리 리스트 (None이면 전체)
+        concurrency: 동시에 수집할 최대 카테고리 수
+        deadline: 카테고리별 수집 제한 시간 (초, None이면 max_items에 맞춘 시간)
+        max_items: 카테고리별 최대 수집 기사 수 (깊은 수집 한도)
+        seen_urls: 이미 수집한 기사 URL 집합 (증분 수집 중단 기준)
+
+    Returns:
+        카테고리별 기사 딕셔너리 (실패하거나 기사 없이 시간을 넘긴 카테고리는 빈 리스트)
+    """
+    if categories is None:
+        categories = list(CATEGORIES.keys())
+
+    for category in categories:
+        if category not in CATEGORIES:
+            raise ValueError(f"지원하지 않는 카테고리: {category}")
+
+    if not categories:
+        return {}
+
+    from playwright.async_api import async_playwright
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+
+        async def run_one(category: str) -> list[dict[str, Any]]:
+            breaker = CIRCUIT_BREAKERS.get(category)
+            if not breaker.allow():
+                # 연속 실패로 회로가 열린 카테고리는 요청하지 않는다
+                return []
+
+            error = None
+            for attempt in range(RETRY_ATTEMPTS + 1):
+                if attempt:
+                    await asyncio.sleep(
+                        backoff_delay(attempt, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+                    )
+                async with semaphore:
+                    await asyncio.sleep(RATE_LIMITER.reserve())
+                    try:
+                        articles = await _scrape_with_deadline(
+                            browser, category, deadline, max_items, seen_urls
+                        )
+                    except ScraperError as e:
+                        error = str(e)
+                        continue
+                breaker.record_success()
+                return articles
+
+            # 재시도까지 실패한 카테고리는 빈 리스트로 처리
+            breaker.record_failure(error)
+            return []
+
+        try:
+            results = await asyncio.gather(*(run_one(c) for c in categories))
+        finally:
+            await browser.close()
+
+    return dict(zip(categories, results, strict=True))
+
+
+class EventLoopRunner:
+    """전용 스레드에서 이벤트 루프를 계속 실행하는 관리형 루프.
+
+    Streamlit 스크립트 스레드처럼 이벤트 루프가 없거나 이미 사용 중인
+    동기 코드에서 코루틴을 안전하게 실행하기 위해 사용한다.
+    """
+
+    def __init__(self) -> None:
+        """관리형 이벤트 루프를 초기화한다 (스레드는 첫 실행 시 시작)."""
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """루프 스레드가 없으면 시작하고 루프를 반환한다."""
+        with self._lock:
+            if self._loop is None or not self._thread or not self._thread.is_alive():
+                # Windows에서는 subprocess 지원을 위해 Proactor 루프가 필요하다
+                if sys.platform == "win32":
+                    loop = asyncio.ProactorEventLoop()
+                else:
+                    loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="scraper-event-loop",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """코루틴을 관리형 루프에서 실행하고 결과를 기다린다.
+
+        Args:
+            coro: 실행할 코루틴
+            timeout: 전체 대기 제한 시간 (초, None이면 무제한)
+
+        Returns:
+            코루틴 결과
+        """
+        loop = self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise ScraperError("뉴스 수집 시간 초과") from None
+
+    def stop(self) -> None:
+        """루프를 중지한다."""
+        with self._lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                if self._thread is not None:
+                    self._thread.join(timeout=5)
+                self._loop = None
+                self._thread = None
+
+
+_runner = EventLoopRunner()
+
+
+def get_event_loop_runner() -> EventLoopRunner:
+    """프로세스 공용 관리형 이벤트 루프를 반환한다."""
+    return _runner
+
+
+def collect_categories(
+    categories: list[str] | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    deadline: float | None = None,
+    max_items: int = MAX_ARTICLES_PER_CATEGORY,
+    seen_urls: Collection[str] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """동기 코드에서 비동기 엔진으로 여러 카테고리를 수집한다.
+
+    수집 방식 지정, 같은 수집 합치기, 진행 이벤트가 없는 제한된 엔진이다 (모듈 설명 참고).
+
+    Args:
+        categories: 수집할 카테고리 리스트 (None이면 전체)
+        concurrency: 동시에 수집할 최대 카테고리 수
+        deadline: 카테고리별 수집 제한 시간 (초, None이면 max_items에 맞춘 시간)
+        max_items: 카테고리별 최대 수집 기사 수 (깊은 수집 한도)
+        seen_urls: 이미 수집한 기사 URL 집합 (증분 수집 중단 기준)
+
+    Returns:
+        카테고리별 기사 딕셔너리
+    """
+    try:
+        ensure_browser_ready()
+    except ScraperError:
+        return {category: [] for category in categories or CATEGORIES}
+    return _runner.run(
+        scrape_all_categories_async(
+            categories, concurrency, deadline, max_items, seen_urls
+        )
+    )
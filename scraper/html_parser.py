@@ -0,0 +1,222 @@
+"""경량 HTML 파서 모듈.
+
+표준 라이브러리 html.parser로 요소 트리를 만들고, 네이버 섹션 페이지
+파싱에 필요한 만큼의 CSS 셀렉터(태그, 클래스, id, 자손 결합자)를 지원한다.
+닫는 태그가 생략된 <li>/<p> 등은 브라우저처럼 다음 형제 요소에서 닫는다.
+브라우저 없이 서버 렌더링된 기사 목록을 파싱하기 위해 사용한다.
+"""
+
+from html.parser import HTMLParser
+
+# 닫는 태그가 없는 요소
+VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+})
+
+# 내용을 텍스트로 취급하지 않는 요소
+_SKIP_TEXT_ELEMENTS = frozenset({"script", "style", "template"})
+
+# 텍스트에서 줄바꿈(공백)으로 취급하는 요소
+_LINE_BREAK_ELEMENTS = frozenset({"br"})
+
+# 닫는 태그를 생략할 수 있는 요소: 태그 -> (암묵적으로 닫는 열린 요소, 탐색을 멈추는 조상 요소)
+# (<li>가 닫히지 않은 채 다음 <li>가 오면 앞의 <li>를 닫는다)
+_IMPLIED_END_TAGS = {
+    "li": (frozenset({"li"}), frozenset({"ul", "ol"})),
+    "dt": (frozenset({"dt", "dd"}), frozenset({"dl"})),
+    "dd": (frozenset({"dt", "dd"}), frozenset({"dl"})),
+    "tr": (frozenset({"tr", "td", "th"}), frozenset({"table", "thead", "tbody", "tfoot"})),
+    "td": (frozenset({"td", "th"}), frozenset({"tr", "table"})),
+    "th": (frozenset({"td", "th"}), frozenset({"tr", "table"})),
+    "option": (frozenset({"option"}), frozenset({"select", "datalist", "optgroup"})),
+    "p": (frozenset({"p"}), frozenset({"div", "section", "article", "td", "li"})),
+}
+
+
+class Node:
+    """HTML 요소 노드."""
+
+    __slots__ = ("tag", "attrs", "classes", "children", "parent")
+
+    def __init__(
+        self,
+        tag: str,
+        attrs: dict[str, str] | None = None,
+        parent: "Node | None" = None,
+    ) -> None:
+        """요소 노드를 생성한다."""
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.classes = frozenset(self.attrs.get("class", "").split())
+        self.children: list[Node | str] = []
+        self.parent = parent
+
+    def get(self, name: str, default: str | None = None) -> str | None:
+        """속성 값을 반환한다."""
+        return self.attrs.get(name, default)
+
+    def iter_descendants(self):
+        """자손 요소를 문서 순서대로 순회한다."""
+        stack = [child for child in reversed(self.children) if isinstance(child, Node)]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(
+                child for child in reversed(node.children) if isinstance(child, Node)
+            )
+
+    def text(self) -> str:
+        """공백을 정리한 하위 텍스트 전체를 반환한다."""
+        parts: list[str] = []
+        stack: list[Node | str] = [self]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                parts.append(item)
+            elif item.tag in _LINE_BREAK_ELEMENTS:
+                parts.append(" ")
+            elif item.tag not in _SKIP_TEXT_ELEMENTS:
+                stack.extend(reversed(item.children))
+        return " ".join("".join(parts).split())
+
+    def select(self, selector: str) -> list["Node"]:
+        """셀렉터와 일치하는 자손 요소 리스트를 반환한다."""
+        compounds = _parse_selector(selector)
+        if not compounds:
+            return []
+        return [node for node in self.iter_descendants() if _matches(node, compounds)]
+
+    def select_one(self, selector: str) -> "Node | None":
+        """셀렉터와 일치하는 첫 번째 자손 요소를 반환한다."""
+        compounds = _parse_selector(selector)
+        if not compounds:
+            return None
+        for node in self.iter_descendants():
+            if _matches(node, compounds):
+                return node
+        return None
+
+
+# (태그, id, 클래스 집합) 형태의 단일 셀렉터
+_Compound = tuple[str | None, str | None, frozenset[str]]
+
+_selector_cache: dict[str, list[_Compound]] = {}
+
+
+def _parse_compound(token: str) -> _Compound:
+    """'li.sa_item#x' 같은 단일 셀렉터를 분해한다."""
+    tag = None
+    element_id = None
+    classes = []
+
+    buf = ""
+    kind = "tag"
+    for ch in token + ".":
+        if ch in ".#":
+            if buf:
+                if kind == "tag":
+                    tag = None if buf == "*" else buf.lower()
+                elif kind == "class":
+                    classes.append(buf)
+                else:
+                    element_id = buf
+            buf = ""
+            kind = "class" if ch == "." else "id"
+        else:
+            buf += ch
+    return tag, element_id, frozenset(classes)
+
+
+def _parse_selector(selector: str) -> list[_Compound]:
+    """자손 결합자로 이어진 셀렉터를 단일 셀렉터 리스트로 분해한다."""
+    compounds = _selector_cache.get(selector)
+    if compounds is None:
+        compounds = [_parse_compound(token) for token in selector.split()]
+        _selector_cache[selector] = compounds
+    return compounds
+
+
+def _matches_compound(node: Node, compound: _Compound) -> bool:
+    """노드가 단일 셀렉터와 일치하는지 확인한다."""
+    tag, element_id, classes = compound
+    if tag is not None and node.tag != tag:
+        return False
+    if element_id is not None and node.attrs.get("id") != element_id:
+        return False
+    return classes <= node.classes
+
+
+def _matches(node: Node, compounds: list[_Compound]) -> bool:
+    """노드가 자손 결합자 셀렉터 전체와 일치하는지 확인한다."""
+    if not _matches_compound(node, compounds[-1]):
+        return False
+
+    index = len(compounds) - 2
+    ancestor = node.parent
+    while index >= 0 and ancestor is not None:
+        if _matches_compound(ancestor, compounds[index]):
+            index -= 1
+        ancestor = ancestor.parent
+    return index < 0
+
+
+class _TreeBuilder(HTMLParser):
+    """HTMLParser 이벤트로 요소 트리를 구성한다."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document")
+        self._stack = [self.root]
+
+    def _close_implied(self, tag: str) -> None:
+        """새 요소가 암묵적으로 닫는 열린 요소를 닫는다."""
+        rule = _IMPLIED_END_TAGS.get(tag)
+        if rule is None:
+            return
+        closes, scope = rule
+        for i in range(len(self._stack) - 1, 0, -1):
+            open_tag = self._stack[i].tag
+            if open_tag in closes:
+                del self._stack[i:]
+                return
+            if open_tag in scope:
+                return
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._close_implied(tag)
+        parent = self._stack[-1]
+        node = Node(tag, {k: v or "" for k, v in attrs}, parent)
+        parent.children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._close_implied(tag)
+        parent = self._stack[-1]
+        parent.children.append(Node(tag, {k: v or "" for k, v in attrs}, parent))
+
+    def handle_endtag(self, tag: str) -> None:
+        # 닫히지 않은 하위 요소가 있으면 함께 닫는다 (짝이 없는 닫는 태그는 무시)
+        for i in range(len(self._stack) - 1, 0, -1):
+            if self._stack[i].tag == tag:
+                del self._stack[i:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        self._stack[-1].children.append(data)
+
+
+def parse_html(html_content: str) -> Node:
+    """HTML 문자열을 요소 트리로 파싱한다.
+
+    Args:
+        html_content: HTML 문자열
+
+    Returns:
+        문서 루트 노드
+    """
+    builder = _TreeBuilder()
+    builder.feed(html_content)
+    builder.close()
+    return builder.root
@@ -0,0 +1,64 @@
+"""HTTP 섹션 페이지 조회 모듈.
+
+브라우저 없이 네이버 뉴스 섹션 HTML을 가져온다.
+커넥션 풀을 가진 requests 세션을 프로세스 전체에서 공유한다.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 요청 제한 시간 (초): (연결, 읽기)
+REQUEST_TIMEOUT = (5, 10)
+
+# 호스트별 커넥션 풀 크기
+POOL_SIZE = 10
+
+# 데스크톱 브라우저와 같은 응답을 받기 위한 기본 헤더
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """커넥션 풀을 공유하는 프로세스 공용 세션을 반환한다."""
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(DEFAULT_HEADERS)
+            _session = session
+        return _session
+
+
+def fetch_html(url: str, timeout: tuple[float, float] = REQUEST_TIMEOUT) -> str:
+    """URL의 HTML을 가져온다.
+
+    Args:
+        url: 조회할 페이지 URL
+        timeout: (연결, 읽기) 제한 시간 (초)
+
+    Returns:
+        응답 HTML 문자열
+
+    Raises:
+        requests.RequestException: 요청 실패 또는 오류 응답 시
+    """
+    response = get_session().get(url, timeout=timeout)
+    response.raise_for_status()
+    if not response.encoding or response.encoding.lower() == "iso-8859-1":
+        response.encoding = response.apparent_encoding or "utf-8"
+    return response.text
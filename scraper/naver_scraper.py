@@ -4,13 +4,31 @@ Playwright를 사용하여 네이버 뉴스 6개 카테고리의 기사를 수
 subprocess를 사용하여 Windows Streamlit 호환성을 보장한다.
 """
 
+import hashlib
 import json
 import subprocess
 import sys
-from datetime import datetime
+import tempfile
+import threading
+import time
+from collections.abc import Collection, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
+from scraper.article_id import article_id_from_url
+from scraper.html_parser import parse_html
+from scraper.preflight import ensure_browser
+from scraper.resilience import (
+    CircuitBreakerRegistry,
+    TokenBucket,
+    backoff_delay,
+    call_with_retry,
+)
+from scraper.selectors import MAIN_SELECTORS, build_extraction_spec
+from scraper.single_flight import SingleFlight
+from scraper.worker import MAX_ARTICLES_PER_CATEGORY, CrawlLimit, rows_to_articles
+
 
 class ScraperError(Exception):
     """스크래퍼 관련 예외."""
@@ -37,6 +55,78 @@ CATEGORIES = {
     "세계": "https://news.naver.com/section/104",
 }
 
+# 워커 프로세스 실행 기준 디렉토리 (scraper 패키지를 import 할 수 있는 위치)
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 워커 프로세스 제한 시간 (초)
+WORKER_TIMEOUT = 60
+
+# 깊은 수집("더보기" 반복) 시 카테고리당 기본 최대 기사 수
+DEEP_CRAWL_MAX_ITEMS = 300
+
+# "더보기" 한 번당 워커 제한 시간에 더하는 시간 (초)
+MORE_PAGE_TIMEOUT = 10
+
+# scrape_all_categories 기본 동시 수집 카테고리 수
+DEFAULT_CONCURRENCY = 3
+
+# 요청 속도 제한: 초당 허용 페이지 요청 수와 순간 최대 요청 수 (프로세스 공용)
+RATE_LIMIT_PER_SECOND = 2.0
+RATE_LIMIT_BURST = 6
+
+# 일시적 오류 재시도 횟수와 지수 백오프 기준/상한 시간 (초)
+RETRY_ATTEMPTS = 2
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 10.0
+
+# 연속 실패가 이만큼 쌓인 카테고리는 BREAKER_COOLDOWN(초) 동안 건너뛴다
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN = 600.0
+
+RATE_LIMITER = TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+CIRCUIT_BREAKERS = CircuitBreakerRegistry(BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN)
+
+# 같은 카테고리의 끝난 수집 결과를 다른 호출자가 재사용하는 시간 (초)
+COLLECT_FRESHNESS = 30.0
+
+# 프로세스 간 수집 합치기용 잠금/결과 파일 폴더 (None이면 프로세스 안에서만 합침)
+COALESCE_LOCK_DIR: Path | None = PROJECT_ROOT / "data" / ".collect_locks"
+
+# 다른 호출자의 수집을 기다리는 최대 시간 (초)
+COALESCE_WAIT_TIMEOUT = 600.0
+
+# 수집 방식: "http"(브라우저 없이 HTML 파싱), "browser"(Playwright),
+# "auto"(HTTP 파싱 결과가 없을 때만 Playwright로 재시도)
+FETCH_MODE_CHOICES = ("http", "browser", "auto")
+DEFAULT_FETCH_MODE = "auto"
+
+# 카테고리별 수집 방식 (없으면 DEFAULT_FETCH_MODE)
+FETCH_MODES: dict[str, str] = {}
+
+# 수집 중 차단할 리소스 정책 (None이면 모든 요청 허용)
+RESOURCE_POLICY: dict[str, Any] | None = {
+    # 기사 목록 추출에 필요 없는 리소스 종류
+    "blocked_resource_types": ["image", "font", "media", "texttrack"],
+    # 이 도메인(및 하위 도메인) 밖의 서드파티 요청은 모두 차단
+    "allowed_host_suffixes": ["naver.com", "naver.net", "pstatic.net"],
+    # 허용 도메인 안의 광고/트래킹 호스트
+    "blocked_host_suffixes": [
+        "ad.naver.com",
+        "veta.naver.com",
+        "tivan.naver.com",
+        "lcs.naver.com",
+        "nelo2-col.navercorp.com",
+    ],
+}
+
+# 페이지 로드 조건: "selector"(기사 목록 셀렉터 등장), "domcontentloaded",
+# "load", "networkidle"
+WAIT_CONDITION_CHOICES = ("selector", "domcontentloaded", "load", "networkidle")
+DEFAULT_WAIT_CONDITION = "selector"
+
+# 카테고리별 로드 조건 (없으면 DEFAULT_WAIT_CONDITION)
+WAIT_CONDITIONS: dict[str, str] = {}
+
 # 뉴스 기사 선택자
 SELECTORS = {
     "article_list": "ul.sa_list li.sa_item",
@@ -44,16 +134,42 @@ SELECTORS = {
     "article_link": "a.sa_text_title",
 }
 
+# 기사 목록 추출 명세 (브라우저/HTTP 수집 공용)
+EXTRACTION_SPEC = build_extraction_spec(
+    MAX_ARTICLES_PER_CATEGORY, {**MAIN_SELECTORS, **SELECTORS}
+)
+
+
+def generate_article_id(url: str) -> str:
+    """기사 URL로부터 결정적 기사 ID를 생성한다 (news_<oid>_<aid>)."""
+    return article_id_from_url(url)
+
+
+def _extract_rows(html_content: str) -> list[dict[str, Any]]:
+    """HTML의 모든 기사 목록 항목에서 추출 명세의 필드를 읽는다."""
+    root = parse_html(html_content)
 
-def generate_article_id(category: str) -> str:
-    """고유 기사 ID를 생성한다."""
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
-    return f"news_{category}_{timestamp}"
+    rows = []
+    for element in root.select(EXTRACTION_SPEC["item"]):
+        row = {}
+        for name, field in EXTRACTION_SPEC["fields"].items():
+            node = element.select_one(field["selector"])
+            if node is None:
+                row[name] = None
+            elif field["attr"]:
+                row[name] = node.get(field["attr"])
+            else:
+                row[name] = node.text()
+        rows.append(row)
+    return rows
 
 
 def parse_articles(html_content: str, category: str) -> list[dict[str, Any]]:
     """HTML에서 기사 정보를 파싱한다.
     
+    브라우저 없이 서버 렌더링된 섹션 HTML을 파싱하며,
+    브라우저 수집과 같은 추출 명세(EXTRACTION_SPEC)로 제목/링크/요약/언론사를 추출한다.
+
     Args:
         html_content: 페이지 HTML 내용
         category: 뉴스 카테고리
@@ -63,148 +179,646 @@ def parse_articles(html_content: str, category: str) -> list[dict[str, Any]]:
     """
     if not html_content or not html_content.strip():
         return []
-    
-    # 실제 파싱은 Playwright 페이지 객체에서 수행
-    # 이 함수는 빈 HTML 체크를 위한 유틸리티
-    return []
 
+    rows = _extract_rows(html_content)[:EXTRACTION_SPEC["limit"]]
+    return rows_to_articles(rows, category)
 
-def scrape_category(category: str) -> list[dict[str, Any]]:
-    """특정 카테고리의 뉴스를 수집한다.
+
+def scrape_category_static(
+    category: str, limit: CrawlLimit | None = None
+) -> list[dict[str, Any]]:
+    """브라우저 없이 HTTP 요청만으로 카테고리 뉴스를 수집한다.
     
-    별도 Python 프로세스에서 Playwright를 실행하여 Windows 호환성을 보장한다.
-    Streamlit Cloud 환경에서는 브라우저 자동 설치를 시도한다.
+    HTTP 응답에는 첫 페이지 목록만 있으므로 "더보기"는 따라가지 않는다.
     
     Args:
-        category: 수집할 카테고리 (정치, 경제, 사회, 생활/문화, IT/과학, 세계)
+        category: 수집할 카테고리
+        limit: 수집 한도와 중단 조건 (None이면 parse_articles와 같은 개수)
         
     Returns:
-        수집된 기사 리스트
+        수집된 기사 리스트 (서버 렌더링 목록이 없으면 빈 리스트)
         
     Raises:
-        ScraperError: 수집 실패 시
+        ScraperError: 요청 실패 시
         ValueError: 잘못된 카테고리
     """
     if category not in CATEGORIES:
         raise ValueError(f"지원하지 않는 카테고리: {category}")
 
-    # Streamlit Cloud 환경 등을 위한 브라우저 설치 확인 및 실행
     try:
-        import playwright
-        # 브라우저가 없는 경우 설치 시도
-        subprocess.run([sys.executable, "-m", "playwright", "install", "chromium"], check=False)
-    except ImportError:
-        pass
-    
-    # 별도 프로세스에서 실행할 스크립트
-    script = '''
-import json
-from datetime import datetime
-from playwright.sync_api import sync_playwright
+        import requests
 
-category = {category!r}
-url = {url!r}
-selectors = {selectors!r}
+        from scraper.http_fetcher import fetch_html
+    except ImportError as e:
+        raise ScraperError(f"HTTP 수집을 사용할 수 없습니다: {e}") from e
 
-articles = []
+    RATE_LIMITER.acquire()
+    try:
+        html_content = fetch_html(CATEGORIES[category])
+    except requests.RequestException as e:
+        raise ScraperError(f"뉴스 페이지 요청 실패 ({category}): {e}") from e
 
-try:
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        page.goto(url, wait_until="networkidle", timeout=30000)
-        
-        article_elements = page.query_selector_all(selectors["article_list"])
-        collected_at = datetime.now().isoformat()
-        
-        for i, element in enumerate(article_elements[:20]):
-            try:
-                title_element = element.query_selector(selectors["article_title"])
-                if not title_element:
-                    continue
-                
-                title = title_element.inner_text()
-                link = title_element.get_attribute("href")
-                
-                if not title or not link:
-                    continue
-                
-                if link.startswith("/"):
-                    link = f"https://news.naver.com{{link}}"
-                
-                timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
-                article = {{
-                    "id": f"news_{{category}}_{{timestamp}}_{{i}}",
-                    "title": title.strip(),
-                    "url": link,
-                    "category": category,
-                    "collected_at": collected_at,
-                    "source": "naver",
-                }}
-                articles.append(article)
-            except Exception:
-                continue
+    if limit is None:
+        return parse_articles(html_content, category)
+
+    articles = []
+    for article in rows_to_articles(_extract_rows(html_content), category):
+        if limit.accept(article):
+            articles.append(article)
+        if limit.done:
+            break
+    return articles
+
+
+def get_fetch_mode(category: str, fetch_modes: dict[str, str] | None = None) -> str:
+    """카테고리의 수집 방식을 반환한다.
+
+    Args:
+        category: 카테고리
+        fetch_modes: 호출 시 지정한 카테고리별 수집 방식 (FETCH_MODES보다 우선)
         
-        browser.close()
-except Exception as e:
-    print(json.dumps({{"error": str(e)}}))
-else:
-    print(json.dumps({{"articles": articles}}))
-'''.format(
-        category=category,
-        url=CATEGORIES[category],
-        selectors=SELECTORS,
-    )
+    Returns:
+        "http", "browser" 또는 "auto"
+    """
+    mode = (fetch_modes or {}).get(category) or FETCH_MODES.get(category, DEFAULT_FETCH_MODE)
+    if mode not in FETCH_MODE_CHOICES:
+        raise ValueError(f"지원하지 않는 수집 방식: {mode}")
+    return mode
+
+
+def _try_static(
+    category: str,
+    mode: str,
+    max_items: int = MAX_ARTICLES_PER_CATEGORY,
+    seen_urls: Collection[str] | None = None,
+) -> list[dict[str, Any]] | None:
+    """HTTP 수집을 시도한다.
+
+    "auto" 방식에서는 HTTP 결과가 비었거나, 한도에도 이전 수집분에도 닿지 못해
+    더 깊이 수집해야 하는 경우 브라우저 수집으로 넘긴다.
     
+    Returns:
+        기사 리스트 (브라우저 수집으로 넘어가야 하면 None)
+    """
+    if mode == "browser":
+        return None
+
+    # "auto"는 브라우저 수집이 재시도 역할을 하므로 HTTP 재시도는 "http"에서만 한다
+    limit = CrawlLimit(max_items, seen_urls)
     try:
-        result = subprocess.run(
-            [sys.executable, "-c", script],
-            capture_output=True,
+        articles = call_with_retry(
+            scrape_category_static,
+            category,
+            limit,
+            retries=RETRY_ATTEMPTS if mode == "http" else 0,
+            base_delay=RETRY_BASE_DELAY,
+            max_delay=RETRY_MAX_DELAY,
+            retry_on=(ScraperError,),
+        )
+    except ScraperError:
+        if mode == "http":
+            raise
+        return None
+    if mode == "http":
+        return articles
+    if not articles and not limit.stopped_at_seen:
+        return None
+    if not limit.done and max_items > MAX_ARTICLES_PER_CATEGORY:
+        return None
+    return articles
+
+
+# 마지막 브라우저 수집의 카테고리별 측정값
+_last_metrics: dict[str, dict[str, Any]] = {}
+
+
+def get_wait_condition(category: str) -> str:
+    """카테고리의 페이지 로드 조건을 반환한다."""
+    condition = WAIT_CONDITIONS.get(category, DEFAULT_WAIT_CONDITION)
+    if condition not in WAIT_CONDITION_CHOICES:
+        raise ValueError(f"지원하지 않는 로드 조건: {condition}")
+    return condition
+
+
+def record_metrics(category: str, metrics: dict[str, Any]) -> None:
+    """카테고리의 브라우저 수집 측정값을 기록한다."""
+    _last_metrics[category] = dict(metrics)
+
+
+def get_last_metrics() -> dict[str, dict[str, Any]]:
+    """카테고리별 마지막 브라우저 수집 측정값을 반환한다.
+
+    Returns:
+        {카테고리: {"ready_ms", "bytes_transferred", "requests", "blocked_requests"}}
+    """
+    return {category: dict(metrics) for category, metrics in _last_metrics.items()}
+
+
+_collections: SingleFlight | None = None
+_collections_lock = threading.Lock()
+
+
+def get_collection_flights() -> SingleFlight:
+    """카테고리 수집을 합치는 프로세스 공용 single-flight 그룹을 반환한다."""
+    global _collections
+
+    with _collections_lock:
+        if _collections is None:
+            _collections = SingleFlight(
+                COLLECT_FRESHNESS,
+                COALESCE_LOCK_DIR,
+                lock_timeout=COALESCE_WAIT_TIMEOUT,
+                external_error=ScraperError,
+            )
+        return _collections
+
+
+def _flight_keys(
+    categories: list[str],
+    fetch_modes: dict[str, str] | None,
+    max_items: int,
+    seen_urls: Collection[str] | None,
+) -> dict[str, str]:
+    """카테고리별로 수집 결과를 공유할 수 있는 요청끼리 같은 키를 만든다.
+
+    수집 방식과 한도, 이미 수집한 URL 집합(다이제스트)이 모두 같아야 같은
+    결과가 나오므로 키에 함께 넣는다.
+    """
+    seen = hashlib.sha1("\n".join(sorted(seen_urls or ())).encode("utf-8")).hexdigest()[:16]
+    return {
+        category: f"{category}|{get_fetch_mode(category, fetch_modes)}|{max_items}|{seen}"
+        for category in categories
+    }
+
+
+def get_circuit_states() -> dict[str, dict[str, Any]]:
+    """카테고리별 회로 차단기 상태를 반환한다.
+
+    Returns:
+        {카테고리: {"state", "probing", "consecutive_failures", "total_failures",
+        "last_error", "retry_in"}} (한 번도 수집하지 않은 카테고리는 없음)
+    """
+    return CIRCUIT_BREAKERS.snapshot()
+
+
+def reset_circuit(category: str | None = None) -> None:
+    """카테고리의 실패 기록과 차단 상태를 초기화한다 (None이면 전체)."""
+    CIRCUIT_BREAKERS.reset(category)
+
+
+def ensure_browser_ready() -> None:
+    """수집 전에 브라우저 사용 가능 여부를 확인한다.
+
+    점검은 프로세스(또는 배포)당 한 번만 수행되며, 실패한 경우에만 설치를 시도한다.
+
+    Raises:
+        ScraperError: 브라우저를 사용할 수 없는 경우
+    """
+    status = ensure_browser()
+    if not status["ok"]:
+        raise ScraperError(f"Playwright 브라우저를 사용할 수 없습니다: {status['error']}")
+
+
+def _stream_worker(
+    categories: list[str],
+    concurrency: int = 1,
+    timeout: float = WORKER_TIMEOUT,
+    max_items: int = MAX_ARTICLES_PER_CATEGORY,
+    seen_urls: Collection[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """워커 프로세스 하나로 여러 카테고리를 수집하며 이벤트를 순서대로 내보낸다.
+
+    워커는 브라우저를 한 번만 띄우고 카테고리마다 별도 페이지를 사용하며,
+    기사/진행/오류 이벤트를 JSON Lines로 즉시 출력한다.
+    제너레이터를 중간에 닫으면 워커 프로세스도 종료된다.
+
+    Args:
+        categories: 수집할 카테고리 리스트
+        concurrency: 동시에 수집할 최대 카테고리 수
+        timeout: 워커 프로세스 제한 시간 (초)
+        max_items: 카테고리별 최대 수집 기사 수
+        seen_urls: 이미 수집한 기사 URL 집합 (증분 수집 중단 기준)
+
+    Yields:
+        워커 이벤트 딕셔너리 (scraper.worker.scrape_categories 참고)
+
+    Raises:
+        ScraperError: 워커 프로세스 자체가 실패하거나 시간을 초과한 경우
+    """
+    config = {
+        "targets": {category: CATEGORIES[category] for category in categories},
+        "spec": EXTRACTION_SPEC,
+        "concurrency": concurrency,
+        "policy": RESOURCE_POLICY,
+        "wait_conditions": {
+            category: get_wait_condition(category) for category in categories
+        },
+        "max_items": max_items,
+        "seen_urls": sorted(seen_urls or ()),
+    }
+    label = ", ".join(categories)
+
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "scraper.worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
             text=True,
-            timeout=60,
+            encoding="utf-8",
+            cwd=PROJECT_ROOT,
         )
+        # 설정(이미 수집한 URL 포함)은 크기 제한이 없는 stdin으로 전달한다
+        try:
+            process.stdin.write(json.dumps(config))
+            process.stdin.close()
+        except OSError:
+            pass
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, kill_on_timeout)
+        timer.daemon = True
+        timer.start()
+
+        try:
+            for line in process.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                if event.get("category") and event.get("metrics"):
+                    record_metrics(event["category"], event["metrics"])
+                if event.get("type") == "end":
+                    break
+                yield event
+            process.wait()
+        finally:
+            timer.cancel()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+
+        if timed_out.is_set():
+            raise ScraperError(f"뉴스 수집 시간 초과 ({label})")
+        if process.returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode("utf-8", errors="replace")
+            raise ScraperError(f"스크래퍼 프로세스 오류: {stderr}")
+
+
+def _error_event(
+    category: str, message: str, count: int = 0, **extra: Any
+) -> dict[str, Any]:
+    """카테고리 오류 이벤트를 만든다 (워커의 error 이벤트와 같은 형태)."""
+    return {
+        "type": "error",
+        "category": category,
+        "message": message,
+        "count": count,
+        **extra,
+    }
+
+
+def _stream_browser(
+    categories: list[str],
+    concurrency: int,
+    max_items: int,
+    seen_urls: Collection[str] | None,
+) -> Iterator[dict[str, Any]]:
+    """브라우저가 필요한 카테고리를 워커로 수집하며 이벤트를 내보낸다.
+
+    기사를 하나도 받지 못하고 실패한 카테고리는 지수 백오프 후 최대
+    RETRY_ATTEMPTS번 다시 수집하며, 마지막 시도의 오류만 내보낸다.
+    """
+    try:
+        ensure_browser_ready()
+    except ScraperError as e:
+        for category in categories:
+            yield _error_event(category, str(e))
+        return
+
+    pending = categories
+    for attempt in range(RETRY_ATTEMPTS + 1):
+        if attempt:
+            time.sleep(backoff_delay(attempt, RETRY_BASE_DELAY, RETRY_MAX_DELAY))
+        last_attempt = attempt == RETRY_ATTEMPTS
+        retry: list[str] = []
+        finished: set[str] = set()
+        received: dict[str, int] = {}
+
+        # 동시 실행 단위(wave) 수만큼 제한 시간을 늘린다
+        waves = -(-len(pending) // concurrency)
+        extra_pages = max(0, -(-max_items // MAX_ARTICLES_PER_CATEGORY) - 1)
+        timeout = (WORKER_TIMEOUT + MORE_PAGE_TIMEOUT * extra_pages) * waves
+        RATE_LIMITER.acquire(len(pending))
+
+        try:
+            events = _stream_worker(pending, concurrency, timeout, max_items, seen_urls)
+            for event in events:
+                category = event.get("category")
+                if category is None:
+                    # 워커 전체 실패: 아직 끝나지 않은 카테고리의 오류로 전달한다
+                    raise ScraperError(f"뉴스 수집 실패: {event.get('message')}")
+                if event["type"] == "article":
+                    received[category] = received.get(category, 0) + 1
+                elif event["type"] in ("done", "error"):
+                    finished.add(category)
+                    if (
+                        event["type"] == "error"
+                        and not received.get(category)
+                        and not last_attempt
+                    ):
+                        retry.append(category)
+                        continue
+                yield event
+        except ScraperError as e:
+            for category in pending:
+                if category in finished:
+                    continue
+                if not received.get(category) and not last_attempt:
+                    retry.append(category)
+                else:
+                    yield _error_event(category, str(e), received.get(category, 0))
+
+        if not retry:
+            return
+        pending = sorted(retry, key=categories.index)
+
+
+def _stream_allowed(
+    categories: list[str],
+    concurrency: int,
+    fetch_modes: dict[str, str] | None,
+    max_items: int,
+    seen_urls: Collection[str] | None,
+) -> Iterator[dict[str, Any]]:
+    """HTTP 수집을 먼저 시도하고 나머지를 브라우저로 수집한다."""
+    modes = {category: get_fetch_mode(category, fetch_modes) for category in categories}
+    browser_categories = []
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(
+                _try_static, category, modes[category], max_items, seen_urls
+            ): category
+            for category in categories
+        }
+        for future in as_completed(futures):
+            category = futures[future]
+            try:
+                articles = future.result()
+            except ScraperError as e:
+                yield _error_event(category, str(e))
+                continue
+            if articles is None:
+                browser_categories.append(category)
+                continue
+
+            yield {"type": "start", "category": category}
+            for article in articles:
+                yield {"type": "article", "category": category, "article": article}
+            yield {"type": "done", "category": category, "count": len(articles)}
+
+    if browser_categories:
+        # 카테고리 순서를 요청 순서로 맞춘다
+        browser_categories.sort(key=categories.index)
+        yield from _stream_browser(browser_categories, concurrency, max_items, seen_urls)
+
+
+def stream_categories(
+    categories: list[str] | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    fetch_modes: dict[str, str] | None = None,
+    max_items: int = MAX_ARTICLES_PER_CATEGORY,
+    seen_urls: Collection[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """여러 카테고리의 수집 이벤트를 발생 순서대로 내보낸다.
+
+    HTTP 수집 대상 카테고리는 커넥션 풀을 공유하며 동시에 요청하고,
+    브라우저가 필요한 카테고리만 하나의 워커 프로세스와 브라우저로 처리한다.
+    호출자는 수집이 끝나기 전에 기사 이벤트를 받아 병합/표시할 수 있으며,
+    실패한 카테고리도 그 전에 받은 기사는 그대로 남는다.
+
+    max_items를 키우면 "더보기"를 따라가며 깊게 수집하고, seen_urls를 주면
+    이미 수집한 기사는 건너뛰고 이전 수집분에 닿는 즉시 멈춘다 (증분 수집).
+
+    페이지 요청은 프로세스 공용 토큰 버킷으로 속도를 제한하고, 일시적 오류는
+    백오프 후 재시도한다. 연속 실패로 회로가 열린 카테고리는 요청하지 않고
+    "skipped" 표시가 있는 오류 이벤트만 내보낸다 (get_circuit_states 참고).
+
+    같은 카테고리를 다른 세션(스레드)이나 프로세스가 이미 수집 중이면 새로
+    수집하지 않고 그 결과를 기다려 내보내며, COLLECT_FRESHNESS 안에 끝난
+    결과도 재사용한다. 이 경우 "done" 이벤트에 "coalesced" 표시가 붙는다.
+    수집 방식, max_items, seen_urls가 모두 같은 요청끼리만 합치며, 합친 수집이
+    도중에 실패하면 그 전에 받은 기사를 내보낸 뒤 오류 이벤트를 내보낸다.
+
+    Args:
+        categories: 수집할 카테고리 리스트 (None이면 전체)
+        concurrency: 동시에 수집할 최대 카테고리 수
+        fetch_modes: 카테고리별 수집 방식 지정 (None이면 FETCH_MODES)
+        max_items: 카테고리별 최대 수집 기사 수 (깊은 수집 한도)
+        seen_urls: 이미 수집한 기사 URL 집합
         
-        if result.returncode != 0:
-            raise ScraperError(f"스크래퍼 프로세스 오류: {result.stderr}")
-        
-        output = result.stdout.strip()
-        if not output:
-            return []
+    Yields:
+        이벤트 딕셔너리 ("start", "progress", "article", "done", "error")
+    """
+    if categories is None:
+        categories = list(CATEGORIES.keys())
+
+    for category in categories:
+        if category not in CATEGORIES:
+            raise ValueError(f"지원하지 않는 카테고리: {category}")
+
+    allowed = []
+    for category in categories:
+        breaker = CIRCUIT_BREAKERS.get(category)
+        if breaker.allow():
+            allowed.append(category)
+            continue
+        retry_in = breaker.snapshot()["retry_in"]
+        yield _error_event(
+            category,
+            f"연속 실패로 수집을 건너뜁니다 ({retry_in}초 후 재시도)",
+            skipped=True,
+        )
+
+    if not allowed:
+        return
+
+    # 진행 중이거나 방금 끝난 같은 수집이 있으면 직접 수집하지 않는다
+    group = get_collection_flights()
+    keys = _flight_keys(allowed, fetch_modes, max_items, seen_urls)
+    leading = {}
+    following = {}
+    for category in allowed:
+        flight, leader = group.claim(keys[category])
+        if leader:
+            leading[category] = flight
+        else:
+            following[category] = flight
+
+    received: dict[str, list[dict[str, Any]]] = {category: [] for category in leading}
+    try:
+        if leading:
+            events = _stream_allowed(
+                list(leading), max(1, concurrency), fetch_modes, max_items, seen_urls
+            )
+            for event in events:
+                category = event["category"]
+                key = keys[category]
+                if event["type"] == "article":
+                    received[category].append(event["article"])
+                elif event["type"] == "done":
+                    CIRCUIT_BREAKERS.get(category).record_success()
+                    group.finish(key, leading[category], received[category])
+                elif event["type"] == "error":
+                    CIRCUIT_BREAKERS.get(category).record_failure(event.get("message"))
+                    # 기다리는 호출자도 실패 전에 받은 기사는 받는다
+                    group.finish(
+                        key,
+                        leading[category],
+                        received[category],
+                        error=ScraperError(event.get("message")),
+                    )
+                yield event
+    finally:
+        # 중간에 닫혀도 같은 수집을 기다리는 호출자가 멈추지 않게 한다
+        for category, flight in leading.items():
+            group.finish(
+                keys[category],
+                flight,
+                received[category],
+                error=ScraperError(f"뉴스 수집이 중단되었습니다 ({category})"),
+            )
+
+    for category, flight in following.items():
+        # 다른 프로세스의 수집 결과도 이 프로세스의 차단기(half_open 시험 포함)에 기록한다
+        breaker = CIRCUIT_BREAKERS.get(category)
+        try:
+            articles = flight.wait(COALESCE_WAIT_TIMEOUT)
+        except (ScraperError, TimeoutError) as e:
+            breaker.record_failure(str(e))
+            # 맡은 수집이 도중에 실패했으면 그 전에 받은 기사를 내보낸다
+            partial = (flight.result or []) if flight.done else []
+            if partial:
+                yield {"type": "start", "category": category}
+                for article in partial:
+                    yield {"type": "article", "category": category, "article": dict(article)}
+            yield _error_event(category, str(e), len(partial))
+            continue
+        breaker.record_success()
+
+        yield {"type": "start", "category": category}
+        for article in articles:
+            yield {"type": "article", "category": category, "article": dict(article)}
+        yield {"type": "done", "category": category, "count": len(articles), "coalesced": True}
+
+
+def stream_category(
+    category: str,
+    fetch_modes: dict[str, str] | None = None,
+    max_items: int = MAX_ARTICLES_PER_CATEGORY,
+    seen_urls: Collection[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """특정 카테고리의 기사를 수집되는 즉시 하나씩 내보낸다.
+
+    Args:
+        category: 수집할 카테고리
+        fetch_modes: 카테고리별 수집 방식 지정 (None이면 FETCH_MODES)
+        max_items: 최대 수집 기사 수 (깊은 수집 한도)
+        seen_urls: 이미 수집한 기사 URL 집합 (증분 수집 중단 기준)
         
-        data = json.loads(output)
+    Yields:
+        기사 딕셔너리
         
-        if "error" in data:
-            raise ScraperError(f"뉴스 수집 실패 ({category}): {data['error']}")
+    Raises:
+        ScraperError: 수집 실패 시 (이미 내보낸 기사는 유효하다)
+        ValueError: 잘못된 카테고리
+    """
+    if category not in CATEGORIES:
+        raise ValueError(f"지원하지 않는 카테고리: {category}")
+
+    for event in stream_categories([category], 1, fetch_modes, max_items, seen_urls):
+        if event["type"] == "article":
+            yield event["article"]
+        elif event["type"] == "error":
+            raise ScraperError(f"뉴스 수집 실패 ({category}): {event['message']}")
+
+
+def scrape_category(
+    category: str,
+    fetch_modes: dict[str, str] | None = None,
+    max_items: int = MAX_ARTICLES_PER_CATEGORY,
+    seen_urls: Collection[str] | None = None,
+) -> list[dict[str, Any]]:
+    """특정 카테고리의 뉴스를 수집한다.
+
+    수집 방식이 "auto"면 HTTP 수집을 먼저 시도하고, 결과가 없을 때만
+    별도 Python 프로세스에서 Playwright를 실행한다 (Windows 호환성 보장).
+    브라우저가 없으면 최초 한 번 자동 설치를 시도한다.
+    수집 도중 실패해도 이미 받은 기사가 있으면 그 기사들을 반환한다.
+    같은 카테고리를 여러 세션이 동시에 요청해도 수집은 한 번만 실행된다.
+
+    Args:
+        category: 수집할 카테고리 (정치, 경제, 사회, 생활/문화, IT/과학, 세계)
+        fetch_modes: 카테고리별 수집 방식 지정 (None이면 FETCH_MODES)
+        max_items: 최대 수집 기사 수 (깊은 수집 한도)
+        seen_urls: 이미 수집한 기사 URL 집합 (증분 수집 중단 기준)
         
-        return data.get("articles", [])
+    Returns:
+        수집된 기사 리스트
         
-    except subprocess.TimeoutExpired:
-        raise ScraperError(f"뉴스 수집 시간 초과 ({category})")
-    except json.JSONDecodeError as e:
-        raise ScraperError(f"응답 파싱 실패 ({category}): {e}")
+    Raises:
+        ScraperError: 기사를 하나도 받지 못하고 수집이 실패한 경우
+        ValueError: 잘못된 카테고리
+    """
+    articles: list[dict[str, Any]] = []
+    try:
+        for article in stream_category(category, fetch_modes, max_items, seen_urls):
+            articles.append(article)
+    except ScraperError:
+        if not articles:
+            raise
+    return articles
 
 
 def scrape_all_categories(
-    categories: list[str] | None = None
+    categories: list[str] | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    fetch_modes: dict[str, str] | None = None,
+    max_items: int = MAX_ARTICLES_PER_CATEGORY,
+    seen_urls: Collection[str] | None = None,
 ) -> dict[str, list[dict[str, Any]]]:
     """여러 카테고리의 뉴스를 수집한다.
     
+    stream_categories의 이벤트를 카테고리별로 모은다.
+    카테고리별 페이지는 최대 concurrency개까지 동시에 연다.
+
     Args:
         categories: 수집할 카테고리 리스트 (None이면 전체)
+        concurrency: 동시에 수집할 최대 카테고리 수
+        fetch_modes: 카테고리별 수집 방식 지정 (None이면 FETCH_MODES)
+        max_items: 카테고리별 최대 수집 기사 수 (깊은 수집 한도)
+        seen_urls: 이미 수집한 기사 URL 집합 (증분 수집 중단 기준)
         
     Returns:
-        카테고리별 기사 딕셔너리
+        카테고리별 기사 딕셔너리 (실패한 카테고리는 그 전까지 받은 기사만 포함)
     """
     if categories is None:
         categories = list(CATEGORIES.keys())
-    
-    result = {}
-    for category in categories:
-        try:
-            articles = scrape_category(category)
-            result[category] = articles
-        except ScraperError as e:
-            result[category] = []
-            # 로깅 등 추가 처리 가능
-    
+
+    result: dict[str, list[dict[str, Any]]] = {category: [] for category in categories}
+    events = stream_categories(categories, concurrency, fetch_modes, max_items, seen_urls)
+    for event in events:
+        if event["type"] == "article":
+            result[event["category"]].append(event["article"])
     return result
@@ -0,0 +1,211 @@
+"""Playwright 브라우저 사전 점검(preflight) 모듈.
+
+수집 전에 Chromium 사용 가능 여부를 프로세스당 한 번만 확인한다.
+확인 결과는 Playwright 버전을 키로 하는 마커 파일에 저장하여
+같은 배포에서는 재확인하지 않으며, 확인에 실패한 경우에만 설치를 실행한다.
+"""
+
+import json
+import subprocess
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+# 점검 결과 마커 파일 경로
+MARKER_PATH = Path(__file__).parent.parent / "data" / ".playwright_preflight.json"
+
+# 브라우저 경로 확인 제한 시간 (초)
+CHECK_TIMEOUT = 30
+
+# 브라우저 설치 제한 시간 (초)
+INSTALL_TIMEOUT = 300
+
+# 브라우저 실행 파일 경로를 출력하는 점검 스크립트
+_CHECK_SCRIPT = (
+    "from playwright.sync_api import sync_playwright\n"
+    "with sync_playwright() as p:\n"
+    "    print(p.chromium.executable_path)\n"
+)
+
+_lock = threading.Lock()
+_status: dict[str, Any] | None = None
+
+
+def get_playwright_version() -> str | None:
+    """설치된 Playwright 패키지 버전을 반환한다 (미설치 시 None)."""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover
+        return None
+    try:
+        return version("playwright")
+    except PackageNotFoundError:
+        return None
+
+
+def _read_marker(playwright_version: str) -> dict[str, Any] | None:
+    """현재 버전에 유효한 마커가 있으면 반환한다."""
+    try:
+        with open(MARKER_PATH, encoding="utf-8") as f:
+            marker = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(marker, dict):
+        return None
+    if marker.get("playwright_version") != playwright_version:
+        return None
+    executable = marker.get("executable_path")
+    if not executable or not Path(executable).exists():
+        return None
+    return marker
+
+
+def _write_marker(status: dict[str, Any]) -> None:
+    """점검 성공 결과를 마커 파일로 저장한다."""
+    try:
+        MARKER_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(MARKER_PATH, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "playwright_version": status["playwright_version"],
+                    "executable_path": status["executable_path"],
+                    "checked_at": status["checked_at"],
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+    except OSError:
+        pass
+
+
+def _find_executable() -> tuple[str | None, str | None]:
+    """Chromium 실행 파일 경로를 확인한다.
+
+    Returns:
+        (실행 파일 경로, 오류 메시지) 튜플
+    """
+    try:
+        result = subprocess.run(
+            [sys.executable, "-c", _CHECK_SCRIPT],
+            capture_output=True,
+            text=True,
+            timeout=CHECK_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        return None, "브라우저 확인 시간 초과"
+
+    if result.returncode != 0:
+        return None, result.stderr.strip() or "브라우저 확인 실패"
+
+    executable = result.stdout.strip()
+    if not executable or not Path(executable).exists():
+        return None, f"Chromium 실행 파일이 없습니다: {executable}"
+    return executable, None
+
+
+def _install_browser() -> str | None:
+    """Chromium을 설치한다.
+
+    Returns:
+        오류 메시지 (성공 시 None)
+    """
+    try:
+        result = subprocess.run(
+            [sys.executable, "-m", "playwright", "install", "chromium"],
+            capture_output=True,
+            text=True,
+            timeout=INSTALL_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        return "브라우저 설치 시간 초과"
+    if result.returncode != 0:
+        return result.stderr.strip() or "브라우저 설치 실패"
+    return None
+
+
+def _run_preflight() -> dict[str, Any]:
+    """마커 확인 → 실행 파일 확인 → (필요 시) 설치 순으로 점검한다."""
+    status: dict[str, Any] = {
+        "ok": False,
+        "source": "check",
+        "playwright_version": get_playwright_version(),
+        "executable_path": None,
+        "installed": False,
+        "error": None,
+        "checked_at": datetime.now().isoformat(),
+    }
+
+    if status["playwright_version"] is None:
+        status["error"] = "playwright 패키지가 설치되어 있지 않습니다."
+        return status
+
+    marker = _read_marker(status["playwright_version"])
+    if marker:
+        status.update(
+            ok=True,
+            source="marker",
+            executable_path=marker["executable_path"],
+        )
+        return status
+
+    executable, error = _find_executable()
+    if executable is None:
+        # 확인에 실패한 경우에만 설치를 시도한다
+        install_error = _install_browser()
+        status["installed"] = install_error is None
+        executable, error = _find_executable()
+        if executable is None:
+            status["error"] = install_error or error
+            return status
+
+    status.update(ok=True, executable_path=executable)
+    _write_marker(status)
+    return status
+
+
+def ensure_browser(force: bool = False) -> dict[str, Any]:
+    """브라우저 사용 가능 여부를 점검하고 상태를 반환한다.
+
+    같은 프로세스에서 성공한 점검 결과는 재사용한다.
+
+    Args:
+        force: True면 캐시된 결과와 마커를 무시하고 다시 점검
+
+    Returns:
+        점검 상태 딕셔너리 (ok, source, playwright_version,
+        executable_path, installed, error, checked_at)
+    """
+    global _status
+
+    with _lock:
+        if _status is not None and _status["ok"] and not force:
+            return dict(_status, source="process")
+
+        if force:
+            try:
+                MARKER_PATH.unlink()
+            except OSError:
+                pass
+
+        _status = _run_preflight()
+        return dict(_status)
+
+
+def get_health_status() -> dict[str, Any]:
+    """마지막 점검 상태를 반환한다 (점검 전이면 ok=None)."""
+    with _lock:
+        if _status is None:
+            return {
+                "ok": None,
+                "source": None,
+                "playwright_version": get_playwright_version(),
+                "executable_path": None,
+                "installed": False,
+                "error": None,
+                "checked_at": None,
+            }
+        return dict(_status)
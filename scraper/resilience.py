@@ -0,0 +1,261 @@
+"""수집 안정성 모듈.
+
+반복 수집(스케줄러, 다중 사용자)에서 실패하는 섹션을 계속 두드리지 않도록
+요청 속도 제한(토큰 버킷), 지수 백오프 재시도, 카테고리별 회로 차단기를 제공한다.
+상태는 프로세스 안에서 공유되며 코드에서 조회할 수 있다.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+# 회로 차단기 상태
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class TokenBucket:
+    """스레드 안전한 토큰 버킷 속도 제한기."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """토큰 버킷을 생성한다.
+
+        Args:
+            rate: 초당 보충되는 토큰 수
+            capacity: 최대 토큰 수 (순간적으로 허용되는 요청 수)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """경과 시간만큼 토큰을 보충한다."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """토큰을 예약하고 사용 가능해질 때까지 기다려야 할 시간을 반환한다.
+
+        토큰이 모자라면 빚으로 예약하므로, 호출자는 반환된 시간만큼
+        기다린 뒤 요청하면 된다 (동기 코드는 sleep, 비동기 코드는 asyncio.sleep).
+
+        Returns:
+            대기 시간 (초, 바로 사용 가능하면 0)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            if self._tokens >= 0 or self.rate <= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 얻을 때까지 기다린다.
+
+        Returns:
+            실제로 기다린 시간 (초)
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    @property
+    def available(self) -> float:
+        """현재 사용 가능한 토큰 수."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0.0, self._tokens)
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+) -> float:
+    """attempt번째 재시도 전 대기 시간을 계산한다 (지수 백오프 + full jitter).
+
+    Args:
+        attempt: 재시도 순번 (1부터)
+        base_delay: 첫 재시도의 최대 대기 시간 (초)
+        max_delay: 대기 시간 상한 (초)
+
+    Returns:
+        대기 시간 (초)
+    """
+    return random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+
+
+def call_with_retry[T](
+    func: Callable[..., T],
+    *args: Any,
+    retries: int,
+    base_delay: float,
+    max_delay: float,
+    retry_on: tuple[type[BaseException], ...] = (Exception,),
+    **kwargs: Any,
+) -> T:
+    """일시적 오류에 대해 지수 백오프로 재시도하며 함수를 호출한다.
+
+    Args:
+        func: 호출할 함수
+        retries: 최대 재시도 횟수 (첫 호출 제외)
+        base_delay: 첫 재시도의 최대 대기 시간 (초)
+        max_delay: 대기 시간 상한 (초)
+        retry_on: 재시도할 예외 타입
+
+    Returns:
+        함수 반환값
+
+    Raises:
+        마지막 시도에서 발생한 예외
+    """
+    attempt = 0
+    while True:
+        try:
+            return func(*args, **kwargs)
+        except retry_on:
+            attempt += 1
+            if attempt > retries:
+                raise
+            time.sleep(backoff_delay(attempt, base_delay, max_delay))
+
+
+class CircuitBreaker:
+    """연속 실패가 쌓이면 일정 시간 호출을 건너뛰게 하는 회로 차단기.
+
+    closed 상태에서 연속 실패가 failure_threshold에 닿으면 open이 되어
+    cooldown 동안 호출을 막는다. cooldown이 지나면 half_open으로 한 번
+    시도를 허용하고, 성공하면 closed, 실패하면 다시 open이 된다.
+    half_open의 시험 호출은 한 호출자만 할 수 있으며, 결과가 기록되지 않은 채
+    cooldown이 지나면(호출자가 중단된 경우) 다른 호출자에게 다시 허용한다.
+    """
+
+    def __init__(self, failure_threshold: int, cooldown: float) -> None:
+        """회로 차단기를 생성한다.
+
+        Args:
+            failure_threshold: 차단까지의 연속 실패 횟수
+            cooldown: 차단 유지 시간 (초)
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.last_error: str | None = None
+        self._opened_at: float | None = None
+        self._probe_started: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (closed, open, half_open)."""
+        with self._lock:
+            return self._state(time.monotonic())
+
+    def _state(self, now: float) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if now - self._opened_at >= self.cooldown:
+            return HALF_OPEN
+        return OPEN
+
+    def _probing(self, now: float) -> bool:
+        """다른 호출자의 half_open 시험 호출이 진행 중인지 확인한다."""
+        return self._probe_started is not None and now - self._probe_started < self.cooldown
+
+    def allow(self) -> bool:
+        """지금 호출해도 되는지 확인한다.
+
+        open 상태거나, half_open에서 다른 호출자가 이미 시험 호출 중이면 False.
+        half_open에서 True를 받은 호출자는 결과를 record_success/record_failure로
+        기록해야 한다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._state(now)
+            if state == CLOSED:
+                return True
+            if state == OPEN or self._probing(now):
+                return False
+            self._probe_started = now
+            return True
+
+    def record_success(self) -> None:
+        """성공을 기록하고 회로를 닫는다."""
+        with self._lock:
+            self.consecutive_failures = 0
+            self.last_error = None
+            self._opened_at = None
+            self._probe_started = None
+
+    def record_failure(self, error: str | None = None) -> None:
+        """실패를 기록하고 연속 실패가 기준에 닿으면 회로를 연다."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._state(now)
+            self.consecutive_failures += 1
+            self.total_failures += 1
+            self.last_error = error
+            self._probe_started = None
+            if state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self._opened_at = now
+
+    def snapshot(self) -> dict[str, Any]:
+        """조회용 상태 딕셔너리를 반환한다."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._state(now)
+            probing = state == HALF_OPEN and self._probing(now)
+            retry_in = None
+            if state == OPEN and self._opened_at is not None:
+                retry_in = round(self.cooldown - (now - self._opened_at), 1)
+            elif probing:
+                retry_in = round(self.cooldown - (now - self._probe_started), 1)
+            return {
+                "state": state,
+                "probing": probing,
+                "consecutive_failures": self.consecutive_failures,
+                "total_failures": self.total_failures,
+                "last_error": self.last_error,
+                "retry_in": retry_in,
+            }
+
+
+class CircuitBreakerRegistry:
+    """키(카테고리)별 회로 차단기 모음."""
+
+    def __init__(self, failure_threshold: int, cooldown: float) -> None:
+        """새 차단기에 적용할 기준으로 레지스트리를 생성한다."""
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CircuitBreaker:
+        """키에 해당하는 회로 차단기를 반환한다 (없으면 생성)."""
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.cooldown)
+                self._breakers[key] = breaker
+            return breaker
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """키별 차단기 상태를 반환한다."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {key: breaker.snapshot() for key, breaker in breakers.items()}
+
+    def reset(self, key: str | None = None) -> None:
+        """차단기 상태를 초기화한다 (key가 None이면 전체)."""
+        with self._lock:
+            if key is None:
+                self._breakers.clear()
+            else:
+                self._breakers.pop(key, None)
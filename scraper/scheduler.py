@@ -0,0 +1,309 @@
+"""백그라운드 뉴스 수집 스케줄러 모듈.
+
+UI와 별도 프로세스로 실행되어 카테고리별 주기에 따라 뉴스를 수집하고
+모든 사용자가 공유하는 기사 저장소에 저장한다. UI는 저장된 결과를 읽기만 하면 된다.
+
+수집 주기에는 무작위 지터를 더하고, 카테고리마다 새 기사 비율에 따라
+주기를 조정한다 (새 기사가 많으면 짧게, 없으면 길게).
+보존 기간이 지난 기사는 같은 프로세스의 백그라운드 스레드가 보관 파일로 옮긴다.
+
+    python -m scraper.scheduler [--once] [--categories 정치 경제] [--retention-days 90]
+"""
+
+import argparse
+import logging
+import random
+import signal
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from scraper.naver_scraper import (
+    CATEGORIES,
+    DEFAULT_CONCURRENCY,
+    PROJECT_ROOT,
+    scrape_all_categories,
+)
+from scraper.worker import MAX_ARTICLES_PER_CATEGORY
+
+logger = logging.getLogger(__name__)
+
+# 스케줄러 상태 파일 경로 (UI에서 다음 수집 시각 등을 조회)
+STATE_PATH = PROJECT_ROOT / "data" / "scheduler_state.json"
+
+# 카테고리별 기본 수집 주기 (초)
+DEFAULT_INTERVAL = 900
+
+# 적응형 수집 주기의 하한/상한 (초)
+MIN_INTERVAL = 300
+MAX_INTERVAL = 3600
+
+# 수집 주기에 더하는 무작위 지터 비율 (±)
+JITTER_RATIO = 0.1
+
+# 주기를 줄이는 새 기사 비율 기준 (수집 한도 대비)
+HIGH_NEW_RATIO = 0.5
+
+# 새 기사 비율에 따른 주기 배율 (많음 / 없음)
+SPEEDUP_FACTOR = 0.5
+SLOWDOWN_FACTOR = 1.5
+
+# 대기 중 종료 신호를 확인하는 최대 간격 (초)
+MAX_SLEEP = 30.0
+
+
+def with_jitter(interval: float, ratio: float = JITTER_RATIO) -> float:
+    """수집 주기에 ±ratio 범위의 무작위 지터를 더한다."""
+    return interval * (1 + random.uniform(-ratio, ratio))
+
+
+def next_interval(
+    interval: float,
+    new_count: int,
+    max_items: int = MAX_ARTICLES_PER_CATEGORY,
+    base: float = DEFAULT_INTERVAL,
+    min_interval: float = MIN_INTERVAL,
+    max_interval: float = MAX_INTERVAL,
+) -> float:
+    """직전 수집 결과로 다음 수집 주기를 계산한다.
+
+    새 기사가 한도의 HIGH_NEW_RATIO 이상이면 주기를 줄이고,
+    새 기사가 없으면 늘리며, 그 사이면 기본 주기 쪽으로 되돌린다.
+
+    Args:
+        interval: 현재 수집 주기 (초)
+        new_count: 직전 수집에서 새로 발견한 기사 수
+        max_items: 카테고리별 수집 한도
+        base: 기본 수집 주기 (초)
+        min_interval: 주기 하한 (초)
+        max_interval: 주기 상한 (초)
+
+    Returns:
+        다음 수집 주기 (초)
+    """
+    if new_count >= max(1, max_items * HIGH_NEW_RATIO):
+        interval *= SPEEDUP_FACTOR
+    elif new_count == 0:
+        interval *= SLOWDOWN_FACTOR
+    else:
+        interval = (interval + base) / 2
+    return min(max(interval, min_interval), max_interval)
+
+
+def load_scheduler_state(path: Path = STATE_PATH) -> dict[str, Any]:
+    """저장된 스케줄러 상태를 반환한다 (없으면 빈 딕셔너리)."""
+    from app.services.storage_util import read_json_dict
+
+    return read_json_dict(path)
+
+
+class CollectionScheduler:
+    """카테고리별 적응형 주기로 뉴스를 수집하는 스케줄러."""
+
+    def __init__(
+        self,
+        categories: list[str] | None = None,
+        base_interval: float = DEFAULT_INTERVAL,
+        min_interval: float = MIN_INTERVAL,
+        max_interval: float = MAX_INTERVAL,
+        max_items: int = MAX_ARTICLES_PER_CATEGORY,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        state_path: Path = STATE_PATH,
+    ) -> None:
+        """스케줄러를 초기화하고 저장된 카테고리별 주기를 복원한다.
+
+        Args:
+            categories: 수집할 카테고리 리스트 (None이면 전체)
+            base_interval: 기본 수집 주기 (초)
+            min_interval: 적응형 주기 하한 (초)
+            max_interval: 적응형 주기 상한 (초)
+            max_items: 카테고리별 최대 수집 기사 수
+            concurrency: 동시에 수집할 최대 카테고리 수
+            state_path: 스케줄러 상태 파일 경로
+        """
+        self.categories = categories or list(CATEGORIES.keys())
+        for category in self.categories:
+            if category not in CATEGORIES:
+                raise ValueError(f"지원하지 않는 카테고리: {category}")
+
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.max_items = max_items
+        self.concurrency = concurrency
+        self.state_path = state_path
+        self._stop = threading.Event()
+
+        saved = load_scheduler_state(state_path).get("categories", {})
+        now = time.time()
+        self.state: dict[str, dict[str, Any]] = {}
+        for category in self.categories:
+            entry = saved.get(category, {})
+            self.state[category] = {
+                "interval": float(entry.get("interval", base_interval)),
+                "next_run": float(entry.get("next_run", now)),
+                "last_run": entry.get("last_run"),
+                "last_new_count": entry.get("last_new_count", 0),
+                "last_error": entry.get("last_error"),
+            }
+
+    def stop(self) -> None:
+        """실행 중인 루프를 종료하도록 요청한다."""
+        self._stop.set()
+
+    def due_categories(self, now: float | None = None) -> list[str]:
+        """수집 시각이 된 카테고리 리스트를 반환한다."""
+        now = time.time() if now is None else now
+        return [c for c in self.categories if self.state[c]["next_run"] <= now]
+
+    def run_once(self, categories: list[str] | None = None) -> dict[str, int]:
+        """지정한 카테고리를 한 번 수집해 공용 기사 저장소에 반영한다.
+
+        Args:
+            categories: 수집할 카테고리 리스트 (None이면 수집 시각이 된 카테고리)
+
+        Returns:
+            카테고리별 새로 발견한 기사 수
+        """
+        from app.services.news_service import NewsService
+        from app.services.storage_util import load_seen_urls
+
+        if categories is None:
+            categories = self.due_categories()
+        if not categories:
+            return {}
+
+        seen_urls = load_seen_urls(categories)
+        started = time.time()
+        collected: dict[str, list[dict[str, Any]]] = {}
+        errors: dict[str, str] = {}
+        try:
+            collected = scrape_all_categories(
+                categories,
+                self.concurrency,
+                max_items=self.max_items,
+                seen_urls=seen_urls,
+            )
+        except Exception as e:
+            logger.exception("뉴스 수집 실패")
+            errors = {category: str(e) for category in categories}
+
+        new_counts = {
+            category: sum(
+                1 for a in collected.get(category, []) if a.get("url") not in seen_urls
+            )
+            for category in categories
+        }
+
+        try:
+            added = NewsService().ingest_articles(collected, seen_urls)
+            logger.info("저장 완료: 새 기사 %d건", added)
+        except Exception:
+            logger.exception("기사 저장 실패")
+
+        for category in categories:
+            entry = self.state[category]
+            if category in errors:
+                entry["last_error"] = errors[category]
+            else:
+                entry["interval"] = next_interval(
+                    entry["interval"],
+                    new_counts[category],
+                    self.max_items,
+                    self.base_interval,
+                    self.min_interval,
+                    self.max_interval,
+                )
+                entry["last_new_count"] = new_counts[category]
+                entry["last_error"] = None
+            entry["last_run"] = started
+            entry["next_run"] = time.time() + with_jitter(entry["interval"])
+
+        self.save_state()
+        return new_counts
+
+    def save_state(self) -> bool:
+        """카테고리별 주기와 다음 수집 시각을 상태 파일에 저장한다."""
+        from app.services.storage_util import write_json_dict
+
+        return write_json_dict(
+            self.state_path,
+            {
+                "updated_at": datetime.now().isoformat(),
+                "categories": self.state,
+            },
+        )
+
+    def run_forever(self) -> None:
+        """종료 요청이 있을 때까지 수집 시각이 된 카테고리를 반복 수집한다."""
+        logger.info("스케줄러 시작: %s", ", ".join(self.categories))
+        while not self._stop.is_set():
+            due = self.due_categories()
+            if due:
+                new_counts = self.run_once(due)
+                logger.info("수집 완료: %s", new_counts)
+                continue
+
+            wait = min(s["next_run"] for s in self.state.values()) - time.time()
+            self._stop.wait(min(max(wait, 0.0), MAX_SLEEP))
+        logger.info("스케줄러 종료")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """명령행 인자로 스케줄러를 실행한다."""
+    parser = argparse.ArgumentParser(description="네이버 뉴스 백그라운드 수집 스케줄러")
+    parser.add_argument("--categories", nargs="+", choices=list(CATEGORIES))
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL)
+    parser.add_argument("--min-interval", type=float, default=MIN_INTERVAL)
+    parser.add_argument("--max-interval", type=float, default=MAX_INTERVAL)
+    parser.add_argument("--max-items", type=int, default=MAX_ARTICLES_PER_CATEGORY)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--once", action="store_true", help="한 번만 전체 수집하고 종료")
+    parser.add_argument(
+        "--retention-days",
+        type=int,
+        help="기사 보존 기간 (일, 0이면 보관하지 않음, 기본: NEWS_RETENTION_DAYS 또는 90)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    scheduler = CollectionScheduler(
+        categories=args.categories,
+        base_interval=args.interval,
+        min_interval=args.min_interval,
+        max_interval=args.max_interval,
+        max_items=args.max_items,
+        concurrency=args.concurrency,
+    )
+
+    from app.services.retention import RetentionPolicy, RetentionPruner
+
+    policy = None if args.retention_days is None else RetentionPolicy(args.retention_days)
+    pruner = RetentionPruner(policy)
+
+    if args.once:
+        scheduler.run_once(scheduler.categories)
+        if pruner.policy.enabled:
+            logger.info("보관 완료: %s", pruner.run_once())
+        return
+
+    def handle_signal(signum: int, frame: Any) -> None:
+        scheduler.stop()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+    pruner.start()
+    try:
+        scheduler.run_forever()
+    finally:
+        pruner.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 """네이버 뉴스 셀렉터 정의.
 
-Playwright에서 사용할 CSS 셀렉터를 정의한다.
+Playwright에서 사용할 CSS 셀렉터와, 이를 한 번의 페이지 평가로
+모든 기사 필드를 추출하는 추출 명세로 변환하는 기능을 정의한다.
 """
 
+from typing import Any
+
 # 네이버 뉴스 메인 셀렉터
 MAIN_SELECTORS = {
     "article_list": "ul.sa_list li.sa_item",
@@ -10,6 +13,7 @@ MAIN_SELECTORS = {
     "article_link": "a.sa_text_title",
     "article_summary": ".sa_text_lede",
     "article_press": ".sa_text_press",
+    "more_button": "a.section_more_inner",
 }
 
 # 카테고리별 추가 셀렉터 (필요시)
@@ -26,3 +30,57 @@ CATEGORY_SELECTORS = {
 def get_selector(name: str) -> str:
     """셀렉터 이름으로 CSS 셀렉터를 반환한다."""
     return MAIN_SELECTORS.get(name, "")
+
+
+# 기사 필드 -> (셀렉터 이름, 읽을 속성). 속성이 None이면 텍스트를 읽는다.
+ARTICLE_FIELDS = {
+    "title": ("article_title", None),
+    "link": ("article_link", "href"),
+    "summary": ("article_summary", None),
+    "publisher": ("article_press", None),
+}
+
+# 목록 요소 배열과 추출 명세를 받아 모든 기사 필드를 한 번에 반환하는 페이지 스크립트
+# (spec.offset 이후의 요소만 추출하므로 더보기로 늘어난 부분만 다시 읽을 수 있다)
+EXTRACT_SCRIPT = """
+(items, spec) => items.slice(spec.offset || 0, spec.limit || undefined).map((item) => {
+    const row = {};
+    for (const [name, field] of Object.entries(spec.fields)) {
+        const el = item.querySelector(field.selector);
+        if (!el) {
+            row[name] = null;
+        } else if (field.attr) {
+            row[name] = el.getAttribute(field.attr);
+        } else {
+            row[name] = (el.innerText || el.textContent || "").replace(/\\s+/g, " ").trim();
+        }
+    }
+    return row;
+})
+"""
+
+
+def build_extraction_spec(
+    limit: int, selectors: dict[str, str] | None = None
+) -> dict[str, Any]:
+    """셀렉터 정의를 EXTRACT_SCRIPT에 전달할 추출 명세로 변환한다.
+
+    Args:
+        limit: 추출할 최대 기사 수
+        selectors: 셀렉터 딕셔너리 (None이면 MAIN_SELECTORS)
+
+    Returns:
+        {"item": 목록 셀렉터, "limit": 최대 수, "more": 더보기 버튼 셀렉터,
+        "fields": {필드: {"selector", "attr"}}}
+    """
+    selectors = selectors or MAIN_SELECTORS
+    return {
+        "item": selectors["article_list"],
+        "limit": limit,
+        "more": selectors.get("more_button"),
+        "fields": {
+            name: {"selector": selectors[key], "attr": attr}
+            for name, (key, attr) in ARTICLE_FIELDS.items()
+            if selectors.get(key)
+        },
+    }
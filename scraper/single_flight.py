@@ -0,0 +1,246 @@
+"""중복 수집 합치기(single-flight) 모듈.
+
+같은 키의 작업이 이미 실행 중이면 나중 호출자는 새로 실행하지 않고
+진행 중인 작업의 결과를 함께 기다린다. 끝난 결과는 짧은 시간 동안 재사용한다.
+
+lock_dir를 지정하면 잠금 파일과 결과 파일로 같은 data/ 폴더를 쓰는
+다른 프로세스(예: 스케줄러와 Streamlit 서버)의 작업도 합친다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# 다른 프로세스의 잠금 해제를 확인하는 간격 (초)
+POLL_INTERVAL = 0.2
+
+
+class Flight:
+    """진행 중이거나 끝난 작업 하나의 결과."""
+
+    def __init__(self) -> None:
+        """아직 끝나지 않은 작업을 만든다."""
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.finished_at: float | None = None
+        self._event = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        """작업이 끝났는지 여부."""
+        return self._event.is_set()
+
+    def resolve(self, result: Any) -> None:
+        """결과로 작업을 끝낸다."""
+        self.result = result
+        self.finished_at = time.time()
+        self._event.set()
+
+    def fail(self, error: BaseException, partial: Any = None) -> None:
+        """예외로 작업을 끝낸다 (partial은 실패 전까지 얻은 결과로 result에 남긴다)."""
+        self.result = partial
+        self.error = error
+        self.finished_at = time.time()
+        self._event.set()
+
+    def wait(self, timeout: float | None = None) -> Any:
+        """작업이 끝날 때까지 기다려 결과를 반환한다.
+
+        Raises:
+            TimeoutError: 제한 시간 안에 끝나지 않은 경우
+            작업이 실패했으면 그 예외
+        """
+        if not self._event.wait(timeout):
+            raise TimeoutError("진행 중인 작업을 기다리는 시간이 초과되었습니다")
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """키별로 동시에 하나의 작업만 실행하고 결과를 공유한다."""
+
+    def __init__(
+        self,
+        freshness: float,
+        lock_dir: Path | None = None,
+        lock_timeout: float = 600.0,
+        external_error: Callable[[str], BaseException] = RuntimeError,
+    ) -> None:
+        """single-flight 그룹을 생성한다.
+
+        Args:
+            freshness: 끝난 결과를 재사용하는 시간 (초)
+            lock_dir: 프로세스 간 잠금/결과 파일 폴더 (None이면 프로세스 안에서만 합침)
+            lock_timeout: 이 시간보다 오래된 잠금 파일은 버려진 것으로 본다 (초)
+            external_error: 다른 프로세스가 결과 없이 끝났을 때 만들 예외 타입
+        """
+        self.freshness = freshness
+        self.lock_dir = lock_dir
+        self.lock_timeout = lock_timeout
+        self.external_error = external_error
+        self._flights: dict[str, Flight] = {}
+        self._lock = threading.Lock()
+
+    def _is_fresh(self, flight: Flight) -> bool:
+        return (
+            flight.done
+            and flight.error is None
+            and time.time() - (flight.finished_at or 0) <= self.freshness
+        )
+
+    def claim(self, key: str) -> tuple[Flight, bool]:
+        """키의 작업을 맡거나, 진행 중/최근 결과를 얻는다.
+
+        Returns:
+            (작업, 직접 실행해야 하는지 여부). False면 작업의 wait()로 결과를 받고,
+            True면 작업을 실행한 뒤 반드시 finish()를 호출해야 한다.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and (not flight.done or self._is_fresh(flight)):
+                return flight, False
+
+            flight = Flight()
+            self._flights[key] = flight
+
+        if self.lock_dir is None:
+            return flight, True
+
+        cached = self._read_result(key)
+        if cached is not None:
+            flight.resolve(cached)
+            return flight, False
+        if self._try_lock(key):
+            return flight, True
+
+        # 다른 프로세스가 실행 중이면 끝날 때까지 기다렸다가 그 결과를 쓴다
+        thread = threading.Thread(
+            target=self._wait_external, args=(key, flight), daemon=True
+        )
+        thread.start()
+        return flight, False
+
+    def finish(
+        self,
+        key: str,
+        flight: Flight,
+        result: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """claim()으로 맡은 작업을 끝내고 기다리는 호출자에게 알린다.
+
+        error와 함께 준 result는 실패 전까지 얻은 결과로 작업의 result에 남으며,
+        재사용하거나 다른 프로세스에 공유하지는 않는다.
+        """
+        if flight.done:
+            return
+        if error is not None:
+            flight.fail(error, result)
+        else:
+            flight.resolve(result)
+
+        if self.lock_dir is not None:
+            if error is None:
+                self._write_result(key, result)
+            self._unlock(key)
+
+    def do(self, key: str, func: Callable[[], Any], timeout: float | None = None) -> Any:
+        """키의 작업을 한 번만 실행하고 모든 호출자에게 같은 결과를 반환한다.
+
+        Args:
+            key: 작업 키
+            func: 실행할 함수
+            timeout: 다른 호출자의 작업을 기다리는 제한 시간 (초)
+
+        Returns:
+            작업 결과
+        """
+        flight, leader = self.claim(key)
+        if not leader:
+            return flight.wait(timeout)
+        try:
+            result = func()
+        except BaseException as e:
+            self.finish(key, flight, error=e)
+            raise
+        self.finish(key, flight, result)
+        return result
+
+    # ── 프로세스 간 잠금 파일 ─────────────────────────────────────────
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return self.lock_dir / f"{digest}.lock", self.lock_dir / f"{digest}.json"
+
+    def _try_lock(self, key: str) -> bool:
+        """잠금 파일을 만들어 작업을 맡는다 (다른 프로세스가 잡고 있으면 False)."""
+        lock_path, _ = self._paths(key)
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                stale = time.time() - lock_path.stat().st_mtime > self.lock_timeout
+            except OSError:
+                stale = True
+            if not stale:
+                return False
+            # 비정상 종료로 남은 잠금은 지우고 다시 시도한다
+            lock_path.unlink(missing_ok=True)
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                return False
+        with os.fdopen(fd, "w") as f:
+            f.write(str(os.getpid()))
+        return True
+
+    def _unlock(self, key: str) -> None:
+        lock_path, _ = self._paths(key)
+        lock_path.unlink(missing_ok=True)
+
+    def _read_result(self, key: str) -> Any:
+        """재사용 기간 안의 결과 파일이 있으면 결과를 반환한다 (없으면 None)."""
+        _, result_path = self._paths(key)
+        try:
+            with open(result_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if data.get("key") != key or time.time() - data.get("finished_at", 0) > self.freshness:
+            return None
+        return data.get("result")
+
+    def _write_result(self, key: str, result: Any) -> None:
+        """결과 파일을 원자적으로 교체한다."""
+        _, result_path = self._paths(key)
+        tmp_path = result_path.with_name(f"{result_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"key": key, "finished_at": time.time(), "result": result},
+                    f,
+                    ensure_ascii=False,
+                )
+            os.replace(tmp_path, result_path)
+        except (OSError, TypeError, ValueError):
+            tmp_path.unlink(missing_ok=True)
+
+    def _wait_external(self, key: str, flight: Flight) -> None:
+        """다른 프로세스의 잠금이 풀리면 그 결과로 작업을 끝낸다."""
+        lock_path, _ = self._paths(key)
+        deadline = time.time() + self.lock_timeout
+        while lock_path.exists() and time.time() < deadline:
+            time.sleep(POLL_INTERVAL)
+
+        cached = self._read_result(key)
+        if cached is not None:
+            flight.resolve(cached)
+        else:
+            flight.fail(self.external_error(f"다른 프로세스의 작업이 결과 없이 끝났습니다 ({key})"))
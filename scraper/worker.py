@@ -0,0 +1,428 @@
+"""스크래퍼 워커 프로세스 모듈.
+
+`python -m scraper.worker` (설정 JSON은 stdin) 형태로 별도 프로세스에서 실행되며,
+하나의 Chromium 브라우저로 요청된 카테고리들을 동시에 수집한다.
+수집이 끝나기를 기다리지 않고 start/progress/article/done/error 이벤트를
+발생 즉시 stdout에 JSON 한 줄씩(JSON Lines) 출력하고, 마지막에 항상
+{"type": "end"}를 출력한다 (이벤트 형식은 scrape_categories 참고).
+"""
+
+import asyncio
+import json
+import sys
+import time
+from collections.abc import Callable, Collection
+from datetime import datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+from scraper.article_id import article_id_from_url, canonical_article_url
+from scraper.selectors import EXTRACT_SCRIPT
+
+# 카테고리당 최대 수집 기사 수
+MAX_ARTICLES_PER_CATEGORY = 20
+
+# 페이지 로드 제한 시간 (ms)
+PAGE_TIMEOUT_MS = 30000
+
+# "더보기" 후 새 항목을 기다리는 제한 시간 (ms)
+MORE_TIMEOUT_MS = 10000
+
+# 이미 수집한 기사가 연속으로 이만큼 나오면 증분 수집을 멈춘다
+SEEN_STOP_STREAK = 3
+
+
+def row_to_article(
+    row: dict[str, Any], category: str, collected_at: str
+) -> dict[str, Any] | None:
+    """추출된 필드 행 하나를 기사 스키마로 변환한다.
+
+    기사 ID와 URL은 언론사/기사 번호(oid/aid) 기반의 정규 형식을 사용한다.
+
+    Returns:
+        기사 딕셔너리 (제목이나 링크가 없으면 None)
+    """
+    title = (row.get("title") or "").strip()
+    link = row.get("link")
+    if not title or not link:
+        return None
+
+    if link.startswith("/"):
+        link = f"https://news.naver.com{link}"
+    link = canonical_article_url(link)
+
+    return {
+        "id": article_id_from_url(link),
+        "title": title,
+        "url": link,
+        "category": category,
+        "collected_at": collected_at,
+        "source": "naver",
+        "summary": (row.get("summary") or "").strip(),
+        "publisher": (row.get("publisher") or "").strip(),
+    }
+
+
+def rows_to_articles(
+    rows: list[dict[str, Any]], category: str
+) -> list[dict[str, Any]]:
+    """추출된 필드 행을 기사 스키마로 변환한다.
+
+    제목이나 링크가 없는 행은 건너뛴다.
+
+    Args:
+        rows: 추출 명세의 필드 이름을 키로 갖는 행 리스트
+        category: 뉴스 카테고리
+
+    Returns:
+        기사 리스트
+    """
+    collected_at = datetime.now().isoformat()
+
+    articles = []
+    for row in rows:
+        article = row_to_article(row, category, collected_at)
+        if article is not None:
+            articles.append(article)
+    return articles
+
+
+class CrawlLimit:
+    """카테고리 수집의 한도와 증분 중단 조건을 추적한다.
+
+    이미 수집한 URL(seen_urls)은 건너뛰며, 그런 기사가 연속으로
+    seen_streak개 나오면 이후는 이전 수집분으로 보고 수집을 멈춘다.
+    """
+
+    def __init__(
+        self,
+        max_items: int,
+        seen_urls: Collection[str] | None = None,
+        seen_streak: int = SEEN_STOP_STREAK,
+    ) -> None:
+        """수집 한도를 초기화한다."""
+        self.max_items = max_items
+        self.seen_urls = seen_urls if seen_urls is not None else frozenset()
+        self.seen_streak = max(1, seen_streak)
+        self.count = 0
+        self._streak = 0
+        self._emitted: set[str] = set()
+        self.stopped_at_seen = False
+
+    @property
+    def done(self) -> bool:
+        """더 수집할 필요가 없는지 여부."""
+        return self.count >= self.max_items or self.stopped_at_seen
+
+    def accept(self, article: dict[str, Any]) -> bool:
+        """기사를 수집 결과에 포함할지 판단한다."""
+        url = article["url"]
+        if url in self._emitted:
+            return False
+        if url in self.seen_urls:
+            self._streak += 1
+            if self._streak >= self.seen_streak:
+                self.stopped_at_seen = True
+            return False
+
+        self._streak = 0
+        self._emitted.add(url)
+        self.count += 1
+        return True
+
+
+async def _load_more(page: Any, spec: dict[str, Any], loaded: int) -> bool:
+    """"더보기"를 눌러 목록을 늘린다.
+
+    Returns:
+        새 항목이 추가되었는지 여부
+    """
+    if not spec.get("more"):
+        return False
+
+    button = await page.query_selector(spec["more"])
+    if button is None or not await button.is_visible():
+        return False
+
+    try:
+        await button.click()
+        await page.wait_for_function(
+            "([selector, loaded]) => document.querySelectorAll(selector).length > loaded",
+            arg=[spec["item"], loaded],
+            timeout=MORE_TIMEOUT_MS,
+        )
+    except Exception:
+        return False
+    return True
+
+
+def _host_matches(host: str, suffixes: tuple[str, ...]) -> bool:
+    """호스트가 도메인 접미사 목록 중 하나에 속하는지 확인한다."""
+    return any(host == suffix or host.endswith(f".{suffix}") for suffix in suffixes)
+
+
+async def _apply_resource_policy(
+    context: Any, policy: dict[str, Any], metrics: dict[str, Any]
+) -> None:
+    """컨텍스트에 요청 차단 규칙을 등록한다.
+
+    차단 대상 리소스 종류, 차단 호스트, 허용 호스트 밖의 서드파티 요청을 중단한다.
+    """
+    blocked_types = frozenset(policy.get("blocked_resource_types", ()))
+    blocked_hosts = tuple(policy.get("blocked_host_suffixes", ()))
+    allowed_hosts = tuple(policy.get("allowed_host_suffixes", ()))
+
+    async def handle(route: Any) -> None:
+        request = route.request
+        host = urlsplit(request.url).hostname or ""
+        if (
+            request.resource_type in blocked_types
+            or _host_matches(host, blocked_hosts)
+            or (allowed_hosts and not _host_matches(host, allowed_hosts))
+        ):
+            metrics["blocked_requests"] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", handle)
+
+
+async def _wait_until_ready(
+    page: Any, url: str, spec: dict[str, Any], wait_condition: str
+) -> None:
+    """카테고리의 로드 조건에 맞춰 페이지를 연다.
+
+    "selector"는 DOM 로드 후 기사 목록 셀렉터가 나타날 때까지만 기다리고,
+    그 밖의 값은 page.goto의 wait_until로 그대로 사용한다.
+    """
+    if wait_condition == "selector":
+        await page.goto(url, wait_until="domcontentloaded", timeout=PAGE_TIMEOUT_MS)
+        await page.wait_for_selector(spec["item"], timeout=PAGE_TIMEOUT_MS)
+    else:
+        await page.goto(url, wait_until=wait_condition, timeout=PAGE_TIMEOUT_MS)
+
+
+async def scrape_page(
+    browser: Any,
+    category: str,
+    url: str,
+    spec: dict[str, Any],
+    policy: dict[str, Any] | None = None,
+    wait_condition: str = "networkidle",
+    metrics: dict[str, Any] | None = None,
+    on_article: Callable[[dict[str, Any]], None] | None = None,
+    on_progress: Callable[[str], None] | None = None,
+    limit: CrawlLimit | None = None,
+) -> list[dict[str, Any]]:
+    """브라우저에 독립 컨텍스트를 열어 한 카테고리의 기사를 수집한다.
+
+    기사 필드는 페이지 평가(eval_on_selector_all) 한 번으로 추출하며,
+    수집 한도에 닿거나 이미 수집한 기사가 연속으로 나올 때까지
+    "더보기"로 목록을 늘려 새로 붙은 항목만 다시 추출한다.
+
+    Args:
+        browser: Playwright 비동기 Browser 객체
+        category: 뉴스 카테고리
+        url: 카테고리 섹션 URL
+        spec: selectors.build_extraction_spec()으로 만든 추출 명세
+        policy: 리소스 차단 정책 (None이면 차단하지 않음)
+        wait_condition: 로드 조건 ("selector", "domcontentloaded", "load", "networkidle")
+        metrics: 측정값을 기록할 딕셔너리 (ready_ms, bytes_transferred,
+            requests, blocked_requests)
+        on_article: 기사 하나가 변환될 때마다 호출되는 콜백
+        on_progress: 진행 단계("page_ready", "extracted", "page_N")마다 호출되는 콜백
+        limit: 수집 한도와 중단 조건 (None이면 추출 명세의 limit개까지)
+
+    Returns:
+        수집된 기사 리스트
+    """
+    metrics = metrics if metrics is not None else {}
+    metrics.update(ready_ms=None, bytes_transferred=0, requests=0, blocked_requests=0)
+    size_tasks: list[asyncio.Task] = []
+
+    def on_request_finished(request: Any) -> None:
+        metrics["requests"] += 1
+        size_tasks.append(asyncio.ensure_future(request.sizes()))
+
+    context = await browser.new_context()
+    try:
+        if policy:
+            await _apply_resource_policy(context, policy, metrics)
+        context.on("requestfinished", on_request_finished)
+
+        page = await context.new_page()
+        started = time.perf_counter()
+        await _wait_until_ready(page, url, spec, wait_condition)
+        metrics["ready_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        if on_progress:
+            on_progress("page_ready")
+
+        collected_at = datetime.now().isoformat()
+        limit = limit or CrawlLimit(spec["limit"])
+
+        articles = []
+        offset = 0
+        pages = 0
+        while True:
+            rows = await page.eval_on_selector_all(
+                spec["item"], EXTRACT_SCRIPT, {**spec, "offset": offset, "limit": None}
+            )
+            pages += 1
+            if on_progress:
+                on_progress("extracted" if pages == 1 else f"page_{pages}")
+
+            for row in rows:
+                # 한 행의 변환 실패가 나머지 기사에 영향을 주지 않도록 한다
+                try:
+                    article = row_to_article(row, category, collected_at)
+                except Exception:
+                    continue
+                if article is None or not limit.accept(article):
+                    if limit.done:
+                        break
+                    continue
+                articles.append(article)
+                if on_article:
+                    on_article(article)
+                if limit.done:
+                    break
+            offset += len(rows)
+
+            if limit.done or not await _load_more(page, spec, offset):
+                break
+        return articles
+    finally:
+        await context.close()
+        for sizes in await asyncio.gather(*size_tasks, return_exceptions=True):
+            if isinstance(sizes, dict):
+                metrics["bytes_transferred"] += (
+                    sizes.get("responseBodySize", 0) + sizes.get("responseHeadersSize", 0)
+                )
+
+
+def emit_event(event: dict[str, Any]) -> None:
+    """이벤트 하나를 JSON 한 줄로 stdout에 즉시 출력한다."""
+    print(json.dumps(event), flush=True)
+
+
+async def scrape_categories(
+    targets: dict[str, str],
+    spec: dict[str, Any],
+    concurrency: int,
+    policy: dict[str, Any] | None = None,
+    wait_conditions: dict[str, str] | None = None,
+    emit: Callable[[dict[str, Any]], None] = emit_event,
+    max_items: int | None = None,
+    seen_urls: Collection[str] | None = None,
+) -> None:
+    """하나의 브라우저로 여러 카테고리를 동시에 수집하며 이벤트를 내보낸다.
+
+    카테고리마다 별도 컨텍스트/페이지를 사용하며, 동시에 열리는 페이지 수는
+    concurrency로 제한한다. 한 카테고리의 실패는 다른 카테고리에 영향을 주지 않는다.
+
+    이벤트 종류:
+        {"type": "start", "category"}
+        {"type": "progress", "category", "stage"}
+        {"type": "article", "category", "article"}
+        {"type": "done", "category", "count", "metrics"}
+        {"type": "error", "category", "message", "count", "metrics"}
+
+    Args:
+        targets: 카테고리 -> 섹션 URL 매핑
+        spec: 추출 명세
+        concurrency: 동시에 수집할 최대 카테고리 수
+        policy: 리소스 차단 정책
+        wait_conditions: 카테고리별 로드 조건 (없으면 "networkidle")
+        emit: 이벤트 출력 함수
+        max_items: 카테고리별 최대 수집 기사 수 (None이면 추출 명세의 limit)
+        seen_urls: 이미 수집한 기사 URL 집합 (증분 수집 중단 기준)
+    """
+    from playwright.async_api import async_playwright
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    wait_conditions = wait_conditions or {}
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+
+        async def run_one(category: str, url: str) -> None:
+            async with semaphore:
+                metrics: dict[str, Any] = {}
+                count = 0
+
+                def on_article(article: dict[str, Any]) -> None:
+                    nonlocal count
+                    count += 1
+                    emit({"type": "article", "category": category, "article": article})
+
+                def on_progress(stage: str) -> None:
+                    emit({"type": "progress", "category": category, "stage": stage})
+
+                emit({"type": "start", "category": category})
+                try:
+                    await scrape_page(
+                        browser,
+                        category,
+                        url,
+                        spec,
+                        policy,
+                        wait_conditions.get(category, "networkidle"),
+                        metrics,
+                        on_article,
+                        on_progress,
+                        CrawlLimit(max_items or spec["limit"], seen_urls),
+                    )
+                except Exception as e:
+                    emit({
+                        "type": "error",
+                        "category": category,
+                        "message": str(e),
+                        "count": count,
+                        "metrics": metrics,
+                    })
+                else:
+                    emit({
+                        "type": "done",
+                        "category": category,
+                        "count": count,
+                        "metrics": metrics,
+                    })
+
+        try:
+            await asyncio.gather(
+                *(run_one(category, url) for category, url in targets.items())
+            )
+        finally:
+            await browser.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """워커 진입점.
+
+    설정 JSON을 stdin(또는 첫 번째 인자)으로 받아 수집 이벤트를 JSON Lines로 stdout에 출력하고,
+    마지막에 {"type": "end"}를 출력한다. 워커 전체 실패는 category 없는
+    error 이벤트로 알린다.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    try:
+        config = json.loads(args[0] if args else sys.stdin.read())
+        asyncio.run(
+            scrape_categories(
+                config["targets"],
+                config["spec"],
+                config.get("concurrency", 1),
+                config.get("policy"),
+                config.get("wait_conditions"),
+                max_items=config.get("max_items"),
+                seen_urls=frozenset(config.get("seen_urls") or ()),
+            )
+        )
+    except Exception as e:
+        emit_event({"type": "error", "message": str(e)})
+    emit_event({"type": "end"})
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,25 @@
+"""공용 pytest 픽스처."""
+
+from pathlib import Path
+
+import pytest
+
+# 저장해 둔 네이버 섹션 HTML 폴더 (네트워크 없이 파서를 테스트/측정한다)
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def read_fixture(name: str) -> str:
+    """저장된 HTML 픽스처 내용을 반환한다."""
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def section_html() -> str:
+    """정치 섹션 목록 HTML."""
+    return read_fixture("naver_section_100.html")
+
+
+@pytest.fixture
+def unclosed_section_html() -> str:
+    """닫는 </li>가 생략된 IT/과학 섹션 목록 HTML."""
+    return read_fixture("naver_section_105_unclosed.html")
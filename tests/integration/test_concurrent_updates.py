@@ -0,0 +1,76 @@
+"""update_document 동시 읽고-고치고-저장 테스트 (변경 유실 없음)."""
+
+import multiprocessing
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.services.storage_backend import BACKEND_CHOICES, create_backend
+
+DOCUMENT = "calendar_issues.json"
+USER = "tester"
+
+
+def _append_tags(backend, worker: int, count: int) -> None:
+    """문서(리스트)에 작업자 태그를 하나씩 count번 추가한다."""
+    for i in range(count):
+        tag = f"{worker}-{i}"
+        result = backend.update_document(USER, DOCUMENT, lambda doc, tag=tag: [*(doc or []), tag])
+        assert result is not None
+
+
+def _process_worker(backend_name: str, data_dir: str, worker: int, count: int) -> None:
+    backend = create_backend(backend_name, Path(data_dir))
+    try:
+        _append_tags(backend, worker, count)
+    finally:
+        backend.close()
+
+
+def _expected(workers: int, count: int) -> list[str]:
+    return sorted(f"{w}-{i}" for w in range(workers) for i in range(count))
+
+
+@pytest.mark.parametrize("backend_name", BACKEND_CHOICES)
+def test_threads_do_not_lose_updates(tmp_path, backend_name):
+    backend = create_backend(backend_name, tmp_path)
+    workers, count = 8, 25
+    barrier = threading.Barrier(workers)
+    errors = []
+
+    def run(worker: int) -> None:
+        barrier.wait()
+        try:
+            _append_tags(backend, worker, count)
+        except BaseException as e:  # 스레드 밖에서 실패로 보고한다
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(w,)) for w in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert sorted(backend.read_document(USER, DOCUMENT)) == _expected(workers, count)
+
+
+@pytest.mark.parametrize("backend_name", BACKEND_CHOICES)
+def test_processes_do_not_lose_updates(tmp_path, backend_name):
+    context = multiprocessing.get_context("spawn")
+    workers, count = 4, 20
+    processes = [
+        context.Process(
+            target=_process_worker, args=(backend_name, str(tmp_path), w, count)
+        )
+        for w in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=120)
+
+    assert [process.exitcode for process in processes] == [0] * workers
+    backend = create_backend(backend_name, tmp_path)
+    assert sorted(backend.read_document(USER, DOCUMENT)) == _expected(workers, count)
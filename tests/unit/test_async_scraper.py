@@ -0,0 +1,48 @@
+"""비동기 엔진의 카테고리 제한 시간 테스트 (브라우저 없이)."""
+
+import asyncio
+
+import pytest
+
+from scraper import async_scraper
+from scraper.async_scraper import (
+    CATEGORY_DEADLINE,
+    _scrape_with_deadline,
+    category_deadline,
+)
+from scraper.naver_scraper import MORE_PAGE_TIMEOUT, ScraperError
+from scraper.worker import MAX_ARTICLES_PER_CATEGORY
+
+
+def _slow_scrape(articles, delay=10.0):
+    async def scrape_page(*args, on_article=None, limit=None, **kwargs):
+        for article in articles:
+            if on_article:
+                on_article(article)
+        await asyncio.sleep(delay)
+        return articles
+
+    return scrape_page
+
+
+def test_deadline_grows_with_requested_depth():
+    assert category_deadline() == CATEGORY_DEADLINE
+    assert category_deadline(MAX_ARTICLES_PER_CATEGORY * 3) == (
+        CATEGORY_DEADLINE + 2 * MORE_PAGE_TIMEOUT
+    )
+
+
+def test_timeout_keeps_articles_received_so_far(monkeypatch):
+    articles = [{"id": "a1", "url": "u1"}, {"id": "a2", "url": "u2"}]
+    monkeypatch.setattr(async_scraper, "scrape_page", _slow_scrape(articles))
+
+    result = asyncio.run(_scrape_with_deadline(None, "정치", deadline=0.05))
+
+    assert result == articles
+
+
+def test_timeout_without_articles_is_an_error(monkeypatch):
+    monkeypatch.setattr(async_scraper, "scrape_page", _slow_scrape([]))
+
+    with pytest.raises(ScraperError, match="시간 초과"):
+        asyncio.run(_scrape_with_deadline(None, "정치", deadline=0.05))
@@ -0,0 +1,86 @@
+"""html_parser 셀렉터/트리 구성 테스트."""
+
+from scraper.html_parser import parse_html
+
+
+def test_descendant_selector_is_scoped_to_ancestor(section_html):
+    root = parse_html(section_html)
+
+    items = root.select("ul.sa_list li.sa_item")
+
+    # 헤드라인 묶음(ul.sa_headline)의 li.sa_item은 제외된다
+    assert len(items) == 7
+    assert all(item.parent.tag == "ul" for item in items)
+    assert len(root.select("li.sa_item")) == 8
+
+
+def test_compound_selector_matches_tag_class_and_id():
+    root = parse_html(
+        '<div id="a" class="x y"><span class="x">1</span></div><div class="x">2</div>'
+    )
+
+    assert [n.text() for n in root.select("div.x")] == ["1", "2"]
+    assert [n.text() for n in root.select("div#a.y")] == ["1"]
+    assert [n.text() for n in root.select("#a .x")] == ["1"]
+    assert [n.text() for n in root.select("*.x.y")] == ["1"]
+    assert root.select("div.z") == []
+    assert root.select("") == []
+
+
+def test_select_one_returns_first_in_document_order(section_html):
+    root = parse_html(section_html)
+
+    first = root.select_one("ul.sa_list a.sa_text_title")
+
+    assert first is not None
+    assert first.get("href").endswith("/001/0014000001?sid=100")
+    assert root.select_one("a.no_such_class") is None
+
+
+def test_text_collapses_whitespace_and_skips_scripts(section_html):
+    root = parse_html(section_html)
+
+    title = root.select_one("ul.sa_list a.sa_text_title").text()
+    head = root.select_one("head").text()
+
+    assert title == "국회, 내년도 예산안 본회의 상정"
+    assert "스크립트" not in head
+    assert "font-weight" not in head
+
+
+def test_text_decodes_entities_and_breaks_lines(section_html):
+    root = parse_html(section_html)
+    item = root.select("ul.sa_list li.sa_item")[1]
+
+    assert item.select_one("a.sa_text_title").text() == '"민생 우선" 여야 & 정부 협의체 출범'
+    assert item.select_one(".sa_text_lede").text() == (
+        "상대 경로 링크를 가진 기사. 줄바꿈이 있는 요약."
+    )
+
+
+def test_unclosed_li_is_closed_by_next_sibling(unclosed_section_html):
+    root = parse_html(unclosed_section_html)
+
+    items = root.select("ul.sa_list li.sa_item")
+
+    assert len(items) == 3
+    assert all(item.parent.tag == "ul" for item in items)
+    # 닫히지 않은 첫 항목이 다음 항목의 제목을 자손으로 갖지 않는다
+    assert items[0].select_one("a.sa_text_title") is None
+    assert items[1].select_one(".sa_text_lede").text() == "닫는 li 없이 이어지는 항목."
+
+
+def test_unclosed_p_and_void_elements():
+    root = parse_html("<div><p>하나<p>둘<br>셋<img src=x></div><p>넷")
+
+    paragraphs = root.select("p")
+
+    assert [p.text() for p in paragraphs] == ["하나", "둘 셋", "넷"]
+    assert paragraphs[1].select_one("img").get("src") == "x"
+    assert root.select_one("div").parent is root
+
+
+def test_stray_end_tag_is_ignored():
+    root = parse_html("<ul><li>a</span></li></div><li>b</li></ul>")
+
+    assert [li.text() for li in root.select("ul li")] == ["a", "b"]
@@ -0,0 +1,60 @@
+"""변경 기록(journal) 테스트."""
+
+from app.services import journal
+from app.services.storage_backend import empty_overlay
+
+
+def test_article_ops_keep_list_order_semantics():
+    overlay = {"favorites": ["a", "b"], "deleted": ["c"], "cleared_at": None}
+    ops = [
+        journal.article_op(journal.FAVORITE, "a", True),  # 끝으로 옮긴다
+        journal.article_op(journal.FAVORITE, "b", False),
+        journal.article_op(journal.DELETE, "a"),
+        journal.article_op(journal.DELETE, "c"),
+        journal.article_op(journal.FAVORITE, "d", True),
+    ]
+
+    result = journal.apply_ops(overlay, ops, empty_overlay)
+
+    assert result == {"favorites": ["d"], "deleted": ["c", "a"], "cleared_at": None}
+
+
+def test_replay_is_idempotent_and_mixes_entry_ops():
+    ops = [
+        journal.entry_op(journal.ADD, "x", 1),
+        journal.entry_op(journal.UPDATE, "x", 2),
+        journal.entry_op(journal.ADD, "y", 3),
+        journal.entry_op(journal.DELETE, "y"),
+    ]
+
+    once = journal.apply_ops(None, ops)
+    twice = journal.apply_ops(journal.apply_ops(None, ops), ops)
+
+    assert once == twice == {"x": 2}
+    assert journal.apply_op({}, journal.entry_op(journal.ADD, "k", "v")) == {"k": "v"}
+
+
+def test_long_replay_is_linear():
+    ops = [journal.article_op(journal.DELETE, f"news_{i}") for i in range(20000)]
+    ops += [journal.article_op(journal.FAVORITE, f"news_{i}", True) for i in range(20000)]
+
+    overlay = journal.apply_ops(None, ops, empty_overlay)
+
+    assert len(overlay["deleted"]) == 20000
+    assert overlay["favorites"][0] == "news_0" and len(overlay["favorites"]) == 20000
+
+
+def test_append_after_torn_line_keeps_new_ops(tmp_path):
+    path = tmp_path / "doc.journal.jsonl"
+    assert journal.append_ops(path, [journal.article_op(journal.FAVORITE, "a")], None)
+    with open(path, "ab") as f:
+        # 중단된 추가: 줄바꿈 없이 잘린 연산 (UTF-8 문자 중간에서 잘림)
+        f.write('{"op": "favorite", "id": "기사'.encode()[:-1])
+
+    assert journal.append_ops(path, [journal.article_op(journal.DELETE, "b")], None)
+
+    assert journal.read_ops(path) == [
+        journal.article_op(journal.FAVORITE, "a"),
+        journal.article_op(journal.DELETE, "b"),
+    ]
+    assert path.read_bytes().endswith(b"\n")
@@ -0,0 +1,47 @@
+"""JSON 파일 저장소 백엔드 테스트."""
+
+import functools
+
+import pytest
+
+from app.services import safe_file, storage_backend
+from app.services.storage_backend import (
+    LOCK_SUFFIX,
+    MANIFEST_FILENAME,
+    SHARD_SCOPE,
+    JsonBackend,
+)
+
+
+def _merge(current, other):
+    current.update(other)
+
+
+def article(aid, month="2026-10", category="정치"):
+    return {
+        "id": f"news_001_{aid:010d}",
+        "title": f"기사 {aid}",
+        "category": category,
+        "collected_at": f"{month}-17T09:00:00",
+    }
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return JsonBackend(tmp_path)
+
+
+def test_article_writes_report_held_lock(backend, monkeypatch):
+    backend.upsert_articles([article(1)], _merge)
+    monkeypatch.setattr(
+        storage_backend, "file_lock", functools.partial(safe_file.file_lock, timeout=0.05)
+    )
+    manifest = backend._path(SHARD_SCOPE, MANIFEST_FILENAME)
+
+    with safe_file.file_lock(manifest.with_name("." + manifest.name + LOCK_SUFFIX)):
+        assert backend.upsert_articles([article(2)], _merge) == 0
+        assert backend.remove_articles([article(1)["id"]]) == 0
+
+    assert backend.upsert_articles([article(2)], _merge) == 1
+    assert backend.remove_articles([article(1)["id"]]) == 1
+    assert list(backend.load_articles()) == [article(2)["id"]]
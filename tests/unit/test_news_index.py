@@ -0,0 +1,157 @@
+"""NewsService 기사 색인과 사용자 오버레이(즐겨찾기/삭제) 테스트."""
+
+import pytest
+
+from app.services import storage_util
+from app.services.news_service import (
+    NewsService,
+    delete_selected_articles,
+    toggle_favorite,
+)
+from app.services.storage_backend import BACKEND_CHOICES
+
+URL = "https://n.news.naver.com/mnews/article/001/{:010d}"
+CATEGORIES = ("정치", "경제", "사회")
+
+
+def _articles(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"news_001_{i:010d}",
+            "title": f"기사 {i}",
+            "url": URL.format(i),
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "collected_at": f"2026-{9 + i % 2:02d}-{1 + i % 28:02d}T10:00:00",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(params=BACKEND_CHOICES)
+def user(request, tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_util, "DATA_DIR", tmp_path)
+    backend = storage_util.set_storage_backend(request.param)
+    storage_util.add_shared_articles(_articles(30))
+    with storage_util.as_user("tester"):
+        yield
+    backend.close()
+
+
+def _index(service: NewsService):
+    service.query(limit=1)
+    return service._index
+
+
+def _assert_matches_storage(service: NewsService) -> None:
+    expected = storage_util.load_news_articles()
+    assert [dict(a) for a in service.load_articles()] == [dict(a) for a in expected]
+    for category in (None, *CATEGORIES):
+        page = NewsService().query(category, sort="newest", limit=5, offset=2)
+        assert page["total"] == sum(
+            1 for a in expected if category is None or a["category"] == category
+        )
+
+
+def test_favorite_toggle_keeps_cached_index(user):
+    index = _index(NewsService())
+    article_id = "news_001_0000000004"
+
+    with storage_util.unit_of_work():
+        service = NewsService()
+        assert toggle_favorite(article_id, service)
+        assert service.get_article_by_id(article_id)["is_favorite"] is True
+
+    service = NewsService()
+    assert _index(service) is index
+    assert service.get_favorite_status(article_id)
+    assert [a["id"] for a in service.query(limit=30)["articles"] if a.get("is_favorite")] == [
+        article_id
+    ]
+    _assert_matches_storage(service)
+
+
+def test_delete_stores_updated_index(user):
+    with storage_util.unit_of_work():
+        service = NewsService()
+        result = delete_selected_articles(
+            ["news_001_0000000001", "news_001_0000000002", "missing"], service
+        )
+        assert result["deleted_count"] == 2
+        index = service._index
+
+    service = NewsService()
+    assert _index(service) is index
+    assert service.query()["total"] == 28
+    assert service.get_article_by_id("news_001_0000000001") is None
+    _assert_matches_storage(service)
+
+
+def test_index_follows_other_sessions_changes(user):
+    _index(NewsService())
+
+    # 서비스를 거치지 않은 변경(다른 세션)도 다음 조회에 반영된다
+    storage_util.hide_news_articles(["news_001_0000000003"])
+    storage_util.set_article_favorite("news_001_0000000005", True)
+    storage_util.add_shared_articles([
+        {**_articles(31)[-1], "collected_at": "2026-10-17T09:00:00"}
+    ])
+
+    service = NewsService()
+    assert service.query()["total"] == 30
+    assert service.get_favorite_status("news_001_0000000005")
+    _assert_matches_storage(service)
+
+
+def test_list_ids_matches_stored_order(user):
+    service = NewsService()
+    service.delete_article("news_001_0000000003")
+
+    for category in (None, "정치"):
+        page = service.query(category, limit=30)
+        assert service.list_ids(category) == [a["id"] for a in page["articles"]]
+
+
+def test_migration_overlay_does_not_list_shared_articles(user):
+    own = [
+        {**article, "collected_at": f"2026-08-{1 + i:02d}T10:00:00"}
+        for i, article in enumerate(_articles(105)[100:])
+    ]
+    own.append({**_articles(1)[0], "is_favorite": True})
+    storage_util.write_json(storage_util.get_news_path(), own)
+
+    overlay = storage_util.load_news_overlay()
+
+    # 공용 저장소에만 있던 29건은 ID 목록이 아니라 전체 삭제 시각으로 숨긴다
+    assert overlay["deleted"] == []
+    assert overlay["favorites"] == ["news_001_0000000000"]
+    assert sorted(overlay["visible"]) == sorted(a["id"] for a in own)
+    assert not storage_util.get_news_path().exists()
+    expected = sorted(a["id"] for a in own)
+    assert sorted(a["id"] for a in storage_util.load_news_articles()) == expected
+    assert sorted(NewsService().list_ids()) == expected
+    assert storage_util.get_article_by_id("news_001_0000000100") is not None
+    assert storage_util.get_article_by_id("news_001_0000000001") is None
+
+    # 이전 뒤에 들어온 기사는 보인다
+    storage_util.add_shared_articles([
+        {**_articles(106)[-1], "collected_at": "2026-10-30T09:00:00"}
+    ])
+    assert "news_001_0000000105" in NewsService().list_ids()
+
+
+def test_cursor_survives_index_rebuild(user):
+    service = NewsService()
+    first = service.query(limit=10)
+    expected = [a["id"] for a in service.query(limit=30)["articles"]][10:]
+
+    # 다른 세션이 앞 페이지 기사를 지우고 새 기사를 넣어 색인이 다시 만들어져도
+    storage_util.hide_news_articles([a["id"] for a in first["articles"][:3]])
+    storage_util.add_shared_articles([
+        {**_articles(31)[-1], "collected_at": "2026-08-01T09:00:00"}
+    ])
+
+    rest = NewsService().query(cursor=first["cursor"], limit=30)
+    assert [a["id"] for a in rest["articles"]] == expected
+
+    with pytest.raises(ValueError):
+        NewsService().query(cursor='["stored", 9, "news_001_0000000009"]')
@@ -0,0 +1,115 @@
+"""parse_articles(브라우저 없는 섹션 HTML 파싱) 테스트."""
+
+from scraper.naver_scraper import EXTRACTION_SPEC, parse_articles
+from scraper.worker import CrawlLimit, rows_to_articles
+
+
+def test_parses_all_listed_articles(section_html):
+    articles = parse_articles(section_html, "정치")
+
+    assert [a["id"] for a in articles] == [
+        "news_001_0014000001",
+        "news_020_0003500002",
+        "news_025_0003400003",
+        "news_032_0003300004",
+        "news_081_0003100007",
+    ]
+    assert all(a["category"] == "정치" and a["source"] == "naver" for a in articles)
+    assert len({a["collected_at"] for a in articles}) == 1
+
+
+def test_article_fields(section_html):
+    first = parse_articles(section_html, "정치")[0]
+
+    assert first["title"] == "국회, 내년도 예산안 본회의 상정"
+    assert first["url"] == "https://n.news.naver.com/mnews/article/001/0014000001"
+    assert first["summary"] == "여야가 합의한 예산안이 오늘 본회의에 상정된다."
+    assert first["publisher"] == "연합뉴스"
+
+
+def test_relative_and_legacy_links_are_canonical(section_html):
+    articles = {a["id"]: a for a in parse_articles(section_html, "정치")}
+
+    assert articles["news_020_0003500002"]["url"] == (
+        "https://n.news.naver.com/mnews/article/020/0003500002"
+    )
+    assert articles["news_081_0003100007"]["url"] == (
+        "https://n.news.naver.com/mnews/article/081/0003100007"
+    )
+
+
+def test_missing_optional_fields_are_empty(section_html):
+    articles = {a["id"]: a for a in parse_articles(section_html, "정치")}
+
+    assert articles["news_025_0003400003"]["summary"] == ""
+    assert articles["news_025_0003400003"]["publisher"] == "중앙일보"
+    assert articles["news_032_0003300004"]["publisher"] == ""
+
+
+def test_items_without_title_or_link_are_skipped(section_html):
+    titles = [a["title"] for a in parse_articles(section_html, "정치")]
+
+    assert "링크 없는 항목" not in titles
+    assert "헤드라인 기사" not in titles
+    assert "" not in titles
+
+
+def test_unclosed_li_does_not_duplicate_articles(unclosed_section_html):
+    articles = parse_articles(unclosed_section_html, "IT/과학")
+
+    assert [a["id"] for a in articles] == [
+        "news_030_0003200001",
+        "news_015_0004900002",
+    ]
+    assert articles[0]["summary"] == "닫는 li 없이 이어지는 항목."
+    assert articles[1]["summary"] == ""
+
+
+def test_empty_html_returns_empty_list():
+    assert parse_articles("", "정치") == []
+    assert parse_articles("   \n", "정치") == []
+    assert parse_articles("<html><body><p>목록 없음</p></body></html>", "정치") == []
+
+
+def test_result_is_capped_at_extraction_limit():
+    item = (
+        '<li class="sa_item"><a class="sa_text_title" '
+        'href="https://n.news.naver.com/mnews/article/001/{aid:010d}">기사 {aid}</a></li>'
+    )
+    html = '<ul class="sa_list">' + "".join(
+        item.format(aid=i) for i in range(EXTRACTION_SPEC["limit"] + 5)
+    ) + "</ul>"
+
+    articles = parse_articles(html, "경제")
+
+    assert len(articles) == EXTRACTION_SPEC["limit"]
+    assert articles[-1]["title"] == f"기사 {EXTRACTION_SPEC['limit'] - 1}"
+
+
+def test_crawl_limit_stops_at_seen_articles(section_html):
+    articles = parse_articles(section_html, "정치")
+    seen = {a["url"] for a in articles[1:4]}
+    limit = CrawlLimit(10, seen, seen_streak=3)
+
+    accepted = []
+    for article in articles:
+        if limit.accept(article):
+            accepted.append(article)
+        if limit.done:
+            break
+
+    assert [a["id"] for a in accepted] == ["news_001_0014000001"]
+    assert limit.stopped_at_seen and limit.done
+
+
+def test_rows_to_articles_skips_incomplete_rows():
+    rows = [
+        {"title": " 제목 ", "link": "/mnews/article/001/0000000001", "summary": None},
+        {"title": "링크 없음", "link": None},
+    ]
+
+    articles = rows_to_articles(rows, "사회")
+
+    assert len(articles) == 1
+    assert articles[0]["title"] == "제목"
+    assert articles[0]["summary"] == "" and articles[0]["publisher"] == ""
@@ -0,0 +1,66 @@
+"""회로 차단기 테스트."""
+
+import pytest
+
+from scraper import resilience
+from scraper.resilience import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _opened(clock, cooldown=60.0):
+    breaker = CircuitBreaker(2, cooldown)
+    breaker.record_failure("a")
+    breaker.record_failure("b")
+    assert breaker.state == OPEN and not breaker.allow()
+    clock[0] += cooldown
+    assert breaker.state == HALF_OPEN
+    return breaker
+
+
+def test_half_open_allows_a_single_probe(clock):
+    breaker = _opened(clock)
+
+    assert breaker.allow()
+    assert not breaker.allow()
+    assert not breaker.allow()
+    assert breaker.snapshot()["probing"]
+
+
+def test_probe_success_closes_circuit(clock):
+    breaker = _opened(clock)
+    assert breaker.allow()
+
+    breaker.record_success()
+
+    assert breaker.state == CLOSED
+    assert breaker.allow() and breaker.allow()
+
+
+def test_probe_failure_reopens_circuit(clock):
+    breaker = _opened(clock)
+    assert breaker.allow()
+
+    breaker.record_failure("c")
+
+    assert breaker.state == OPEN and not breaker.allow()
+    clock[0] += 60.0
+    assert breaker.allow()
+    assert not breaker.allow()
+
+
+def test_abandoned_probe_is_released_after_cooldown(clock):
+    breaker = _opened(clock)
+    assert breaker.allow()
+
+    clock[0] += 30.0
+    assert not breaker.allow()
+    assert breaker.snapshot()["retry_in"] == 30.0
+    clock[0] += 30.0
+    assert breaker.allow()
+    assert not breaker.allow()
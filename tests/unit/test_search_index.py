@@ -0,0 +1,63 @@
+"""검색 색인(SearchIndex) 테스트."""
+
+import time
+
+from app.services.safe_file import file_lock
+from app.services.search_index import LOCK_FILENAME, SearchIndex, query_terms
+
+ARTICLES = [
+    {"id": "a1", "title": "쌀값 다시 올라", "summary": "농가 소득 개선"},
+    {"id": "a2", "title": "반도체 수출 증가", "summary": "차세대반도체 투자"},
+    {"id": "a3", "title": "햅쌀 출하 시작", "summary": ""},
+    {"id": "a4", "title": "쌀 한 가마 값", "summary": "쌀 쌀"},
+]
+
+
+def _index(tmp_path) -> SearchIndex:
+    index = SearchIndex(tmp_path)
+    index.rebuild(ARTICLES[:2])
+    index.add_articles(ARTICLES[2:])
+    return index
+
+
+def test_query_terms_split_bigrams_and_single_chars():
+    assert query_terms("반도체 쌀") == ({"반도", "도체"}, {"쌀"})
+    assert query_terms("  ") == (set(), set())
+
+
+def test_single_char_query_matches_words_containing_it(tmp_path):
+    index = _index(tmp_path)
+
+    hits = [article_id for article_id, _ in index.search("쌀")]
+
+    assert sorted(hits) == ["a1", "a3", "a4"]
+    # 그 글자가 가장 많이 들어 있는 기사가 먼저다
+    assert hits[0] == "a4"
+    assert sorted(article_id for article_id, _ in index.search("쌀 수출")) == ["a1", "a2", "a3", "a4"]
+
+
+def test_search_does_not_wait_for_file_lock(tmp_path):
+    index = _index(tmp_path)
+    # 다른 프로세스가 쓴 기록도 잠금 없이 읽는다
+    SearchIndex(tmp_path).add_articles([{"id": "a5", "title": "반도체 장비", "summary": ""}])
+
+    with file_lock(tmp_path / LOCK_FILENAME):
+        started = time.monotonic()
+        hits = [article_id for article_id, _ in index.search("반도체")]
+        elapsed = time.monotonic() - started
+
+    assert sorted(hits) == ["a2", "a5"]
+    assert elapsed < 1.0
+
+
+def test_search_after_other_process_compacts(tmp_path):
+    index = _index(tmp_path)
+    assert len(index) == 4
+
+    other = SearchIndex(tmp_path)
+    other.remove_articles(["a1"])
+    other.compact()
+    other.add_articles([{"id": "a6", "title": "쌀 수확", "summary": ""}])
+
+    assert sorted(article_id for article_id, _ in index.search("쌀")) == ["a3", "a4", "a6"]
+    assert len(index) == 4
@@ -0,0 +1,47 @@
+"""수집 이력(seen_urls) 테스트."""
+
+import pytest
+
+from app.services import storage_util
+
+URL = "https://n.news.naver.com/mnews/article/001/{:010d}"
+
+
+@pytest.fixture
+def shared_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_util, "DATA_DIR", tmp_path)
+    storage_util.set_storage_backend("json")
+    return storage_util.get_shared_dir()
+
+
+def test_seen_urls_are_loaded_per_category(shared_dir):
+    storage_util.add_seen_urls([URL.format(1), URL.format(2)], "정치")
+    storage_util.add_seen_urls([URL.format(3)], "경제")
+
+    assert storage_util.load_seen_urls(["정치"]) == {URL.format(1), URL.format(2)}
+    assert storage_util.load_seen_urls() == {URL.format(i) for i in (1, 2, 3)}
+
+
+def test_legacy_lines_are_canonical_and_always_included(shared_dir):
+    storage_util.get_seen_urls_path().write_text(
+        "https://n.news.naver.com/mnews/article/001/0000000009?sid=100\n",
+        encoding="utf-8",
+    )
+
+    assert storage_util.load_seen_urls(["세계"]) == {URL.format(9)}
+
+
+def test_history_is_compacted_to_recent_urls(shared_dir, monkeypatch):
+    monkeypatch.setattr(storage_util, "SEEN_URLS_PER_CATEGORY", 50)
+    monkeypatch.setattr(storage_util, "SEEN_URLS_COMPACT_BYTES", 8000)
+
+    for i in range(500):
+        # 같은 URL을 두 번 추가해도 압축 후에는 한 줄만 남는다
+        storage_util.add_seen_urls([URL.format(i), URL.format(i)], "정치")
+
+    path = storage_util.get_seen_urls_path()
+    urls = storage_util.load_seen_urls(["정치"])
+    assert path.stat().st_size <= 8000 + 2 * len(URL.format(0)) + 16
+    assert URL.format(499) in urls
+    assert URL.format(0) not in urls
+    assert len(urls) <= 2 * 50
@@ -0,0 +1,96 @@
+"""SQLite 저장소 백엔드 테스트."""
+
+import sqlite3
+
+import pytest
+
+from app.services import journal
+from app.services.storage_backend import SHARED_SCOPE, SqliteBackend
+
+
+def _merge(current, other):
+    current.update(other)
+
+
+def article(aid, month="2026-10", category="정치"):
+    return {
+        "id": f"news_001_{aid:010d}",
+        "title": f"기사 {aid}",
+        "category": category,
+        "collected_at": f"{month}-17T09:00:00",
+    }
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = SqliteBackend(tmp_path / "news.db")
+    yield backend
+    backend.close()
+
+
+def test_overlay_write_keeps_other_stamps(backend):
+    backend.upsert_articles([article(1)], _merge)
+    backend.write_document("bob", "diary_entries.json", {"a": 1})
+    shared = backend.change_stamp(SHARED_SCOPE)
+    month = backend.change_stamp(SHARED_SCOPE, "2026-10")
+    bob = backend.change_stamp("bob")
+    diary = backend.read_document("bob", "diary_entries.json")
+
+    assert backend.apply_overlay_ops("alice", [journal.article_op(journal.FAVORITE, "x", True)])
+
+    assert backend.change_stamp("alice") != backend.change_stamp("bob")
+    assert backend.change_stamp("bob") == bob
+    assert backend.change_stamp(SHARED_SCOPE) == shared
+    assert backend.change_stamp(SHARED_SCOPE, "2026-10") == month
+    assert diary is not None
+    assert backend.read_document("bob", "diary_entries.json") is diary
+
+
+def test_article_write_bumps_only_its_month(backend):
+    backend.upsert_articles([article(1, "2026-09"), article(2, "2026-10")], _merge)
+    september = backend.change_stamp(SHARED_SCOPE, "2026-09")
+    october = backend.change_stamp(SHARED_SCOPE, "2026-10")
+    shared = backend.change_stamp(SHARED_SCOPE)
+    cached = backend.load_articles(["2026-09"])
+
+    backend.upsert_articles([article(3, "2026-10")], _merge)
+
+    assert backend.change_stamp(SHARED_SCOPE, "2026-09") == september
+    assert backend.change_stamp(SHARED_SCOPE, "2026-10") != october
+    assert backend.change_stamp(SHARED_SCOPE) != shared
+    assert backend.load_articles(["2026-09"]) is cached
+    assert len(backend.load_articles()) == 3
+
+    assert backend.remove_articles([article(1)["id"]]) == 1
+    assert backend.change_stamp(SHARED_SCOPE, "2026-09") != september
+    assert list(backend.load_articles(["2026-09"])) == []
+
+
+def test_document_write_bumps_only_that_document(backend):
+    assert backend.write_document("bob", "diary_entries.json", {"a": 1})
+    assert backend.write_document("bob", "calendar_issues.json", [{"id": "c"}])
+    calendar = backend.read_document("bob", "calendar_issues.json")
+    overlay = backend.change_stamp("bob")
+
+    assert backend.write_document("bob", "diary_entries.json", {"a": 2})
+
+    assert backend.read_document("bob", "diary_entries.json") == {"a": 2}
+    assert calendar is not None
+    assert backend.read_document("bob", "calendar_issues.json") is calendar
+    assert backend.change_stamp("bob") == overlay
+
+
+def test_article_writes_report_locked_database(backend, tmp_path):
+    backend.upsert_articles([article(1)], _merge)
+    backend._conn().execute("PRAGMA busy_timeout = 50")
+    other = sqlite3.connect(tmp_path / "news.db")
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        assert backend.upsert_articles([article(2)], _merge) == 0
+        assert backend.remove_articles([article(1)["id"]]) == 0
+    finally:
+        other.rollback()
+        other.close()
+
+    assert backend.upsert_articles([article(2)], _merge) == 1
+    assert backend.remove_articles([article(1)["id"]]) == 1
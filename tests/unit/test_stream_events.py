@@ -0,0 +1,117 @@
+"""브라우저 수집 이벤트 형식 테스트 (워커 프로세스 없이)."""
+
+import threading
+
+import pytest
+
+from scraper import naver_scraper
+from scraper.naver_scraper import ScraperError
+from scraper.single_flight import SingleFlight
+
+
+@pytest.fixture
+def no_browser(monkeypatch):
+    monkeypatch.setattr(naver_scraper, "ensure_browser_ready", lambda: None)
+    monkeypatch.setattr(naver_scraper, "RETRY_ATTEMPTS", 0)
+    monkeypatch.setattr(naver_scraper.RATE_LIMITER, "acquire", lambda n=1: None)
+
+
+def _fake_worker(events, error=None):
+    def stream(*args, **kwargs):
+        yield from events
+        if error is not None:
+            raise ScraperError(error)
+
+    return stream
+
+
+def test_worker_failure_error_carries_received_count(monkeypatch, no_browser):
+    article = {"id": "news_001_0000000001", "url": "u1"}
+    monkeypatch.setattr(
+        naver_scraper,
+        "_stream_worker",
+        _fake_worker(
+            [
+                {"type": "start", "category": "정치"},
+                {"type": "article", "category": "정치", "article": article},
+                {"type": "article", "category": "정치", "article": article},
+            ],
+            error="시간 초과",
+        ),
+    )
+
+    events = list(naver_scraper._stream_browser(["정치", "경제"], 2, 20, None))
+    errors = {e["category"]: e for e in events if e["type"] == "error"}
+
+    assert errors["정치"] == {
+        "type": "error",
+        "category": "정치",
+        "message": "시간 초과",
+        "count": 2,
+    }
+    assert errors["경제"]["count"] == 0
+
+
+def test_all_error_events_share_shape(monkeypatch, no_browser):
+    def unavailable():
+        raise ScraperError("브라우저 없음")
+
+    monkeypatch.setattr(naver_scraper, "ensure_browser_ready", unavailable)
+
+    events = list(naver_scraper._stream_browser(["정치"], 1, 20, None))
+
+    assert events == [
+        {"type": "error", "category": "정치", "message": "브라우저 없음", "count": 0}
+    ]
+
+
+def test_flight_keys_separate_fetch_mode_and_seen_urls():
+    base = naver_scraper._flight_keys(["정치"], None, 20, ["u1", "u2"])["정치"]
+
+    assert naver_scraper._flight_keys(["정치"], None, 20, ["u2", "u1"])["정치"] == base
+    assert naver_scraper._flight_keys(["정치"], None, 20, ["u1"])["정치"] != base
+    assert naver_scraper._flight_keys(["정치"], None, 40, ["u1", "u2"])["정치"] != base
+    assert naver_scraper._flight_keys(["정치"], {"정치": "browser"}, 20, ["u1", "u2"])["정치"] != base
+
+
+def test_follower_receives_articles_before_leader_error(monkeypatch, no_browser):
+    article = {"id": "news_001_0000000001", "url": "u1"}
+    group = SingleFlight(60.0)
+    monkeypatch.setattr(naver_scraper, "get_collection_flights", lambda: group)
+    naver_scraper.reset_circuit()
+
+    following = threading.Event()
+    claim = group.claim
+
+    def claim_and_signal(key):
+        flight, leader = claim(key)
+        if not leader:
+            following.set()
+        return flight, leader
+
+    monkeypatch.setattr(group, "claim", claim_and_signal)
+    follower_events = []
+
+    def follow():
+        follower_events.extend(naver_scraper.stream_categories(["정치"], max_items=20))
+
+    def leader_stream(*args, **kwargs):
+        yield {"type": "start", "category": "정치"}
+        yield {"type": "article", "category": "정치", "article": article}
+        thread.start()
+        assert following.wait(5)
+        yield naver_scraper._error_event("정치", "시간 초과", 1)
+
+    thread = threading.Thread(target=follow)
+    monkeypatch.setattr(naver_scraper, "_stream_allowed", leader_stream)
+    try:
+        list(naver_scraper.stream_categories(["정치"], max_items=20))
+        thread.join(5)
+    finally:
+        naver_scraper.reset_circuit()
+
+    assert follower_events == [
+        {"type": "start", "category": "정치"},
+        {"type": "article", "category": "정치", "article": article},
+        {"type": "error", "category": "정치", "message": "시간 초과", "count": 1},
+    ]